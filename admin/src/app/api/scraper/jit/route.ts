@@ -6,10 +6,10 @@ export async function GET() {
     try {
         const today = new Date().toLocaleDateString('en-CA', { timeZone: 'Asia/Jakarta' });
 
-        // 1. Fetch seat snapshots for today
-        // Note: In a real scenario, we might want to query by date
-        // For now, we fetch recent snapshots and filter
-        const snapshots = await firestoreAdminClient.getCollectionWithQuery('seat_snapshots', 'scraped_at', 500);
+        // 1. Fetch seat snapshots for today (seat_snapshots/{date}/observations)
+        const snapshots = await firestoreAdminClient.getCollectionWithQuery(
+            'observations', 'scraped_at', 500, `seat_snapshots/${today}`
+        );
 
         // 2. Group by hour (e.g., "12:00", "13:00")
         const grouped: Record<string, any[]> = {};
@@ -2,8 +2,15 @@
 import { NextResponse } from 'next/server';
 import { firestoreRestClient } from '@/lib/firestore-rest';
 
-// Known Firestore collections - excluded auth_tokens for security/timeout
-const COLLECTIONS = ['theatres', 'scraper_runs', 'snapshots', 'seat_snapshots'];
+// Known Firestore collections - excluded auth_tokens for security/timeout.
+// Seat snapshots are partitioned by date, so their observations collection
+// group is counted instead of the seat_snapshots/{date} parent documents.
+const COLLECTIONS: { name: string; collectionId: string; group?: boolean }[] = [
+    { name: 'theatres', collectionId: 'theatres' },
+    { name: 'scraper_runs', collectionId: 'scraper_runs' },
+    { name: 'snapshots', collectionId: 'snapshots' },
+    { name: 'seat_snapshots/{date}/observations', collectionId: 'observations', group: true },
+];
 
 interface CollectionStats {
     name: string;
@@ -16,12 +23,12 @@ export async function GET() {
     try {
         // Fetch collection stats in parallel
         const collectionStats: CollectionStats[] = await Promise.all(
-            COLLECTIONS.map(async (name) => {
+            COLLECTIONS.map(async ({ name, collectionId, group = false }) => {
                 try {
                     // Note: getCollectionCount can be slow for large collections
                     const [count, sample] = await Promise.all([
-                        firestoreRestClient.getCollectionCount(name),
-                        firestoreRestClient.getSampleDocument(name),
+                        firestoreRestClient.getCollectionCount(collectionId, group),
+                        firestoreRestClient.getSampleDocument(collectionId, group),
                     ]);
 
                     // Extract field names from sample
@@ -19,21 +19,22 @@ export default function DebugFirestorePage() {
     useEffect(() => {
         const fetchData = async () => {
             try {
-                // Known top-level collections
-                const collectionNames = [
-                    'theatres',
-                    'scraper_runs',
-                    'snapshots',
-                    'auth_tokens',
-                    'seat_snapshots',
+                // Known collections. Seat snapshots are partitioned by date, so the
+                // observations collection group is read instead of the {date} parents
+                const collectionSpecs: { name: string; collectionId: string; group?: boolean }[] = [
+                    { name: 'theatres', collectionId: 'theatres' },
+                    { name: 'scraper_runs', collectionId: 'scraper_runs' },
+                    { name: 'snapshots', collectionId: 'snapshots' },
+                    { name: 'auth_tokens', collectionId: 'auth_tokens' },
+                    { name: 'seat_snapshots/{date}/observations', collectionId: 'observations', group: true },
                 ];
 
                 const results: CollectionInfo[] = [];
 
-                for (const name of collectionNames) {
+                for (const { name, collectionId, group = false } of collectionSpecs) {
                     try {
-                        const count = await firestoreClient.getCollectionCount(name);
-                        const sample = await firestoreClient.getSampleDocument(name);
+                        const count = await firestoreClient.getCollectionCount(collectionId, group);
+                        const sample = await firestoreClient.getSampleDocument(collectionId, group);
 
                         // Extract timestamp from sample if available
                         let sampleTimestamp: string | undefined;
@@ -117,7 +117,8 @@ export class FirestoreAdminClient {
     async getCollectionWithQuery(
         collectionName: string,
         orderByField: string,
-        limitCount: number = 100
+        limitCount: number = 100,
+        parentPath?: string
     ): Promise<Record<string, unknown>[]> {
         try {
             const token = await getAccessToken();
@@ -130,7 +131,9 @@ export class FirestoreAdminClient {
                 },
             };
 
-            const response = await fetch(`${FIRESTORE_BASE_URL}:runQuery`, {
+            // Subcollections are queried under their parent document
+            const parent = parentPath ? `${FIRESTORE_BASE_URL}/${parentPath}` : FIRESTORE_BASE_URL;
+            const response = await fetch(`${parent}:runQuery`, {
                 method: 'POST',
                 headers: {
                     'Authorization': `Bearer ${token}`,
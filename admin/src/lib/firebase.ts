@@ -7,6 +7,7 @@ import { initializeApp, getApps, FirebaseApp } from 'firebase/app';
 import {
     getFirestore,
     collection,
+    collectionGroup,
     getDocs,
     query,
     orderBy,
@@ -59,10 +60,16 @@ export class FirestoreClient {
         }
     }
 
-    async getCollectionWithQuery(collectionName: string, orderByField?: string, limitCount?: number): Promise<DocumentData[]> {
+    async getCollectionWithQuery(
+        collectionName: string,
+        orderByField?: string,
+        limitCount?: number,
+        group: boolean = false
+    ): Promise<DocumentData[]> {
         try {
             const db = getDb();
-            const collRef = collection(db, collectionName);
+            // A collection group spans every collection with this id (e.g. seat_snapshots/{date}/observations)
+            const collRef = group ? collectionGroup(db, collectionName) : collection(db, collectionName);
 
             // Build query with optional orderBy and limit
             let q;
@@ -87,10 +94,10 @@ export class FirestoreClient {
         }
     }
 
-    async getCollectionCount(collectionName: string): Promise<number> {
+    async getCollectionCount(collectionName: string, group: boolean = false): Promise<number> {
         try {
             const db = getDb();
-            const collRef = collection(db, collectionName);
+            const collRef = group ? collectionGroup(db, collectionName) : collection(db, collectionName);
             const snapshot = await getCountFromServer(collRef);
             return snapshot.data().count;
         } catch (error) {
@@ -99,8 +106,8 @@ export class FirestoreClient {
         }
     }
 
-    async getSampleDocument(collectionName: string): Promise<DocumentData | null> {
-        const docs = await this.getCollectionWithQuery(collectionName, undefined, 1);
+    async getSampleDocument(collectionName: string, group: boolean = false): Promise<DocumentData | null> {
+        const docs = await this.getCollectionWithQuery(collectionName, undefined, 1, group);
         return docs.length > 0 ? docs[0] : null;
     }
 }
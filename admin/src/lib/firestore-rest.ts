@@ -160,20 +160,25 @@ export class FirestoreRestClient {
     }
 
     /**
-     * Query collection with ordering and limit using Firestore REST runQuery
+     * Query collection with ordering and limit using Firestore REST runQuery.
+     * With collectionGroup, every collection with this id is queried
+     * (e.g. 'observations' under each seat_snapshots/{date}).
      */
     async getCollectionWithQuery(
         collectionName: string,
-        orderByField: string,
-        limitCount: number = 100
+        orderByField: string | null,
+        limitCount: number = 100,
+        collectionGroup: boolean = false
     ): Promise<Record<string, unknown>[]> {
         try {
             const token = await getAccessToken();
 
             const query = {
                 structuredQuery: {
-                    from: [{ collectionId: collectionName }],
-                    orderBy: [{ field: { fieldPath: orderByField }, direction: 'DESCENDING' }],
+                    from: [{ collectionId: collectionName, allDescendants: collectionGroup }],
+                    ...(orderByField
+                        ? { orderBy: [{ field: { fieldPath: orderByField }, direction: 'DESCENDING' }] }
+                        : {}),
                     limit: limitCount,
                 },
             };
@@ -205,16 +210,16 @@ export class FirestoreRestClient {
     }
 
     /**
-     * Get collection document count using aggregation query
+     * Get collection (or collection group) document count using aggregation query
      */
-    async getCollectionCount(collectionName: string): Promise<number> {
+    async getCollectionCount(collectionName: string, collectionGroup: boolean = false): Promise<number> {
         try {
             const token = await getAccessToken();
 
             const query = {
                 structuredAggregationQuery: {
                     structuredQuery: {
-                        from: [{ collectionId: collectionName }],
+                        from: [{ collectionId: collectionName, allDescendants: collectionGroup }],
                     },
                     aggregations: [{ alias: 'count', count: {} }],
                 },
@@ -246,8 +251,13 @@ export class FirestoreRestClient {
     /**
      * Get a single sample document from a collection
      */
-    async getSampleDocument(collectionName: string): Promise<Record<string, unknown> | null> {
-        const docs = await this.getCollectionWithQuery(collectionName, '__name__', 1);
+    async getSampleDocument(
+        collectionName: string,
+        collectionGroup: boolean = false
+    ): Promise<Record<string, unknown> | null> {
+        // Descending order needs a collection group index, so groups take any document
+        const orderBy = collectionGroup ? null : '__name__';
+        const docs = await this.getCollectionWithQuery(collectionName, orderBy, 1, collectionGroup);
         return docs.length > 0 ? docs[0] : null;
     }
 }
@@ -7,12 +7,18 @@ Following the Ports & Adapters (Hexagonal) architecture pattern.
 
 from backend.application.ports.scraper import IMovieScraper, ISeatScraper
 from backend.application.ports.services import IGeocodingService
-from backend.application.ports.storage import IMovieRepository, ITheatreRepository, ITokenRepository
+from backend.application.ports.storage import (
+    IMovieRepository,
+    ISeatRepository,
+    ITheatreRepository,
+    ITokenRepository,
+)
 
 __all__ = [
     "IGeocodingService",
     "IMovieRepository",
     "IMovieScraper",
+    "ISeatRepository",
     "ISeatScraper",
     "ITheatreRepository",
     "ITokenRepository",
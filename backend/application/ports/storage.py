@@ -6,8 +6,20 @@ Follows the Repository pattern - abstracts storage details from business logic.
 """
 
 from abc import ABC, abstractmethod
-
-from backend.domain.models import ScrapeResult, Theatre, Token
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+
+from backend.domain.models import (
+    Movie,
+    ScrapeResult,
+    SeatOccupancy,
+    ShowtimeIndex,
+    Theatre,
+    Token,
+    movie_fields,
+)
 
 
 class IMovieRepository(ABC):
@@ -56,6 +68,166 @@ class IMovieRepository(ABC):
         """
         pass
 
+    def get_showtime_index(self, date: str | None = None) -> ShowtimeIndex | None:
+        """Get the flat showtime index for a date (latest if None).
+
+        The default implementation builds the index from the full snapshot.
+        Repositories that persist a precomputed index should override this.
+
+        Args:
+            date: Date string in YYYY-MM-DD format
+
+        Returns:
+            ShowtimeIndex or None if no snapshot exists
+        """
+        snapshot = self.get_snapshot_by_date(date) if date else self.get_latest_snapshot()
+        if not snapshot:
+            return None
+        return ShowtimeIndex.from_movies(snapshot.movies, snapshot.date)
+
+    def get_movie(self, movie_id: str, date: str | None = None) -> Movie | None:
+        """Get one movie with all its schedules (latest snapshot if date is None).
+
+        The default implementation loads the full snapshot.
+        Repositories with random access should override this.
+
+        Args:
+            movie_id: TIX.id movie identifier
+            date: Date string in YYYY-MM-DD format
+
+        Returns:
+            Movie or None if not found
+        """
+        snapshot = self.get_snapshot_by_date(date) if date else self.get_latest_snapshot()
+        if not snapshot:
+            return None
+        return next((m for m in snapshot.movies if str(m.id) == str(movie_id)), None)
+
+    def get_movies_in_city(self, city: str, date: str | None = None) -> list[Movie]:
+        """Get movies showing in a city, with only that city's schedules.
+
+        The default implementation loads the full snapshot.
+        Repositories with random access should override this.
+
+        Args:
+            city: City name (case-insensitive)
+            date: Date string in YYYY-MM-DD format
+
+        Returns:
+            Movies in display order (empty if none)
+        """
+        snapshot = self.get_snapshot_by_date(date) if date else self.get_latest_snapshot()
+        if not snapshot:
+            return []
+        city = city.upper()
+        return [
+            replace(m, schedules={city: m.get_schedules_for_city(city)})
+            for m in snapshot.movies
+            if m.is_showing_in(city)
+        ]
+
+    @abstractmethod
+    def list_snapshots(self) -> list[str]:
+        """List all stored snapshot dates.
+
+        Returns:
+            Date strings, newest first
+        """
+        pass
+
+    def get_snapshot_projection(
+        self,
+        date: str,
+        fields: Iterable[str] | None = None,
+        cities: Iterable[str] | None = None,
+    ) -> ScrapeResult | None:
+        """Get part of a snapshot: some movie fields, some cities.
+
+        The default implementation loads the full snapshot and projects it.
+        Repositories that can skip schedules or other cities' data when
+        reading should override this.
+
+        Args:
+            date: Date string in YYYY-MM-DD format
+            fields: Movie fields to keep ("id" always is; all if None)
+            cities: Only movies showing in these cities, with only their
+                schedules (all cities if None)
+
+        Returns:
+            ScrapeResult or None if not found
+        """
+        snapshot = self.get_snapshot_by_date(date)
+        return snapshot.select(fields, cities) if snapshot else None
+
+    def iter_snapshots(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        fields: Iterable[str] | None = None,
+        cities: Iterable[str] | None = None,
+        prefetch: int = 0,
+    ) -> Iterator[ScrapeResult]:
+        """Stream the snapshots of a date range, oldest first.
+
+        Each day is loaded with get_snapshot_projection() when the caller
+        gets to it, so only one day (plus those prefetched) is in memory.
+
+        Example:
+            for snapshot in repo.iter_snapshots("2025-12-01", "2025-12-31",
+                                                fields=["title", "cities"], prefetch=2):
+                ...
+
+        Args:
+            start: First date, inclusive (earliest stored if None)
+            end: Last date, inclusive (latest stored if None)
+            fields: Movie fields to keep ("id" always is; all if None)
+            cities: Only movies showing in these cities, with only their
+                schedules (all cities if None)
+            prefetch: Upcoming days to load in background threads while
+                the current one is processed (0 loads each day on demand)
+
+        Yields:
+            ScrapeResult per stored date (missing or unreadable days are skipped)
+
+        Raises:
+            ValueError: If a field is not a Movie field
+        """
+        fields = movie_fields(fields)
+        cities = None if cities is None else [city.upper() for city in cities]
+        dates = sorted(
+            date
+            for date in self.list_snapshots()
+            if (start is None or date >= start) and (end is None or date <= end)
+        )
+
+        def load(date: str) -> ScrapeResult | None:
+            return self.get_snapshot_projection(date, fields, cities)
+
+        if prefetch <= 0:
+            for date in dates:
+                snapshot = load(date)
+                if snapshot:
+                    yield snapshot
+            return
+
+        with ThreadPoolExecutor(max_workers=prefetch) as pool:
+            pending: deque[Future[ScrapeResult | None]] = deque()
+            try:
+                for date in dates:
+                    pending.append(pool.submit(load, date))
+                    if len(pending) > prefetch:
+                        snapshot = pending.popleft().result()
+                        if snapshot:
+                            yield snapshot
+                while pending:
+                    snapshot = pending.popleft().result()
+                    if snapshot:
+                        yield snapshot
+            finally:
+                # Caller stopped early: don't load days nobody will read
+                for future in pending:
+                    future.cancel()
+
 
 class ITheatreRepository(ABC):
     """Interface for theatre data persistence.
@@ -81,6 +253,21 @@ class ITheatreRepository(ABC):
         """
         pass
 
+    def upsert_many(self, theatres: list[Theatre]) -> dict[str, int]:
+        """Insert or update many theatres (same merge rules as upsert).
+
+        The default implementation calls upsert() for each theatre.
+        Repositories that can batch reads and writes should override this.
+
+        Args:
+            theatres: Theatre domain objects
+
+        Returns:
+            Counts: {"total": ..., "success": ..., "failed": ...}
+        """
+        success = sum(self.upsert(theatre) for theatre in theatres)
+        return {"total": len(theatres), "success": success, "failed": len(theatres) - success}
+
     @abstractmethod
     def get_by_id(self, theatre_id: str) -> Theatre | None:
         """Get theatre by ID.
@@ -141,6 +328,52 @@ class ITheatreRepository(ABC):
         pass
 
 
+class ISeatRepository(ABC):
+    """Interface for seat snapshot (occupancy observation) storage.
+
+    Observations are partitioned by showtime date, so every query reads
+    at most the observations it returns.
+    """
+
+    @abstractmethod
+    def get_by_date(self, date: str) -> list[SeatOccupancy]:
+        """Get all observations for a date.
+
+        Args:
+            date: Showtime date in YYYY-MM-DD format
+
+        Returns:
+            Observations (empty if none)
+        """
+        pass
+
+    @abstractmethod
+    def get_by_movie(self, movie_id: str, date: str | None = None) -> list[SeatOccupancy]:
+        """Get observations of a movie's showtimes.
+
+        Args:
+            movie_id: TIX.id movie identifier
+            date: Only this showtime date (all dates if None)
+
+        Returns:
+            Observations (empty if none)
+        """
+        pass
+
+    @abstractmethod
+    def get_by_showtime(self, showtime_id: str, date: str | None = None) -> list[SeatOccupancy]:
+        """Get every observation of one showtime, oldest first.
+
+        Args:
+            showtime_id: TIX.id showtime identifier
+            date: Showtime date, if known (narrows the read to one partition)
+
+        Returns:
+            Observations ordered by scraped_at (empty if none)
+        """
+        pass
+
+
 class ITokenRepository(ABC):
     """Interface for token persistence.
 
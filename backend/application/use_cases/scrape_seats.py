@@ -136,23 +136,9 @@ class ScrapSeatsUseCase:
 
     async def _get_showtime_ids_from_movies(self, city: str | None, limit: int | None) -> list[str]:
         """Extract showtime IDs from today's movie data."""
-        snapshot = self.movie_repo.get_latest_snapshot()
-        if not snapshot:
+        index = self.movie_repo.get_showtime_index()
+        if not index:
             return []
 
-        ids = []
-        for movie in snapshot.movies:
-            for city_name, schedules in movie.schedules.items():
-                if city and city_name.upper() != city.upper():
-                    continue
-
-                for schedule in schedules:
-                    for room in schedule.rooms:
-                        for showtime in room.showtimes:
-                            if showtime.showtime_id and showtime.is_available:
-                                ids.append(showtime.showtime_id)
-
-                                if limit and len(ids) >= limit:
-                                    return ids
-
-        return ids
+        ids = [e.showtime_id for e in index.filter(city=city, available_only=True)]
+        return ids[:limit] if limit else ids
@@ -8,7 +8,7 @@ import json
 from dataclasses import dataclass
 from pathlib import Path
 
-from backend.domain.models import Movie, ScrapeResult
+from backend.domain.models import ScrapeResult
 
 
 @dataclass
@@ -110,11 +110,16 @@ class ValidateDataUseCase:
             warnings=warnings,
         )
 
-    def validate_file(self, file_path: str) -> ValidationResult:
+    def validate_file(self, file_path: str, sample: int | None = None) -> ValidationResult:
         """Validate a movie data JSON file.
 
+        Schema checks and integrity stats come from a single pass over the
+        file's bytes (see backend.schemas.validator). Compressed artifacts
+        (.json.gz, .json.zst) are decompressed first.
+
         Args:
             file_path: Path to JSON file
+            sample: Schema-check only this many movies (all if None)
 
         Returns:
             ValidationResult with errors/warnings
@@ -130,77 +135,66 @@ class ValidateDataUseCase:
                 warnings=[],
             )
 
+        from backend.infrastructure.storage import read_bytes
+
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            from backend.schemas.validator import validate_snapshot
+        except ImportError:
+            return self._validate_file_basic(read_bytes(path))
+
+        report = validate_snapshot(read_bytes(path), sample=sample)
+        if not report.valid:
             return ValidationResult(
                 valid=False,
-                movies=0,
-                cities=0,
-                errors=[f"Invalid JSON: {e}"],
+                movies=report.movies,
+                cities=report.cities,
+                errors=[f"Schema error at {error}" for error in report.errors],
                 warnings=[],
             )
 
-        # Try Pydantic validation first
-        errors = []
+        errors = report.integrity_errors(self.min_movies, self.min_cities)
         warnings = []
+        without_schedules = report.movies - report.movies_with_schedules
+        if without_schedules > report.movies * 0.5:
+            warnings.append(f"{without_schedules}/{report.movies} movies have no schedules")
 
-        try:
-            from pydantic import ValidationError as PydanticValidationError
-
-            from backend.schemas.movie import DailySnapshotSchema
-
-            DailySnapshotSchema.model_validate(data)
-
-            # Convert Pydantic model back to our domain object
-            movies = [Movie.from_dict(m) for m in data.get("movies", [])]
-
-            result = ScrapeResult(
-                movies=movies,
-                scraped_at=data.get("scraped_at", ""),
-                date=data.get("date", ""),
-                cities_scraped=len(data.get("city_stats", {})),
-            )
-
-            return self.validate_result(result)
-
-        except PydanticValidationError as e:
-            for err in e.errors():
-                loc = " → ".join(str(x) for x in err["loc"])
-                errors.append(f"Schema error at {loc}: {err['msg']}")
-
-            # Still count what we can
-            movies = data.get("movies", [])
-            cities = set()
-            for m in movies:
-                cities.update(m.get("cities", []))
+        return ValidationResult(
+            valid=len(errors) == 0,
+            movies=report.movies,
+            cities=report.cities,
+            errors=errors,
+            warnings=warnings,
+        )
 
+    def _validate_file_basic(self, raw: bytes) -> ValidationResult:
+        """Threshold-only validation for when Pydantic is not installed."""
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError as e:
             return ValidationResult(
                 valid=False,
-                movies=len(movies),
-                cities=len(cities),
-                errors=errors[:10],  # Limit errors shown
-                warnings=[f"... and {len(errors) - 10} more errors"] if len(errors) > 10 else [],
+                movies=0,
+                cities=0,
+                errors=[f"Invalid JSON: {e}"],
+                warnings=[],
             )
 
-        except ImportError:
-            # Pydantic not available, do basic validation
-            warnings.append("Pydantic not available, using basic validation")
+        errors = []
+        warnings = ["Pydantic not available, using basic validation"]
 
-            movies = data.get("movies", [])
-            cities = data.get("city_stats", {})
+        movies = data.get("movies", [])
+        cities = data.get("city_stats", {})
 
-            if len(movies) < self.min_movies:
-                errors.append(f"Too few movies: {len(movies)} < {self.min_movies}")
+        if len(movies) < self.min_movies:
+            errors.append(f"Too few movies: {len(movies)} < {self.min_movies}")
 
-            if len(cities) < self.min_cities:
-                errors.append(f"Too few cities: {len(cities)} < {self.min_cities}")
+        if len(cities) < self.min_cities:
+            errors.append(f"Too few cities: {len(cities)} < {self.min_cities}")
 
-            return ValidationResult(
-                valid=len(errors) == 0,
-                movies=len(movies),
-                cities=len(cities),
-                errors=errors,
-                warnings=warnings,
-            )
+        return ValidationResult(
+            valid=len(errors) == 0,
+            movies=len(movies),
+            cities=len(cities),
+            errors=errors,
+            warnings=warnings,
+        )
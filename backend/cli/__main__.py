@@ -9,13 +9,13 @@ For new usage, prefer: python -m backend.cli.cli [movies|seats] [options]
 import argparse
 import sys
 
+from backend.cli.cli import DELEGATED_COMMANDS, run_movie_scrape
 from backend.cli.cli import main as cli_main
-from backend.cli.cli import run_movie_scrape
 
 # If called directly as package, default to movie scraping for backward compatibility
 if __name__ == "__main__":
     # Check if using new subcommand style or old style
-    if len(sys.argv) > 1 and sys.argv[1] in ["movies", "seats"]:
+    if len(sys.argv) > 1 and sys.argv[1] in ["movies", "seats", *DELEGATED_COMMANDS]:
         # New style: redirect to CLI
         cli_main()
     else:
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Seat occupancy analytics over local data.
+
+`build` turns local seat files and final snaps into cube shards
+(data/cube/*.npz, only for sources that changed); `query` groups the cube
+by any dimensions and prints counts, sums and occupancy per group.
+
+Dimensions: date, weekday, hour, movie, genre, city, merchant, theatre,
+room, snapshot_type.
+
+Usage:
+    python -m backend.cli.analytics build
+    python -m backend.cli.analytics query --by genre weekday --from 2026-08-01
+    python -m backend.cli.analytics query --by city --where snapshot_type=final --limit 10
+    python -m backend.cli.analytics query --by hour --sort occupancy_pct --json
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import defaultdict
+
+
+def _parse_filters(items: list[str]) -> dict[str, list[str]]:
+    """--where dim=a,b (repeatable) -> {dim: [a, b]}"""
+    filters: dict[str, list[str]] = defaultdict(list)
+    for item in items:
+        dim, sep, values = item.partition("=")
+        if not sep:
+            raise SystemExit(f"❌ --where expects dim=value, got '{item}'")
+        filters[dim.strip()].extend(v.strip() for v in values.split(","))
+    return dict(filters)
+
+
+def _print_table(rows: list[dict], dims: list[str]) -> None:
+    columns = [*dims, "count", "sold", "seats", "occupancy_pct"]
+    widths = {c: max(len(c), *(len(str(r[c])) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    print("  ".join("-" * widths[c] for c in columns))
+    for row in rows:
+        print(
+            "  ".join(
+                str(row[c]).ljust(widths[c]) if c in dims else str(row[c]).rjust(widths[c])
+                for c in columns
+            )
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seat occupancy analytics")
+    parser.add_argument("--data-dir", "-d", default="data", help="Data directory")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Build cube shards from local seat data")
+    build.add_argument("--rebuild", action="store_true", help="Rebuild every shard")
+
+    query = sub.add_parser("query", help="Group the cube by dimensions")
+    query.add_argument("--by", nargs="*", default=[], help="Dimensions to group by")
+    query.add_argument(
+        "--where", action="append", default=[], help="Filter, e.g. city=JAKARTA,BANDUNG"
+    )
+    query.add_argument("--from", dest="start", help="First showtime date (YYYY-MM-DD)")
+    query.add_argument("--to", dest="end", help="Last showtime date (YYYY-MM-DD)")
+    query.add_argument(
+        "--sort", default="sold", help="sold, seats, available, count or occupancy_pct"
+    )
+    query.add_argument("--limit", type=int, help="Show the top N groups")
+    query.add_argument("--json", action="store_true", help="Print JSON rows")
+    args = parser.parse_args()
+
+    try:
+        from backend.infrastructure.analytics import build_shards, load_cube
+    except ImportError:
+        print("❌ Analytics needs numpy (pip install -e '.[analytics]')")
+        sys.exit(1)
+
+    if args.command == "build":
+        started = time.perf_counter()
+        written = build_shards(args.data_dir, rebuild=args.rebuild)
+        for name, rows in written.items():
+            print(f"   + {name}: {rows:,} rows")
+        print(
+            f"✅ {len(written)} shards built in {time.perf_counter() - started:.1f}s"
+            if written
+            else "✅ Cube is up to date"
+        )
+        return
+
+    started = time.perf_counter()
+    cube = load_cube(args.data_dir, args.start, args.end)
+    try:
+        filters = _parse_filters(args.where)
+        if filters:
+            cube = cube.where(**filters)
+        rows = cube.group_by(args.by).rows(sort=args.sort, limit=args.limit)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+        return
+    if not rows:
+        print("⚠️ No observations match (run `analytics build` first?)")
+        return
+    _print_table(rows, args.by)
+    print(f"\n📊 {len(cube):,} observations, {len(rows)} groups in {elapsed * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
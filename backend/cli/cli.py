@@ -5,17 +5,41 @@ CineRadar CLI - Unified Scraper Command Line Interface
 Usage:
     python -m backend.cli movies [options]    # Scrape movie availability
     python -m backend.cli seats [options]     # Scrape seat occupancy
+    python -m backend.cli merge [options]     # Any command in DELEGATED_COMMANDS
+
+Heavy dependencies (Playwright, aiohttp, google-cloud-firestore, pydantic)
+are imported by the command that needs them, never at module load, so
+`--help` and file-only commands start fast.
 """
 
 import argparse
 import asyncio
-import json
+import runpy
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from backend.config import CITIES
-from backend.infrastructure.core.seat_scraper import SeatScraper
-from backend.infrastructure.core.tix_client import CineRadarScraper
+from backend.domain.models import ShowtimeIndex
+from backend.infrastructure.repositories.file_movie import FileMovieRepository
+from backend.infrastructure.storage import artifact_path, dump_json, find_artifact, load_json
+
+# Subcommands implemented by standalone entry-point modules.
+# The module is only imported (and run as __main__) when its command is used.
+DELEGATED_COMMANDS = {
+    "merge": ("backend.cli.merge_batches", "Merge batch files into daily snapshot"),
+    "validate": ("backend.cli.validate", "Validate scraped data"),
+    "populate": ("backend.cli.populate_firestore", "Populate Firestore with scraped data"),
+    "upload-schedules": ("backend.cli.upload_schedules", "Upload schedules to Firestore"),
+    "upload-seats": ("backend.cli.upload_seats", "Upload seat snapshots to Firestore"),
+    "daily-summary": ("backend.cli.daily_summary", "Send the daily audience summary"),
+    "refresh-token": ("backend.cli.refresh_token", "Refresh the TIX.id auth token"),
+    "geocode": ("backend.cli.monthly_geocode", "Geocode theatres"),
+    "jit": ("backend.cli.jit_granular_scraper", "Monitor upcoming showtimes"),
+    "final-snap": ("backend.cli.final_snap_worker", "Capture final seat snaps"),
+    "sqlite-import": ("backend.cli.sqlite_import", "Import local data into SQLite"),
+    "analytics": ("backend.cli.analytics", "Occupancy group-by queries over local data"),
+}
 
 # ============================================================================
 # MOVIE SCRAPER COMMANDS
@@ -35,6 +59,8 @@ def run_movie_scrape(
     """Run the movie availability scraper with retry logic."""
 
     async def _run():
+        from backend.infrastructure.core.tix_client import CineRadarScraper
+
         scraper = CineRadarScraper()
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
@@ -89,30 +115,56 @@ def run_movie_scrape(
 
         # Save results
         if batch is not None:
-            output_file = output_path / f"batch_{batch}_{date_str}.json"
+            output_file = artifact_path(output_path, f"batch_{batch}_{date_str}")
         else:
-            output_file = output_path / f"movies_{date_str}.json"
+            output_file = artifact_path(output_path, f"movies_{date_str}")
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "scraped_at": timestamp,
-                    "date": date_str,
-                    "batch": batch,
-                    "movies": result["movies"],
-                    "city_stats": result["city_stats"],
-                },
-                f,
-                indent=2,
-                ensure_ascii=False,
-            )
+        output = {"scraped_at": timestamp, "date": date_str, "batch": batch}
+        movies = result["movies"]
+        if batch is not None:
+            # Sorted by id so merge_batches can stream a k-way merge
+            output["movie_order"] = "id"
+            movies = sorted(movies, key=lambda m: str(m["id"]))
+        output["movies"] = movies
+        output["city_stats"] = result["city_stats"]
+
+        dump_json(output, output_file)
 
         print(f"💾 Saved to: {output_file}")
+        if batch is not None and not validate_batch_output(output_file):
+            return None
         return result
 
     return asyncio.run(_run())
 
 
+def validate_batch_output(output_file: Path) -> bool:
+    """Validate a freshly written batch and store a digest next to it.
+
+    merge_batches trusts the digest while the batch file is unchanged, so
+    each batch is only schema-checked once, in its own job.
+    """
+    from backend.infrastructure.storage import read_bytes, write_digest
+
+    try:
+        from backend.schemas.validator import validate_snapshot, validator_fingerprint
+    except ImportError:
+        print("⚠️ Pydantic not available, batch not validated")
+        return True
+
+    report = validate_snapshot(read_bytes(output_file))
+    digest_file = write_digest(output_file, report.to_dict(), validator_fingerprint())
+
+    if not report.valid:
+        print("❌ Batch validation FAILED:")
+        for error in report.errors:
+            print(f"   {error}")
+        return False
+
+    print(f"✅ Batch validated: {report.movies} movies ({digest_file.name})")
+    return True
+
+
 # ============================================================================
 # SEAT SCRAPER COMMANDS
 # ============================================================================
@@ -123,21 +175,49 @@ def load_movie_data(data_dir: str = "data") -> dict | None:
     date_str = datetime.now().strftime("%Y-%m-%d")
     data_path = Path(data_dir)
 
-    # Try today's merged file first, then batch files
-    candidates = [
-        data_path / f"movies_{date_str}.json",
-        data_path / f"batch_0_{date_str}.json",
-    ]
-
-    for path in candidates:
-        if path.exists():
-            with open(path) as f:
-                return json.load(f)
+    # Try today's merged file first, then batch files (any artifact codec)
+    for name in (f"movies_{date_str}", f"batch_0_{date_str}"):
+        path = find_artifact(data_path, name)
+        if path is not None:
+            return load_json(path)
 
     print(f"⚠️ No movie data found for {date_str}")
     return None
 
 
+def load_showtime_index(data_dir: str = "data") -> ShowtimeIndex | None:
+    """Load today's flat showtime index.
+
+    Uses the showtimes_{date}.json index written by merge_batches when
+    present, otherwise builds one from today's movie data.
+    """
+    date_str = datetime.now().strftime("%Y-%m-%d")
+
+    index = FileMovieRepository(data_dir).get_showtime_index(date_str)
+    if index is not None:
+        return index
+
+    movie_data = load_movie_data(data_dir)
+    if not movie_data:
+        return None
+    return ShowtimeIndex.from_snapshot(movie_data)
+
+
+def select_showtimes(
+    index: ShowtimeIndex,
+    city_filter: str | None = None,
+    limit: int | None = None,
+) -> list[dict]:
+    """Select bookable showtimes from the index as seat-scrape task dicts."""
+    date_str = index.date or datetime.now().strftime("%Y-%m-%d")
+    entries = index.filter(city=city_filter, available_only=True)
+
+    if limit:
+        entries = entries[:limit]
+
+    return [entry.to_dict(date_str) for entry in entries]
+
+
 def extract_showtimes_from_data(
     movie_data: dict,
     city_filter: str | None = None,
@@ -145,73 +225,24 @@ def extract_showtimes_from_data(
     jit_window_minutes: int = 20,
 ) -> list[dict]:
     """Extract showtime info from movie data for seat scraping."""
-    showtimes = []
-
-    for movie in movie_data.get("movies", []):
-        movie_id = movie.get("movie_id")
-        movie_title = movie.get("title", "")
-
-        schedules = movie.get("schedules", {})
-
-        for city_name, theatres in schedules.items():
-            if city_filter and city_name.upper() != city_filter.upper():
-                continue
-
-            for theatre in theatres:
-                theatre_id = theatre.get("theatre_id")
-                theatre_name = theatre.get("theatre_name", "")
-                merchant = theatre.get("merchant", "")
-
-                for room in theatre.get("rooms", []):
-                    room_name = room.get("category", room.get("room_name", ""))
-
-                    # Use all_showtimes which contains showtime_id
-                    for showtime_obj in room.get("all_showtimes", room.get("showtimes", [])):
-                        if isinstance(showtime_obj, dict):
-                            st_id = showtime_obj.get("showtime_id")
-                            st_time = showtime_obj.get("time", "")
-                            is_available = showtime_obj.get("is_available", True)
-                        else:
-                            st_id = None
-                            st_time = showtime_obj
-                            is_available = True
-
-                        if st_id and is_available:
-                            showtimes.append(
-                                {
-                                    "showtime_id": st_id,
-                                    "showtime": st_time,
-                                    "movie_id": movie_id,
-                                    "movie_title": movie_title,
-                                    "theatre_id": theatre_id,
-                                    "theatre_name": theatre_name,
-                                    "merchant": merchant,
-                                    "room_name": room_name,
-                                    "city": city_name,
-                                    "date": movie_data.get(
-                                        "date", datetime.now().strftime("%Y-%m-%d")
-                                    ),
-                                }
-                            )
-
-    if limit:
-        showtimes = showtimes[:limit]
-
-    return showtimes
+    return select_showtimes(ShowtimeIndex.from_snapshot(movie_data), city_filter, limit)
 
 
-def filter_jit_showtimes(showtimes: list[dict], window_minutes: int = 20) -> list[dict]:
+def filter_jit_showtimes(
+    showtimes: list[dict], window_minutes: int = 20, now: datetime | None = None
+) -> list[dict]:
     """
     Filter showtimes to only those starting within the next N minutes.
 
     Args:
         showtimes: List of showtime dicts with 'showtime' (HH:MM format)
         window_minutes: Time window in minutes
+        now: Start of the window (current time if None)
 
     Returns:
         Filtered list of showtimes
     """
-    now = datetime.now()
+    now = now or datetime.now()
     window_start = now
     window_end = now + timedelta(minutes=window_minutes)
 
@@ -245,40 +276,67 @@ def run_seat_scrape(
     output_dir: str = "data",
     jit_window: int = 20,
     use_stored_token: bool = False,
+    now: datetime | None = None,
 ):
-    """Run seat scraping based on mode."""
+    """Run seat scraping based on mode.
+
+    With `batch`, every job of the run must plan from the same inputs:
+    the showtime index, seat history from before today, and (in JIT mode)
+    the window start. Batched JIT runs therefore require `now`, passed
+    with the same value to every job.
+    """
+    if mode == "jit" and batch is not None and now is None:
+        print("❌ Batched JIT runs need --now (the same window start for every batch)")
+        return None
 
     async def _run():
-        # Load movie data
-        movie_data = load_movie_data(output_dir)
-        if not movie_data:
+        # Load the flat showtime index (precomputed at merge time)
+        index = load_showtime_index(output_dir)
+        if not index:
+            print("⚠️ No movie data found for today")
             return None
 
         # Extract showtimes
-        showtimes = extract_showtimes_from_data(movie_data, city_filter=city, limit=limit)
+        showtimes = select_showtimes(index, city_filter=city, limit=limit)
 
         if not showtimes:
             print("⚠️ No showtimes with IDs found")
             return None
 
-        # Apply batching if specified
-        if batch is not None:
-            per_batch = len(showtimes) // total_batches + 1
-            start = batch * per_batch
-            end = min(start + per_batch, len(showtimes))
-            showtimes = showtimes[start:end]
-            print(f"🔢 Batch {batch}: {len(showtimes)} showtimes")
-
-        # JIT mode: filter to upcoming showtimes only
+        # JIT mode: filter to upcoming showtimes before batching,
+        # so every batch gets a share of the showtimes actually scraped
         if mode == "jit":
-            showtimes = filter_jit_showtimes(showtimes, jit_window)
+            showtimes = filter_jit_showtimes(showtimes, jit_window, now)
             if not showtimes:
                 print(f"📋 No showtimes in next {jit_window} minutes")
                 return None
 
+        # Apply cost-balanced batching if specified
+        if batch is not None:
+            from backend.infrastructure.batch_planner import BatchPlanner
+
+            if not 0 <= batch < total_batches:
+                print(f"❌ Batch {batch} out of range (total batches: {total_batches})")
+                return None
+
+            # Only past days' seat files: today's are being written by other batches
+            date_str = index.date or datetime.now().strftime("%Y-%m-%d")
+            planner = BatchPlanner.from_history(output_dir, before=date_str)
+            batches = planner.plan(showtimes, total_batches)
+            costs = planner.batch_costs(batches)
+            showtimes = batches[batch]
+            print(
+                f"🔢 Batch {batch}: {len(showtimes)} showtimes, ~{costs[batch] / 60000:.1f}m expected "
+                f"(slowest batch ~{max(costs) / 60000:.1f}m)"
+            )
+            if not showtimes:
+                return None
+
         print(f"📋 Found {len(showtimes)} showtimes to scrape")
 
         # Run scraper
+        from backend.infrastructure.core.seat_scraper import SeatScraper
+
         scraper = SeatScraper()
 
         # Use stored token (from Firestore) or login fresh
@@ -298,23 +356,21 @@ def run_seat_scrape(
             output_path = Path(output_dir)
 
             if batch is not None:
-                filename = f"seats_batch_{batch}_{date_str}.json"
+                name = f"seats_batch_{batch}_{date_str}"
             else:
-                filename = f"seats_{mode}_{date_str}.json"
-
-            with open(output_path / filename, "w") as f:
-                json.dump(
-                    {
-                        "scraped_at": datetime.now().isoformat(),
-                        "mode": mode,
-                        "count": len(results),
-                        "results": results,
-                    },
-                    f,
-                    indent=2,
-                )
+                name = f"seats_{mode}_{date_str}"
 
-            print(f"💾 Saved {len(results)} results to {filename}")
+            output_file = dump_json(
+                {
+                    "scraped_at": datetime.now().isoformat(),
+                    "mode": mode,
+                    "count": len(results),
+                    "results": results,
+                },
+                artifact_path(output_path, name),
+            )
+
+            print(f"💾 Saved {len(results)} results to {output_file.name}")
 
         return results
 
@@ -326,7 +382,18 @@ def run_seat_scrape(
 # ============================================================================
 
 
+def run_delegated(command: str, argv: list[str]):
+    """Run a standalone CLI module as if invoked with `python -m`."""
+    module, _ = DELEGATED_COMMANDS[command]
+    sys.argv = [sys.argv[0], *argv]
+    runpy.run_module(module, run_name="__main__", alter_sys=True)
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in DELEGATED_COMMANDS:
+        run_delegated(sys.argv[1], sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description="CineRadar - TIX.id Movie & Seat Scraper",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -336,6 +403,7 @@ Examples:
   python -m backend.cli movies --batch 0 --total-batches 9
   python -m backend.cli seats --mode morning
   python -m backend.cli seats --city JAKARTA --limit 10
+  python -m backend.cli merge
         """,
     )
 
@@ -361,12 +429,21 @@ Examples:
     seats_parser.add_argument("--batch", type=int, help="Batch number")
     seats_parser.add_argument("--total-batches", type=int, default=9)
     seats_parser.add_argument("--jit-window", type=int, default=20, help="JIT window in minutes")
+    seats_parser.add_argument(
+        "--now",
+        type=datetime.fromisoformat,
+        help="JIT window start, e.g. 2026-10-19T14:07 (required with --batch in JIT mode)",
+    )
     seats_parser.add_argument(
         "--use-stored-token",
         action="store_true",
         help="Use token from Firestore instead of logging in",
     )
 
+    # Delegated commands (dispatched above, listed here for --help)
+    for name, (_, help_text) in DELEGATED_COMMANDS.items():
+        subparsers.add_parser(name, help=help_text, add_help=False)
+
     args = parser.parse_args()
 
     if args.command == "movies":
@@ -390,6 +467,7 @@ Examples:
             output_dir=args.output,
             jit_window=args.jit_window,
             use_stored_token=args.use_stored_token,
+            now=args.now,
         )
     else:
         parser.print_help()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Compact old seat observations into one summary per showtime.
+
+Raw observations older than --days are rolled into ShowtimeSummary
+records (peak, final and a downsampled sell curve) and then deleted:
+
+- Firestore: seat_snapshots/{date}/observations is summarised into
+  seat_archive/{date}/showtimes/{showtime_id}; the raw documents are
+  deleted in batches.
+- Local files: JIT lines (data/jit_granular/jit_{date}_*.jsonl) and final
+  snaps (data/final_snaps/final_{date}_*.json) are summarised into
+  data/seat_archive/seat_archive_{date} and removed.
+
+Safe to rerun at any point. A summary is always committed before (or
+with) the deletes of its observations, and a showtime that already has a
+summary only gets its leftover observations deleted, never re-summarised
+from a partial set. Daily seat rollups are kept.
+
+Usage:
+    python -m backend.cli.compact_seats --dry-run
+    python -m backend.cli.compact_seats --days 30
+    python -m backend.cli.compact_seats --days 14 --no-firestore
+"""
+
+import argparse
+import json
+import re
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from backend.domain.models import ShowtimeSummary
+from backend.infrastructure.repositories.firestore_client import get_firestore_client
+from backend.infrastructure.repositories.firestore_seat import (
+    ARCHIVE_COLLECTION,
+    FirestoreSeatRepository,
+    archive_path,
+)
+from backend.infrastructure.repositories.firestore_writer import MAX_BATCH_SIZE
+from backend.infrastructure.storage import (
+    artifact_path,
+    codec_for_path,
+    dump_json,
+    find_artifact,
+    load_json,
+)
+
+# Keep raw observations for this many days
+RETENTION_DAYS = 30
+
+# Fields a summary needs; layouts are not fetched
+SUMMARY_FIELDS = [
+    "showtime_id",
+    "scraped_at",
+    "snapshot_type",
+    "date",
+    "movie_id",
+    "movie_title",
+    "theatre_id",
+    "theatre_name",
+    "city",
+    "merchant",
+    "showtime",
+    "total_seats",
+    "sold_seats",
+    "unavailable_seats",
+]
+
+_FILE_DATE = re.compile(r"^(?:jit|final)_(\d{4}-\d{2}-\d{2})_")
+
+
+def compact_firestore_date(date_str: str, dry_run: bool = False, db: Any = None) -> dict[str, int]:
+    """Summarise and delete one date's raw observations in Firestore.
+
+    Returns:
+        Counts: {"showtimes": ..., "summarised": ..., "deleted": ...}
+    """
+    db = db or get_firestore_client()
+    repo = FirestoreSeatRepository(db)
+
+    by_showtime: dict[str, list[tuple[Any, dict]]] = defaultdict(list)
+    for doc in repo.observations(date_str).select(SUMMARY_FIELDS).stream():
+        data = doc.to_dict()
+        by_showtime[str(data.get("showtime_id", ""))].append((doc.reference, data))
+
+    archive = db.collection(archive_path(date_str))
+    summarised = {ref.id for ref in archive.list_documents()}
+    counts = {"showtimes": len(by_showtime), "summarised": 0, "deleted": 0}
+    if dry_run or not by_showtime:
+        counts["summarised"] = len(by_showtime.keys() - summarised)
+        counts["deleted"] = sum(len(obs) for obs in by_showtime.values())
+        return counts
+
+    # Mark the day first, so rollup rebuilds leave it alone from now on
+    db.collection(ARCHIVE_COLLECTION).document(date_str).set(
+        {"date": date_str, "compacted_at": datetime.now().isoformat()}, merge=True
+    )
+
+    batch = db.batch()
+    ops = 0
+
+    def add(op: str, ref: Any, data: dict | None = None) -> None:
+        nonlocal batch, ops
+        if op == "set":
+            batch.set(ref, data)
+        else:
+            batch.delete(ref)
+        ops += 1
+        if ops == MAX_BATCH_SIZE:
+            batch.commit()
+            batch = db.batch()
+            ops = 0
+
+    # A summary is queued before its deletes, so it never commits after them
+    for showtime_id, observations in by_showtime.items():
+        if showtime_id not in summarised:
+            summary = ShowtimeSummary.from_observations([data for _, data in observations])
+            add("set", archive.document(showtime_id), summary.to_dict())
+            counts["summarised"] += 1
+        for ref, _ in observations:
+            add("delete", ref)
+            counts["deleted"] += 1
+    if ops:
+        batch.commit()
+
+    db.collection(ARCHIVE_COLLECTION).document(date_str).set(
+        {"showtimes": len(summarised) + counts["summarised"]}, merge=True
+    )
+    return counts
+
+
+def compact_firestore(cutoff: str, dry_run: bool = False) -> int:
+    """Compact every Firestore partition dated before cutoff.
+
+    Returns:
+        Raw observations deleted (or that would be)
+    """
+    repo = FirestoreSeatRepository()
+    dates = [d for d in repo.partition_dates() if d < cutoff]
+    if not dates:
+        print(f"   No Firestore partitions before {cutoff}")
+        return 0
+
+    deleted = 0
+    for date_str in dates:
+        counts = compact_firestore_date(date_str, dry_run, repo.db)
+        deleted += counts["deleted"]
+        print(
+            f"   {date_str}: {counts['showtimes']:,} showtimes, "
+            f"{counts['summarised']:,} summarised, {counts['deleted']:,} observations "
+            f"{'to delete' if dry_run else 'deleted'}"
+        )
+    return deleted
+
+
+def _local_observations(path: Path) -> list[dict]:
+    if path.suffix == ".jsonl":
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    return [load_json(path)]
+
+
+def compact_local(data_dir: str, cutoff: str, dry_run: bool = False) -> int:
+    """Compact local JIT and final snap files dated before cutoff.
+
+    Returns:
+        Raw files removed (or that would be)
+    """
+    data_path = Path(data_dir)
+    files_by_date: dict[str, list[Path]] = defaultdict(list)
+    for path in [
+        *(data_path / "jit_granular").glob("jit_*.jsonl"),
+        *(data_path / "final_snaps").glob("final_*.json"),
+    ]:
+        match = _FILE_DATE.match(path.name)
+        if match and match.group(1) < cutoff:
+            files_by_date[match.group(1)].append(path)
+
+    if not files_by_date:
+        print(f"   No local observation files before {cutoff}")
+        return 0
+
+    archive_dir = data_path / "seat_archive"
+    removed = 0
+    for date_str, paths in sorted(files_by_date.items()):
+        by_showtime: dict[str, list[dict]] = defaultdict(list)
+        for path in paths:
+            for obs in _local_observations(path):
+                by_showtime[str(obs.get("showtime_id", ""))].append(obs)
+
+        print(
+            f"   {date_str}: {len(paths)} files, {len(by_showtime)} showtimes"
+            + (" (dry run)" if dry_run else "")
+        )
+        removed += len(paths)
+        if dry_run:
+            continue
+
+        # Summaries from an interrupted run win over the files left behind
+        existing = find_artifact(archive_dir, f"seat_archive_{date_str}")
+        summaries = {s["showtime_id"]: s for s in load_json(existing)} if existing else {}
+        for showtime_id, observations in by_showtime.items():
+            if showtime_id not in summaries:
+                summary = ShowtimeSummary.from_observations(observations)
+                summary.date = summary.date or date_str  # JIT lines carry no date
+                summaries[showtime_id] = summary.to_dict()
+
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        archive_file = existing or artifact_path(archive_dir, f"seat_archive_{date_str}")
+        tmp_file = archive_file.with_name(archive_file.name + ".tmp")
+        dump_json(list(summaries.values()), tmp_file, codec=codec_for_path(archive_file))
+        tmp_file.replace(archive_file)
+
+        for path in paths:
+            path.unlink()
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact old seat observations")
+    parser.add_argument(
+        "--days", type=int, default=RETENTION_DAYS, help="Keep raw observations this many days"
+    )
+    parser.add_argument("--data-dir", "-d", default="data", help="Data directory")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would go")
+    parser.add_argument("--no-firestore", action="store_true", help="Skip Firestore")
+    parser.add_argument("--no-local", action="store_true", help="Skip local files")
+    args = parser.parse_args()
+
+    cutoff = (date.today() - timedelta(days=args.days)).isoformat()
+
+    print("\n" + "=" * 60)
+    print(f"🗜️ CineRadar Seat Compaction (observations before {cutoff})")
+    print("=" * 60 + "\n")
+
+    if not args.no_firestore:
+        print("☁️ Firestore")
+        deleted = compact_firestore(cutoff, args.dry_run)
+        print(f"   {deleted:,} raw observations {'to delete' if args.dry_run else 'deleted'}\n")
+
+    if not args.no_local:
+        print("📁 Local files")
+        removed = compact_local(args.data_dir, cutoff, args.dry_run)
+        print(f"   {removed:,} files {'to remove' if args.dry_run else 'removed'}\n")
+
+    print("🏁 Done")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,25 +4,28 @@ Daily Summary Report Generator
 
 Aggregates seat occupancy data from Firestore and sends a notification
 with total audience counts for the day.
+
+Totals come from the day's seat_rollups document, which the seat uploaders
+keep up to date, so a report reads one document however much history
+seat_snapshots holds. Days without a rollup are rebuilt from that day's
+snapshots; --backfill rebuilds a range of past days.
+
+Usage:
+    python -m backend.cli.daily_summary                        # Yesterday
+    python -m backend.cli.daily_summary --date 2026-10-18
+    python -m backend.cli.daily_summary --backfill 2026-10-01 2026-10-18
 """
 
-import json
+import argparse
 import os
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
-from google.cloud import firestore
-from google.oauth2 import service_account
-
-
-def get_firestore_client():
-    """Initialize Firestore client from service account."""
-    sa_json = os.environ.get("FIREBASE_SERVICE_ACCOUNT")
-    if sa_json:
-        sa_info = json.loads(sa_json)
-        credentials = service_account.Credentials.from_service_account_info(sa_info)
-        return firestore.Client(credentials=credentials, project=sa_info["project_id"])
-    else:
-        return firestore.Client()
+from backend.infrastructure.repositories.firestore_client import get_firestore_client
+from backend.infrastructure.repositories.seat_rollups import (
+    get_rollup,
+    rebuild_rollup,
+    summarize_rollup,
+)
 
 
 def aggregate_daily_audience(date_str: str | None = None) -> dict:
@@ -39,74 +42,51 @@ def aggregate_daily_audience(date_str: str | None = None) -> dict:
         date_str = datetime.now().strftime("%Y-%m-%d")
 
     db = get_firestore_client()
-    collection = db.collection("seat_snapshots")
-
-    # Query all snapshots for this date
-    # Document IDs contain the date in the scraped_at field
-    docs = collection.stream()
-
-    total_seats = 0
-    total_sold = 0
-    total_available = 0
-    showtime_count = 0
-    movies_seen = set()
-    theatres_seen = set()
-    cities_seen = set()
-
-    for doc in docs:
-        data = doc.to_dict()
-
-        # Filter by date (scraped_at contains ISO timestamp)
-        scraped_at = data.get("scraped_at", "")
-        if not scraped_at.startswith(date_str):
-            continue
-
-        total_seats += data.get("total_seats", 0)
-        total_sold += data.get("sold_seats", data.get("unavailable_seats", 0))
-        total_available += data.get("available_seats", 0)
-        showtime_count += 1
-
-        if data.get("movie_id"):
-            movies_seen.add(data["movie_id"])
-        if data.get("theatre_id"):
-            theatres_seen.add(data["theatre_id"])
-        if data.get("city"):
-            cities_seen.add(data["city"])
-
-    occupancy_pct = (total_sold / total_seats * 100) if total_seats > 0 else 0
-
-    return {
-        "date": date_str,
-        "total_audience": total_sold,
-        "total_seats": total_seats,
-        "total_available": total_available,
-        "occupancy_pct": round(occupancy_pct, 1),
-        "showtime_count": showtime_count,
-        "movie_count": len(movies_seen),
-        "theatre_count": len(theatres_seen),
-        "city_count": len(cities_seen),
-    }
+    rollup = get_rollup(date_str, db)
+    if rollup is None:
+        print(f"🔁 No rollup for {date_str}, rebuilding from seat_snapshots")
+        rollup = rebuild_rollup(date_str, db)
+
+    return {**summarize_rollup(rollup), "date": date_str}
+
+
+def backfill_rollups(start: str, end: str) -> int:
+    """Rebuild the rollups of every day from start to end (inclusive).
+
+    Returns:
+        Number of days rebuilt
+    """
+    db = get_firestore_client()
+    day = date.fromisoformat(start)
+    last = date.fromisoformat(end)
+    days = 0
+    while day <= last:
+        rollup = rebuild_rollup(day.isoformat(), db)
+        print(f"   {day}: {rollup['showtimes']:,} snapshots, {rollup['sold']:,} seats sold")
+        day += timedelta(days=1)
+        days += 1
+    return days
 
 
 def format_summary_message(stats: dict) -> str:
     """Format stats as a readable message."""
     return f"""
-🎬 CineRadar Daily Summary - {stats['date']}
+🎬 CineRadar Daily Summary - {stats["date"]}
 
 📊 AUDIENCE STATISTICS
 ━━━━━━━━━━━━━━━━━━━━━━
-🎟️ Total Audience: {stats['total_audience']:,} seats sold
-🪑 Total Capacity: {stats['total_seats']:,} seats
-📈 Occupancy Rate: {stats['occupancy_pct']}%
+🎟️ Total Audience: {stats["total_audience"]:,} seats sold
+🪑 Total Capacity: {stats["total_seats"]:,} seats
+📈 Occupancy Rate: {stats["occupancy_pct"]}%
 
 📋 COVERAGE
 ━━━━━━━━━━━━━━━━━━━━━━
-🎬 Movies: {stats['movie_count']}
-🏢 Theatres: {stats['theatre_count']}
-🏙️ Cities: {stats['city_count']}
-⏰ Showtimes: {stats['showtime_count']:,}
+🎬 Movies: {stats["movie_count"]}
+🏢 Theatres: {stats["theatre_count"]}
+🏙️ Cities: {stats["city_count"]}
+⏰ Showtimes: {stats["showtime_count"]:,}
 
-Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} WIB
+Generated at: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} WIB
 """
 
 
@@ -123,12 +103,28 @@ def send_github_summary(message: str):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Daily audience summary from seat rollups")
+    parser.add_argument("--date", help="Report date (YYYY-MM-DD, default: yesterday)")
+    parser.add_argument(
+        "--backfill",
+        nargs=2,
+        metavar=("START", "END"),
+        help="Rebuild seat rollups for START..END from seat_snapshots and exit",
+    )
+    args = parser.parse_args()
+
+    if args.backfill:
+        print(f"🔁 Rebuilding seat rollups {args.backfill[0]} → {args.backfill[1]}")
+        days = backfill_rollups(*args.backfill)
+        print(f"✅ Rebuilt {days} days")
+        return
+
     print("\n" + "=" * 60)
     print("📊 CineRadar Daily Summary Report")
     print("=" * 60 + "\n")
 
     # Get yesterday's date (for midnight report)
-    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+    yesterday = args.date or (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
 
     stats = aggregate_daily_audience(yesterday)
 
@@ -146,10 +142,12 @@ def main():
     # Store summary in Firestore for historical tracking
     try:
         db = get_firestore_client()
-        db.collection("daily_summaries").document(yesterday).set({
-            **stats,
-            "generated_at": datetime.now().isoformat(),
-        })
+        db.collection("daily_summaries").document(yesterday).set(
+            {
+                **stats,
+                "generated_at": datetime.now().isoformat(),
+            }
+        )
         print(f"💾 Saved summary to Firestore: daily_summaries/{yesterday}")
     except Exception as e:
         print(f"⚠️ Failed to save summary: {e}")
@@ -1,9 +1,22 @@
-
 #!/usr/bin/env python3
 """
 Final Snap Worker - Captures the final seating layout 5 minutes before showtime.
+
+Final snaps are streamed straight into Firestore `seat_snapshots` (the
+showtime date's partition, see firestore_seat) through a background batched
+writer, so they are queryable within seconds, and are added to the daily
+seat rollups in the same commit. A snap is created, never overwritten, so
+a rerun does not count it in the rollups twice. Local JSON files are an
+optional spill (and the fallback when an upload fails).
+
+Usage:
+    python -m backend.cli.final_snap_worker                  # Today's snapshot
+    python -m backend.cli.final_snap_worker --file data/movies_2025-12-23.json
+    python -m backend.cli.final_snap_worker --spill          # Also keep local copies
+    python -m backend.cli.final_snap_worker --no-upload      # Local files only
 """
 
+import argparse
 import asyncio
 import json
 import logging
@@ -11,9 +24,22 @@ import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from backend.infrastructure.scrapers.seat_scraper import TixSeatScraper
+from backend.domain.models import ShowtimeIndex
+from backend.infrastructure.repositories import FileMovieRepository
+from backend.infrastructure.repositories.firestore_seat import (
+    observations_path,
+    partition_date,
+)
+from backend.infrastructure.repositories.firestore_writer import (
+    BackgroundBatchWriter,
+    PendingWrite,
+)
+from backend.infrastructure.repositories.seat_rollups import ROLLUP_COLLECTION, rollup_increments
+from backend.infrastructure.storage import find_artifact, load_json
 from backend.infrastructure.token_refresher import TokenRefresher
 
+DEFAULT_SPILL_DIR = Path("data/final_snaps")
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,18 +48,94 @@ logging.basicConfig(
 )
 logger = logging.getLogger("FinalSnap")
 
+
+def discover_snapshot(data_dir: str = "data", date_str: str | None = None) -> Path | None:
+    """Find today's merged movie snapshot to schedule final snaps from.
+
+    Only the merged movies_{date} file is used: a single batch covers a
+    fraction of the cities, and another day's showtimes would be
+    scheduled against today's clock. Use --file to pick any other file.
+
+    Args:
+        data_dir: Directory containing scrape output
+        date_str: Date to look for (YYYY-MM-DD), defaults to today
+
+    Returns:
+        Path to the snapshot file, or None if it doesn't exist
+    """
+    date_str = date_str or datetime.now().strftime("%Y-%m-%d")
+    return find_artifact(Path(data_dir), f"movies_{date_str}")
+
+
+def build_tasks(index: ShowtimeIndex, now: datetime | None = None) -> list[dict]:
+    """Build final-snap tasks for every future showtime in the index."""
+    now = now or datetime.now()
+
+    return [
+        {
+            "id": entry.showtime_id,
+            "movie_id": entry.movie_id,
+            "movie": entry.movie_title,
+            "theatre_id": entry.theatre_id,
+            "theatre": entry.theatre_name,
+            "merchant": entry.merchant,
+            "city": entry.city,
+            "room_category": entry.room,
+            "start_time": entry.time,
+            "date": index.date,
+        }
+        # Only future showtimes for today
+        for entry in index.after(now.hour * 60 + now.minute)
+    ]
+
+
+def load_index(data_dir: str = "data", file: str | None = None) -> ShowtimeIndex | None:
+    """Load today's showtime index, falling back to a raw snapshot file."""
+    if not file:
+        index = FileMovieRepository(data_dir).get_showtime_index(
+            datetime.now().strftime("%Y-%m-%d")
+        )
+        if index is not None:
+            logger.info(f"📂 Loaded showtime index for {index.date}")
+            return index
+
+    data_path = Path(file) if file else discover_snapshot(data_dir)
+    if not data_path or not data_path.exists():
+        return None
+
+    logger.info(f"📂 Loading data from {data_path}")
+    return ShowtimeIndex.from_snapshot(load_json(data_path))
+
+
 class FinalSnapWorker:
-    def __init__(self):
+    def __init__(
+        self,
+        writer: BackgroundBatchWriter | None = None,
+        spill_dir: Path = DEFAULT_SPILL_DIR,
+        keep_local: bool = False,
+    ):
+        """
+        Args:
+            writer: Background Firestore writer (None saves locally only)
+            spill_dir: Directory for local copies and failed uploads
+            keep_local: Save a local copy even when uploading
+        """
+        # Imported here: the scrapers package pulls in Playwright
+        from backend.infrastructure.scrapers.seat_scraper import TixSeatScraper
+
         self.scraper = TixSeatScraper()
         self.token_refresher = TokenRefresher()
         self.processed_ids = set()
+        self.writer = writer
+        self.spill_dir = spill_dir
+        self.keep_local = keep_local
 
     async def _ensure_token(self):
         token = await self.token_refresher.ensure_valid_token()
         self.scraper.set_token(token.token)
 
     async def capture_final(self, task: dict):
-        """Scrape and save the final snap for a showtime."""
+        """Scrape a showtime's final snap and stream it to storage."""
         showtime_id = task["id"]
         logger.info(f"📸 Capturing FINAL SNAP for {task['movie']} at {task['theatre']} ({task['start_time']})")
 
@@ -45,16 +147,23 @@ class FinalSnapWorker:
             )
 
             if results:
-                occ = results[0]
-                # Add snapshot type for Firestore identification
-                data = occ.to_dict()
-                data["snapshot_type"] = "final"
-
-                # Save locally as well
-                self._save_local(data, task)
-
-                # TODO: Direct Firestore upload if desired, or let upload_seats handle it
-                # For now, we rely on local files + upload_seats
+                data = self._to_document(results[0].to_dict(), task)
+
+                if self.writer:
+                    # Created, not overwritten: a rerun or a retried commit
+                    # must not add the same snap to the rollups again
+                    self.writer.put(
+                        observations_path(partition_date(data)),
+                        f"{showtime_id}_final",
+                        data,
+                        create=True,
+                        followups=[
+                            PendingWrite(ROLLUP_COLLECTION, rollup_id, increments, merge=True)
+                            for rollup_id, increments in rollup_increments([data]).items()
+                        ],
+                    )
+                if self.keep_local or not self.writer:
+                    self._save_local(data)
 
                 logger.info(f"✅ Final snap captured for {showtime_id}")
                 return True
@@ -62,16 +171,41 @@ class FinalSnapWorker:
             logger.error(f"❌ Failed to capture final snap for {showtime_id}: {e}")
             return False
 
-    def _save_local(self, data: dict, task: dict):
-        output_dir = Path("data/final_snaps")
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        date_str = task["date"]
-        filename = f"final_{date_str}_{task['id']}.json"
-
-        with open(output_dir / filename, "w") as f:
+    @staticmethod
+    def _to_document(data: dict, task: dict) -> dict:
+        """Fill showtime context the seat API doesn't return."""
+        # Add snapshot type for Firestore identification
+        data["snapshot_type"] = "final"
+        for key, task_key in (
+            ("movie_id", "movie_id"),
+            ("movie_title", "movie"),
+            ("theatre_id", "theatre_id"),
+            ("theatre_name", "theatre"),
+            ("city", "city"),
+            ("merchant", "merchant"),
+            ("room_category", "room_category"),
+            ("showtime", "start_time"),
+            ("date", "date"),
+        ):
+            if not data.get(key):
+                data[key] = task.get(task_key)
+        return data
+
+    def _save_local(self, data: dict):
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+        filename = f"final_{data['date']}_{data['showtime_id']}.json"
+
+        with open(self.spill_dir / filename, "w") as f:
             json.dump(data, f, indent=2)
 
+    def _spill_failed(self, writes: list[PendingWrite]):
+        """Keep final snaps that could not be uploaded."""
+        logger.error(f"❌ Upload failed for {len(writes)} final snaps - spilling to disk")
+        # Their rollup deltas are rebuilt from the snapshots (daily_summary --backfill)
+        for w in writes:
+            self._save_local(w.data)
+
     async def run(self, tasks: list[dict]):
         logger.info(f"🚀 Final Snap Worker started for {len(tasks)} showtimes")
 
@@ -113,42 +247,40 @@ class FinalSnapWorker:
             await asyncio.sleep(30)
 
 async def main():
-    # Load today's movie data
-    data_path = Path("data/movies_2025-12-23.json") # Example for now, should be dynamic
-    if not data_path.exists():
-        logger.error(f"❌ Data file {data_path} not found")
-        return
-
-    with open(data_path) as f:
-        data = json.load(f)
-
-    tasks = []
-    now = datetime.now()
-    date_str = data.get("date")
-
-    for movie in data.get("movies", []):
-        for _city, schedules in movie.get("schedules", {}).items():
-            for theatre in schedules:
-                for room in theatre.get("rooms", []):
-                    for st in room.get("all_showtimes", []):
-                        if isinstance(st, dict) and st.get("showtime_id"):
-                            st_time = st["time"]
-                            # Only future showtimes for today
-                            sh, sm = map(int, st_time.split(":"))
-                            st_dt = now.replace(hour=sh, minute=sm, second=0, microsecond=0)
-
-                            if st_dt > now:
-                                tasks.append({
-                                    "id": st["showtime_id"],
-                                    "movie": movie["title"],
-                                    "theatre": theatre["theatre_name"],
-                                    "merchant": theatre["merchant"],
-                                    "start_time": st_time,
-                                    "date": date_str
-                                })
-
-    worker = FinalSnapWorker()
-    await worker.run(tasks)
+    parser = argparse.ArgumentParser(description="Final Snap Worker")
+    parser.add_argument("--file", help="Movie snapshot to use (default: discover today's)")
+    parser.add_argument("--data-dir", default="data", help="Data directory")
+    parser.add_argument("--spill", action="store_true", help="Also save final snaps locally")
+    parser.add_argument("--no-upload", action="store_true", help="Skip Firestore, save locally")
+    args = parser.parse_args()
+
+    index = load_index(args.data_dir, args.file)
+    if index is None:
+        if args.file:
+            logger.error(f"❌ Snapshot file not found: {args.file}")
+        else:
+            today = datetime.now().strftime("%Y-%m-%d")
+            logger.error(
+                f"❌ No snapshot for today ({today}) in {args.data_dir}/ - "
+                "run the merge first or pass --file"
+            )
+        sys.exit(1)
+
+    tasks = build_tasks(index)
+
+    worker = FinalSnapWorker(spill_dir=Path(args.data_dir) / "final_snaps", keep_local=args.spill)
+    if not args.no_upload:
+        worker.writer = BackgroundBatchWriter(on_failure=worker._spill_failed).start()
+
+    try:
+        await worker.run(tasks)
+    finally:
+        if worker.writer:
+            stats = worker.writer.close()
+            logger.info(
+                f"📤 Wrote {stats.written}/{stats.queued} final snaps in {stats.batches} "
+                f"batches ({stats.skipped} already stored, {stats.failed} failed)"
+            )
 
 if __name__ == "__main__":
     asyncio.run(main())
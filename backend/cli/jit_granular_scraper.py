@@ -15,8 +15,10 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-from backend.domain.models import SeatOccupancy
-from backend.infrastructure.scrapers.seat_scraper import TixSeatScraper
+from backend.domain.models import SeatOccupancy, ShowtimeIndex
+from backend.infrastructure.rate_limiter import SlidingWindowLimiter
+from backend.infrastructure.repositories import FileMovieRepository
+from backend.infrastructure.storage import load_json
 from backend.infrastructure.token_refresher import TokenRefresher, TokenRefreshError
 
 # --- Configuration ---
@@ -33,42 +35,25 @@ UA_POOL = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36",
 ]
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout), logging.FileHandler("jit_scraper.log")],
-)
 logger = logging.getLogger("JITScraper")
 
 
-class RateLimiter:
-    """Simple sliding window rate limiter."""
-
-    def __init__(self, max_rate: int, time_window: int = 60):
-        self.max_rate = max_rate
-        self.time_window = time_window
-        self.timestamps = []
-
-    async def acquire(self):
-        """Wait until a request slot is available."""
-        while True:
-            now = time.time()
-            # Remove old timestamps
-            self.timestamps = [t for t in self.timestamps if now - t <= self.time_window]
-
-            if len(self.timestamps) < self.max_rate:
-                self.timestamps.append(now)
-                return
-
-            # Wait a bit before checking again
-            await asyncio.sleep(0.5)
+def configure_logging():
+    """Log to stdout and jit_scraper.log (called from main, not at import)."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout), logging.FileHandler("jit_scraper.log")],
+    )
 
 
 class GranularScraper:
     def __init__(self):
+        # Imported here: the scrapers package pulls in Playwright
+        from backend.infrastructure.scrapers.seat_scraper import TixSeatScraper
+
         self.scraper = TixSeatScraper()
-        self.rate_limiter = RateLimiter(MAX_REQUESTS_PER_MINUTE)
+        self.rate_limiter = SlidingWindowLimiter(MAX_REQUESTS_PER_MINUTE, time_window=60)
         self.token_refresher = TokenRefresher()
         self.data_dir = Path("data/jit_granular")
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -165,11 +150,12 @@ class GranularScraper:
             for task in showtime_tasks:
                 tasks.append(self._scrape_single(task))
 
-            # Run batch concurrently (limited by RateLimiter internally)
+            # Run batch concurrently (limited by the rate limiter internally)
             await asyncio.gather(*tasks)
 
             # 3. Wait for next interval
             elapsed = time.time() - batch_start
+            logger.info(f"🚦 Rate limiter: {self.rate_limiter.stats.summary()}")
             wait_time = (SCRAPE_INTERVAL_MINUTES * 60) - elapsed
 
             # Anti-bot: Jitter
@@ -200,86 +186,42 @@ async def main():
     )
     parser.add_argument("--limit", type=int, default=100, help="Max showtimes to monitor")
     args = parser.parse_args()
+    configure_logging()
 
-    # Determine input file
+    # Load the flat showtime index (precomputed at merge time)
     if args.file:
         file_path = Path(args.file)
+        logger.info(f"📂 Loading data from {file_path}")
+        try:
+            index = ShowtimeIndex.from_snapshot(load_json(file_path))
+        except FileNotFoundError:
+            logger.error(f"❌ File {file_path} not found!")
+            return
     else:
-        # Find latest movies_*.json
-        files = sorted(Path("data").glob("movies_202*.json"))
-        if not files:
+        index = FileMovieRepository("data").get_showtime_index()
+        if index is None:
             logger.error("❌ No movie data files found in data/!")
             return
-        file_path = files[-1]
-
-    logger.info(f"📂 Loading data from {file_path}")
-
-    tasks = []
-
-    try:
-        with open(file_path) as f:
-            data = json.load(f)
-
-        now = datetime.now()
-        movies = data.get("movies", [])
-        logger.info(f"   Found {len(movies)} movies in file")
-
-        for m in movies:
-            title = m.get("title")
-            # Filter by movie title
-            if args.movie and args.movie.lower() not in title.lower():
-                continue
-
-            for city, schedules in m.get("schedules", {}).items():
-                # Filter by city
-                if args.city and args.city.upper() != city.upper():
-                    continue
-
-                for theatre in schedules:
-                    theatre_name = theatre.get("theatre_name")
-                    merchant = theatre.get("merchant")
-
-                    for room in theatre.get("rooms", []):
-                        # Use all_showtimes
-                        showtimes = room.get("all_showtimes", [])
-                        if not showtimes:
-                            showtimes = room.get("showtimes", [])
-
-                        for st in showtimes:
-                            if isinstance(st, dict):
-                                st_time = st.get("time")
-                                st_id = st.get("showtime_id")
-                            else:
-                                continue
-
-                            if not st_id or not st_time:
-                                continue
-
-                            # Parse time
-                            try:
-                                sh, sm = map(int, st_time.split(":"))
-                                st_dt = now.replace(hour=sh, minute=sm, second=0, microsecond=0)
-
-                                # Only future showtimes
-                                if st_dt > now:
-                                    tasks.append(
-                                        {
-                                            "id": st_id,
-                                            "movie": title,
-                                            "theatre": theatre_name,
-                                            "city": city,
-                                            "merchant": merchant,
-                                            "start_time": st_time,
-                                            "date": data.get("date"),
-                                            "interval": args.interval,
-                                        }
-                                    )
-                            except Exception:
-                                continue
-
-    except FileNotFoundError:
-        logger.error(f"❌ File {file_path} not found!")
-        return
+        logger.info(f"📂 Loaded showtime index for {index.date}")
+
+    logger.info(f"   Found {len(index)} showtimes in index")
+
+    # Only future showtimes, filtered by city / movie title
+    now = datetime.now()
+    upcoming = index.after(now.hour * 60 + now.minute)
+    tasks = [
+        {
+            "id": entry.showtime_id,
+            "movie": entry.movie_title,
+            "theatre": entry.theatre_name,
+            "city": entry.city,
+            "merchant": entry.merchant,
+            "start_time": entry.time,
+            "date": index.date,
+            "interval": args.interval,
+        }
+        for entry in index.filter(city=args.city, movie_title=args.movie, entries=upcoming)
+    ]
 
     logger.info(f"✅ Found {len(tasks)} upcoming showtimes matching criteria.")
 
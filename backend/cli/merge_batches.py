@@ -1,14 +1,93 @@
 #!/usr/bin/env python3
-"""Merge batch scrape results into single output file with validation."""
+"""Merge batch scrape results into single output file with validation.
 
-import json
+Batches are merged as a stream: each batch file yields its movies in id
+order, a k-way merge combines movies with the same id, and merged movies
+are spilled to a temporary file before being written out in display order.
+Peak memory tracks the size of one movie rather than the whole day.
+
+Alongside the nested movies_{date} file, a normalized snapshot_{date} file
+is written with each theatre stored once (see domain.models.snapshot), and
+an indexed movies_{date}.snap for loading single movies or cities.
+
+Batches are validated by the scrape job that wrote them (see the
+`.digest` files next to each batch). Movies whose batch digest still
+matches are not schema-checked again; only movies from batches without a
+usable digest are, plus the cross-batch checks (same date, header schema,
+at least one movie). The merged file gets a digest of its own, which
+validate.py trusts.
+"""
+
+import heapq
 import sys
+import tempfile
+from collections.abc import Iterator
 from datetime import datetime
+from itertools import groupby
 from pathlib import Path
 
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+# Batch header value written by the movie scraper when movies are sorted by id
+MOVIE_ORDER_ID = "id"
+
+
+def movie_sort_key(movie: dict) -> str:
+    """Key batch files are sorted by (and merged on)."""
+    return str(movie["id"])
+
+
+def iter_batch_movies(
+    batch_file: Path, city_stats: dict, header: dict | None = None
+) -> Iterator[dict]:
+    """Stream a batch file's movies in id order.
+
+    Batches written with `"movie_order": "id"` are streamed as-is; older
+    batches are loaded and sorted in memory (one batch, not the whole day).
+    city_stats from the batch is collected into `city_stats`, and the
+    other top-level fields (date, batch, ...) into `header` if given.
+    """
+    from backend.infrastructure.storage import iter_object
+
+    movie_order = None
+    unsorted: list[dict] = []
+
+    for key, value in iter_object(batch_file, stream_keys={"movies"}):
+        if key == "movie_order":
+            movie_order = value
+        elif key == "movies":
+            if movie_order == MOVIE_ORDER_ID:
+                yield value
+            else:
+                unsorted.append(value)
+        elif key == "city_stats":
+            city_stats.update(value)
+        elif header is not None:
+            header[key] = value
+
+    if unsorted:
+        print(f"   ⚠️ {batch_file.name} is not sorted by id, sorting in memory")
+        yield from sorted(unsorted, key=movie_sort_key)
+
+
+def merge_movie_group(movies: list[dict]) -> dict:
+    """Merge the copies of one movie from different batches (first batch wins)."""
+    merged = movies[0]
+    cities = list(dict.fromkeys(merged.get("cities", [])))
+    seen = set(cities)
+
+    for movie in movies[1:]:
+        for city in movie.get("cities", []):
+            if city not in seen:
+                seen.add(city)
+                cities.append(city)
+        for city, city_schedules in movie.get("schedules", {}).items():
+            merged.setdefault("schedules", {}).setdefault(city, city_schedules)
+
+    merged["cities"] = cities
+    return merged
+
 
 def merge_batches(data_dir: str = "data", validate: bool = True) -> bool:
     """Merge batch files into single daily output.
@@ -20,87 +99,225 @@ def merge_batches(data_dir: str = "data", validate: bool = True) -> bool:
     Returns:
         True if merge (and validation) successful
     """
+    from backend.domain.models import NormalizedSnapshot, ShowtimeIndex
+    from backend.infrastructure.repositories import FileMovieRepository
+    from backend.infrastructure.storage import (
+        SNAP_SUFFIX,
+        IndexedSnapshotWriter,
+        JsonObjectWriter,
+        artifact_path,
+        codec_for_path,
+        encode_value,
+        glob_artifacts,
+        json_indent,
+        load_digest,
+        open_write,
+        write_digest,
+    )
+
     data_path = Path(data_dir)
     date_str = datetime.now().strftime("%Y-%m-%d")
 
     # Find all batch files
-    batch_files = sorted(data_path.glob("batch_*_*.json"))
+    batch_files = glob_artifacts(data_path, "batch_*_*")
     print(f"📦 Found {len(batch_files)} batch files")
 
     if not batch_files:
         print("❌ No batch files found")
         return False
 
-    # Merge movies
-    movie_map = {}
-    city_stats = {}
-
-    for batch_file in batch_files:
-        print(f"   Loading {batch_file.name}")
-        with open(batch_file, encoding="utf-8") as f:
-            data = json.load(f)
-
-        for movie in data.get("movies", []):
-            movie_id = movie["id"]
-            if movie_id in movie_map:
-                # Merge cities and schedules
-                existing = movie_map[movie_id]
-                for city in movie.get("cities", []):
-                    if city not in existing["cities"]:
-                        existing["cities"].append(city)
-                for city, schedules in movie.get("schedules", {}).items():
-                    if city not in existing["schedules"]:
-                        existing["schedules"][city] = schedules
-            else:
-                movie_map[movie_id] = movie
-
-        city_stats.update(data.get("city_stats", {}))
-
-    # Sort by city count
-    movies = sorted(movie_map.values(), key=lambda x: len(x.get("cities", [])), reverse=True)
-    presales = [m for m in movies if m.get("is_presale")]
-
-    # Build output data
-    output_data = {
-        "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "date": date_str,
-        "summary": {
-            "total_cities": len(city_stats),
-            "total_movies": len(movies),
-            "presale_count": len(presales),
-        },
-        "movies": movies,
-        "city_stats": city_stats,
-    }
-
-    # Validate with Pydantic if enabled
+    # Batches validated at scrape time whose digest still matches the file
+    trusted = [False] * len(batch_files)
     if validate:
         try:
-            from pydantic import ValidationError
-
-            from backend.schemas.movie import DailySnapshotSchema
-
+            from backend.schemas.validator import (
+                SnapshotReport,
+                format_errors,
+                validate_movie,
+                validator_fingerprint,
+            )
+        except ImportError:
+            print("⚠️ Pydantic not available, skipping validation")
+            validate = False
+        else:
             print("🔍 Validating merged data...")
-            validated = DailySnapshotSchema.model_validate(output_data)
+            fingerprint = validator_fingerprint()
+            for i, batch_file in enumerate(batch_files):
+                batch_report = load_digest(batch_file, fingerprint)
+                if batch_report is None:
+                    continue
+                if not batch_report.get("valid"):
+                    print(f"❌ Validation FAILED - {batch_file.name} failed batch validation:")
+                    for error in batch_report.get("errors", []):
+                        print(f"   {error}")
+                    return False
+                trusted[i] = True
             print(
-                f"✅ Validation passed: {len(validated.movies)} movies, {len(validated.city_stats)} cities"
+                f"   {sum(trusted)}/{len(batch_files)} batches trusted from digests, "
+                "validating movies from the rest"
+            )
+
+    # Per-batch city stats, applied in file order so later batches win as before
+    batch_city_stats: list[dict] = [{} for _ in batch_files]
+    batch_headers: list[dict] = [{} for _ in batch_files]
+
+    def tagged(i: int, movies: Iterator[dict]) -> Iterator[tuple[str, int, dict]]:
+        # A function, so each stream keeps its own batch index
+        return ((movie_sort_key(m), i, m) for m in movies)
+
+    streams = []
+    for i, batch_file in enumerate(batch_files):
+        print(f"   Streaming {batch_file.name}")
+        streams.append(
+            tagged(i, iter_batch_movies(batch_file, batch_city_stats[i], batch_headers[i]))
+        )
+    merged_stream = heapq.merge(*streams, key=lambda t: (t[0], t[1]))
+
+    output_file = artifact_path(data_path, f"movies_{date_str}")
+    normalized_file = artifact_path(data_path, f"snapshot_{date_str}")
+    indexed_file = data_path / f"movies_{date_str}{SNAP_SUFFIX}"
+    indent = json_indent(codec_for_path(output_file))
+
+    # Pass 1: k-way merge by id, spill encoded movies (nested and normalized)
+    # to a temp file as (-city count, seq, offset, length, normalized length)
+    spilled: list[tuple[int, int, int, int, int]] = []
+    normalized = NormalizedSnapshot()
+    movie_ids: list[str] = []
+    presale_count = 0
+    report = SnapshotReport(valid=True, date=date_str) if validate else None
+    errors: list[str] = []
+    showtimes = []
+
+    with (
+        tempfile.TemporaryFile(dir=data_path) as spill,
+        IndexedSnapshotWriter(indexed_file) as indexed,
+    ):
+        for _, group in groupby(merged_stream, key=lambda t: t[0]):
+            copies = list(group)
+            movie = merge_movie_group([m for _, _, m in copies])
+            seq = len(spilled)
+
+            if validate:
+                # Copies that all come from trusted batches merge into a valid movie
+                if not all(trusted[i] for _, i, _ in copies):
+                    errors.extend(validate_movie(movie, seq))
+                report.add_movie(movie)
+            presale_count += bool(movie.get("is_presale"))
+            showtimes.extend(ShowtimeIndex.entries_from_movie_dict(movie))
+
+            encoded = encode_value(movie, level=2, indent=indent).encode("utf-8")
+            encoded_normalized = encode_value(
+                normalized.normalize_movie(movie), level=2, indent=indent
+            ).encode("utf-8")
+            spilled.append(
+                (
+                    -len(movie["cities"]),
+                    seq,
+                    spill.tell(),
+                    len(encoded),
+                    len(encoded_normalized),
+                )
             )
-        except ValidationError as e:
+            spill.write(encoded)
+            spill.write(encoded_normalized)
+            indexed.add_movie(movie)
+            movie_ids.append(str(movie["id"]))
+
+        if errors:
             print("❌ Validation FAILED - data quality issue detected:")
-            for error in e.errors():
-                loc = " → ".join(str(x) for x in error["loc"])
-                print(f"   {loc}: {error['msg']}")
+            for error in errors:
+                print(f"   {error}")
             return False
-        except ImportError:
-            print("⚠️ Pydantic not available, skipping validation")
 
-    # Save merged result
-    output_file = data_path / f"movies_{date_str}.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+        city_stats: dict = {}
+        for stats in batch_city_stats:
+            city_stats.update(stats)
+
+        header = {
+            "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "date": date_str,
+            "summary": {
+                "total_cities": len(city_stats),
+                "total_movies": len(spilled),
+                "presale_count": presale_count,
+            },
+            "city_stats": city_stats,
+        }
+
+        if validate:
+            from pydantic import ValidationError
+
+            from backend.schemas.movie import SnapshotHeaderSchema
+
+            # Cross-batch checks: every batch must come from the same scrape day
+            batch_dates = {h.get("date") for h in batch_headers}
+            if len(batch_dates) > 1:
+                print("❌ Validation FAILED - batches from different days:")
+                for batch_file, batch_header in zip(batch_files, batch_headers, strict=True):
+                    print(f"   {batch_file.name}: {batch_header.get('date')}")
+                return False
 
-    print(f"✅ Merged {len(movies)} movies from {len(city_stats)} cities")
+            try:
+                SnapshotHeaderSchema.model_validate(header)
+            except ValidationError as e:
+                print("❌ Validation FAILED - data quality issue detected:")
+                for error in format_errors(e):
+                    print(f"   {error}")
+                return False
+            if not spilled:
+                print("❌ Validation FAILED - no movies in batches")
+                return False
+            print(f"✅ Validation passed: {len(spilled)} movies, {len(city_stats)} cities")
+
+        def spilled_movies(normalized_form: bool = False) -> Iterator[str]:
+            # Sort by city count (ties keep id order)
+            for _, _, offset, length, normalized_length in sorted(spilled):
+                if normalized_form:
+                    spill.seek(offset + length)
+                    yield spill.read(normalized_length).decode("utf-8")
+                else:
+                    spill.seek(offset)
+                    yield spill.read(length).decode("utf-8")
+
+        # Pass 2: write outputs incrementally, replacing old files atomically
+        tmp_file = output_file.with_name(output_file.name + ".tmp")
+        with (
+            open_write(tmp_file, codec_for_path(output_file)) as f,
+            JsonObjectWriter(f, indent=indent) as writer,
+        ):
+            writer.field("scraped_at", header["scraped_at"])
+            writer.field("date", header["date"])
+            writer.field("summary", header["summary"])
+            writer.array_encoded("movies", spilled_movies())
+            writer.field("city_stats", city_stats)
+        tmp_file.replace(output_file)
+        if validate:
+            write_digest(output_file, report.finish(city_stats).to_dict(), fingerprint)
+
+        normalized.header = {k: header[k] for k in ("scraped_at", "date", "summary")}
+        tmp_file = normalized_file.with_name(normalized_file.name + ".tmp")
+        with (
+            open_write(tmp_file, codec_for_path(normalized_file)) as f,
+            JsonObjectWriter(f, indent=indent) as writer,
+        ):
+            for key, value in normalized.header_dict().items():
+                writer.field(key, value)
+            writer.array("theatres", normalized.theatre_list())
+            writer.array_encoded("movies", spilled_movies(normalized_form=True))
+            writer.field("city_stats", city_stats)
+        tmp_file.replace(normalized_file)
+
+        indexed.finish(header, order=[movie_ids[seq] for _, seq, *_ in sorted(spilled)])
+
+    print(f"✅ Merged {len(spilled)} movies from {len(city_stats)} cities")
     print(f"💾 Saved to: {output_file}")
+    print(f"💾 Normalized: {normalized_file} ({len(normalized.theatres)} theatres)")
+    print(f"💾 Indexed: {indexed_file}")
+
+    # Precompute the flat showtime index for the seat scrapers
+    index = ShowtimeIndex(date=date_str, entries=showtimes)
+    index_file = FileMovieRepository(data_dir).save_showtime_index(index)
+    print(f"🗂️ Indexed {len(index)} showtimes: {index_file}")
     return True
 
 
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Move seat snapshots from the flat seat_snapshots collection into date
+partitions (seat_snapshots/{date}/observations/{id}, see firestore_seat).
+
+Documents keep their IDs. Each batch copies a page of documents and, with
+--delete, removes the originals in the same commit, so an interrupted run
+can simply be started again. Rollups of the dates touched can be rebuilt
+afterwards with --rebuild-rollups.
+
+Usage:
+    python -m backend.cli.migrate_seat_snapshots --dry-run
+    python -m backend.cli.migrate_seat_snapshots --delete --rebuild-rollups
+"""
+
+import argparse
+from collections import Counter
+from typing import Any
+
+from backend.infrastructure.repositories.firestore_client import get_firestore_client
+from backend.infrastructure.repositories.firestore_seat import (
+    SEAT_COLLECTION,
+    observations_path,
+    partition_date,
+)
+from backend.infrastructure.repositories.firestore_writer import MAX_BATCH_SIZE
+from backend.infrastructure.repositories.seat_rollups import rebuild_rollup
+
+# Documents read per page; a copy and a delete each count against the batch limit
+PAGE_SIZE = MAX_BATCH_SIZE // 2
+
+
+def iter_flat_pages(db: Any, page_size: int = PAGE_SIZE) -> Any:
+    """Yield pages of documents stored directly in seat_snapshots.
+
+    Pages are ordered by document ID and resumed after the last one read,
+    so no query stays open for the whole collection. Partition documents
+    are never returned: seat_snapshots/{date} only holds subcollections.
+    """
+    collection = db.collection(SEAT_COLLECTION)
+    last = None
+    while True:
+        query = collection.order_by("__name__").limit(page_size)
+        if last is not None:
+            query = query.start_after(last)
+        page = list(query.stream())
+        if not page:
+            return
+        yield page
+        last = page[-1]
+
+
+def migrate_seat_snapshots(
+    delete: bool = False, dry_run: bool = False, db: Any = None
+) -> Counter[str]:
+    """Copy flat seat snapshots into their date partitions.
+
+    Args:
+        delete: Remove each original in the same commit as its copy
+        dry_run: Only count documents per date
+        db: Firestore client (shared client if None)
+
+    Returns:
+        Documents moved per partition date
+    """
+    db = db or get_firestore_client()
+    moved: Counter[str] = Counter()
+    skipped = 0
+
+    for page in iter_flat_pages(db):
+        batch = db.batch()
+        for doc in page:
+            data = doc.to_dict()
+            date = partition_date(data)
+            if date is None:
+                skipped += 1
+                continue
+            moved[date] += 1
+            if dry_run:
+                continue
+            batch.set(db.collection(observations_path(date)).document(doc.id), data)
+            if delete:
+                batch.delete(doc.reference)
+        if not dry_run:
+            batch.commit()
+        print(f"   {sum(moved.values()):,} snapshots {'found' if dry_run else 'moved'}")
+
+    if skipped:
+        print(f"⚠️ Left {skipped} snapshots without date or scraped_at in place")
+    return moved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Partition seat_snapshots by date")
+    parser.add_argument("--dry-run", action="store_true", help="Count documents only")
+    parser.add_argument(
+        "--delete", action="store_true", help="Delete originals once copied (same commit)"
+    )
+    parser.add_argument(
+        "--rebuild-rollups",
+        action="store_true",
+        help="Rebuild seat_rollups for every date migrated",
+    )
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("🚚 CineRadar Seat Snapshot Migration")
+    print("=" * 60 + "\n")
+
+    moved = migrate_seat_snapshots(delete=args.delete, dry_run=args.dry_run)
+    for date, count in sorted(moved.items()):
+        print(f"   {date}: {count:,}")
+
+    if args.dry_run:
+        print(f"\n🔍 {sum(moved.values()):,} snapshots would be moved")
+        return
+    print(f"\n✅ Moved {sum(moved.values()):,} snapshots into {len(moved)} date partitions")
+
+    if args.rebuild_rollups:
+        db = get_firestore_client()
+        for date in sorted(moved):
+            rebuild_rollup(date, db)
+        print(f"🔁 Rebuilt seat rollups for {len(moved)} dates")
+
+
+if __name__ == "__main__":
+    main()
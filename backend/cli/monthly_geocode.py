@@ -91,8 +91,10 @@ def geocode_theatre(theatre_name: str, city: str, cache: dict) -> dict | None:
 
 def main():
     # Find the latest movie file
+    from backend.infrastructure.storage import dump_json, glob_artifacts, load_json
+
     data_dir = Path(__file__).parent.parent.parent / "data"
-    movie_files = sorted(data_dir.glob("movies_*.json"), reverse=True)
+    movie_files = glob_artifacts(data_dir, "movies_*")[::-1]
 
     if not movie_files:
         print("❌ No movie data files found in data/")
@@ -103,8 +105,7 @@ def main():
     print("=" * 60)
     print(f"Input: {input_file}")
 
-    with open(input_file, encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(input_file)
 
     movies = data.get("movies", [])
     print(f"Movies: {len(movies)}")
@@ -182,9 +183,8 @@ def main():
     print(f"\n📊 Results: {success} geocoded, {failed} failed")
     print(f"💾 Cache saved: {len(cache)} entries")
 
-    # Save updated data
-    with open(input_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Save updated data (in the file's own format)
+    dump_json(data, input_file)
     print(f"💾 Data saved: {input_file}")
 
     # Count theatres with place_id
@@ -1,18 +1,19 @@
 #!/usr/bin/env python3
 """Populate Firestore with scraped data."""
 
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from backend.infrastructure.repositories.file_movie import FileMovieRepository
 from backend.infrastructure.repositories.firestore_utils import (
     log_scraper_run,
     save_daily_snapshot,
     sync_theatres_from_scrape,
 )
+from backend.infrastructure.storage import find_artifact, glob_artifacts, load_json
 
 
 def main():
@@ -22,11 +23,11 @@ def main():
 
     # Use today's date to find the correct file
     today = datetime.now().strftime("%Y-%m-%d")
-    input_file = data_dir / f"movies_{today}.json"
+    input_file = find_artifact(data_dir, f"movies_{today}")
 
     # Fall back to latest file if today's doesn't exist
-    if not input_file.exists():
-        movie_files = sorted(data_dir.glob("movies_*.json"), reverse=True)
+    if input_file is None:
+        movie_files = glob_artifacts(data_dir, "movies_*")[::-1]
         if movie_files:
             input_file = movie_files[0]
         else:
@@ -38,8 +39,7 @@ def main():
 
     print(f"📂 Loading: {input_file}")
 
-    with open(input_file, encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(input_file)
 
     movies = data.get("movies", [])
     summary = data.get("summary", {})
@@ -49,9 +49,11 @@ def main():
     print("🔥 Saving daily snapshot...")
     save_daily_snapshot(data)
 
-    # Sync theatres
+    # Sync theatres, using the merge's deduplicated theatre table when present
     print("🔥 Syncing theatres...")
-    result = sync_theatres_from_scrape(movies)
+    normalized = FileMovieRepository(str(data_dir)).get_normalized_snapshot(data.get("date"))
+    theatres = normalized.theatre_list() if normalized else None
+    result = sync_theatres_from_scrape(movies, theatres)
 
     # Log scraper run
     log_scraper_run(
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Import local scrape files into the SQLite database, so use cases and
+queries can run offline against the SQLite repositories.
+
+Imports every movies_{date} snapshot (and the theatres listed in them)
+plus seat files and final snaps. Rerunning replaces what it imported.
+
+Usage:
+    python -m backend.cli.sqlite_import                      # data/ -> data/cineradar.db
+    python -m backend.cli.sqlite_import --db /tmp/cineradar.db --date 2026-10-18
+"""
+
+import argparse
+from pathlib import Path
+
+from backend.cli.upload_seats import seat_results
+from backend.domain.models import Theatre
+from backend.infrastructure.repositories.file_movie import FileMovieRepository
+from backend.infrastructure.repositories.sqlite_client import get_sqlite_database, sqlite_path
+from backend.infrastructure.repositories.sqlite_movie import SQLiteMovieRepository
+from backend.infrastructure.repositories.sqlite_seat import SQLiteSeatRepository
+from backend.infrastructure.repositories.sqlite_theatre import SQLiteTheatreRepository
+from backend.infrastructure.storage import FileCache, glob_artifacts, load_json, load_json_files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import local data into SQLite")
+    parser.add_argument("--data-dir", "-d", default="data", help="Data directory")
+    parser.add_argument("--db", default=None, help=f"Database file (default: {sqlite_path()})")
+    parser.add_argument("--date", help="Only this snapshot date")
+    args = parser.parse_args()
+
+    db = get_sqlite_database(args.db)
+    files = FileMovieRepository(args.data_dir, cache=FileCache(0))
+    movies = SQLiteMovieRepository(db)
+    theatres = SQLiteTheatreRepository(db)
+    seats = SQLiteSeatRepository(db)
+
+    print("\n" + "=" * 60)
+    print(f"🗄️ CineRadar SQLite Import ({db.path})")
+    print("=" * 60 + "\n")
+
+    imported = 0
+    # Decode the next day's file while this one is written to the database
+    for snapshot in files.iter_snapshots(args.date, args.date, prefetch=1):
+        if not movies.save_snapshot(snapshot):
+            print(f"   ❌ movies_{snapshot.date}")
+            continue
+        imported += 1
+        listed = [
+            Theatre.from_schedule(schedule, city)
+            for movie in snapshot.movies
+            for city, schedules in movie.schedules.items()
+            for schedule in schedules
+        ]
+        counts = theatres.upsert_many(listed)
+        print(
+            f"   + movies_{snapshot.date}: {snapshot.movie_count} movies, {counts['success']} theatres"
+        )
+
+    data_path = Path(args.data_dir)
+    seat_files = [
+        p for p in glob_artifacts(data_path, "seats_*") if not args.date or args.date in p.name
+    ]
+    for path, records in load_json_files(seat_files, transform=seat_results).items():
+        print(f"   + {path.name}: {seats.save_many(records)} seat snapshots")
+
+    finals = sorted((data_path / "final_snaps").glob(f"final_{args.date or ''}*.json"))
+    if finals:
+        saved = seats.save_many(load_json(path) for path in finals)
+        print(f"   + final_snaps: {saved} seat snapshots")
+
+    print(f"\n✅ Imported {imported} snapshots into {db.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,49 +2,56 @@
 """
 Upload movie schedules to Firestore.
 Creates per-movie documents in schedules/{date}/movies/{movie_id} collection.
+
+Movies are streamed from the file and written concurrently through a
+Firestore BulkWriter, with retries on contention and quota errors.
 """
 
-import json
-import os
+import sys
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 
-from google.cloud import firestore
-from google.oauth2 import service_account
-
-
-def get_firestore_client():
-    """Initialize Firestore client from service account."""
-    sa_json = os.environ.get("FIREBASE_SERVICE_ACCOUNT")
-    if sa_json:
-        sa_info = json.loads(sa_json)
-        credentials = service_account.Credentials.from_service_account_info(sa_info)
-        return firestore.Client(credentials=credentials, project=sa_info["project_id"])
-    else:
-        # Local development - use default credentials
-        return firestore.Client()
+from backend.infrastructure.repositories.firestore_client import get_firestore_client
+from backend.infrastructure.repositories.firestore_writer import BulkWriteStats, bulk_set
+from backend.infrastructure.repositories.write_skip import WriteSkipper
 
 
-def load_movie_data(data_dir: str = "data") -> dict | None:
-    """Load the most recent movies JSON file.
+def latest_movie_file(data_dir: str = "data") -> Path | None:
+    """Find the most recent movies file (any artifact codec).
 
     Args:
-        data_dir: Directory containing movies JSON files.
+        data_dir: Directory containing movies files.
 
     Returns:
-        Parsed movie data dict, or None if no files found.
+        Path of the newest file, or None if no files found.
     """
-    data_path = Path(data_dir)
-    movie_files = list(data_path.glob("movies_*.json"))
+    from backend.infrastructure.storage import glob_artifacts
+
+    movie_files = glob_artifacts(data_dir, "movies_*")
     if not movie_files:
         return None
 
     # Sort by modification time, newest first
     movie_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-    latest_file = movie_files[0]
+    return movie_files[0]
 
-    with open(latest_file, encoding="utf-8") as f:
-        return json.load(f)
+
+def iter_movies(path: Path, header: dict) -> Iterator[dict]:
+    """Stream movies from a movies file without loading it whole.
+
+    Top-level fields other than movies are collected into `header`; the
+    ones written before the movies (scraped_at, date, summary) are set by
+    the time the first movie is yielded.
+    """
+    from backend.infrastructure.storage import iter_object
+
+    for key, value in iter_object(path, stream_keys={"movies"}):
+        if key == "movies":
+            yield value
+        else:
+            header[key] = value
 
 
 def transform_for_firestore(movie: dict, date: str) -> dict:
@@ -71,35 +78,43 @@ def transform_for_firestore(movie: dict, date: str) -> dict:
     }
 
 
-def upload_schedules_to_firestore(movies: list, date: str):
+def upload_schedules_to_firestore(movies: Iterable[dict], date: str) -> BulkWriteStats:
     """Upload per-movie schedule documents to Firestore.
 
+    Documents go through a BulkWriter as movies arrive, so a streamed
+    `movies` iterable is uploaded while the file is still being read.
+    Documents unchanged since the last upload are skipped (see write_skip).
+
     Args:
-        movies: List of movie dicts with schedules.
+        movies: Movie dicts with schedules (list or stream).
         date: Date string (YYYY-MM-DD).
-    """
-    if not movies:
-        print("⚠️ No movies to upload")
-        return
 
+    Returns:
+        Upload stats with throughput.
+    """
     db = get_firestore_client()
-    print(f"📤 Uploading {len(movies)} movie schedules for {date}...")
-
-    uploaded = 0
-    for movie in movies:
-        movie_id = movie.get("id")
-        if not movie_id:
-            continue
-
-        schedule_doc = transform_for_firestore(movie, date)
-
-        # Write to schedules/{date}/movies/{movie_id}
-        doc_ref = db.collection("schedules").document(date).collection("movies").document(movie_id)
-        doc_ref.set(schedule_doc)
-        uploaded += 1
-        print(f"   ✓ {movie.get('title', movie_id)[:40]}")
-
-    print(f"\n✅ Uploaded {uploaded} movie schedules to schedules/{date}/movies/")
+    movies_ref = db.collection("schedules").document(date).collection("movies")
+    print(f"📤 Uploading movie schedules for {date}...")
+
+    # Write to schedules/{date}/movies/{movie_id}
+    writes = (
+        (movies_ref.document(str(movie["id"])), transform_for_firestore(movie, date))
+        for movie in movies
+        if movie.get("id")
+    )
+    skipper = WriteSkipper.from_env("schedules", db)
+    stats = bulk_set(writes, db=db, skipper=skipper)
+
+    if stats.written == 0 and stats.failed == 0:
+        if skipper is None or skipper.stats.skipped == 0:
+            print("⚠️ No movies to upload")
+        return stats
+
+    print(f"\n✅ Uploaded {stats.written} movie schedules to schedules/{date}/movies/")
+    print(f"   ⏱️ {stats.summary()}")
+    for error in stats.errors[:10]:
+        print(f"   ❌ {error}")
+    return stats
 
 
 def main():
@@ -107,18 +122,23 @@ def main():
     print("🎬 CineRadar Schedule Upload")
     print("=" * 60 + "\n")
 
-    data = load_movie_data()
-    if not data:
+    movie_file = latest_movie_file()
+    if movie_file is None:
         print("❌ No movie files found in data/")
         return
 
-    movies = data.get("movies", [])
-    date = data.get("date", datetime.now().strftime("%Y-%m-%d"))
+    # Read up to the first movie: the date is written before the movies
+    header: dict = {}
+    movies = iter_movies(movie_file, header)
+    first = next(movies, None)
+    date = header.get("date", datetime.now().strftime("%Y-%m-%d"))
 
-    print(f"📂 Loaded {len(movies)} movies for {date}")
-    upload_schedules_to_firestore(movies, date)
+    print(f"📂 Streaming movies for {date} from {movie_file}")
+    stats = upload_schedules_to_firestore(chain([first], movies) if first else [], date)
 
     print("\n🏁 Done")
+    if stats.failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,97 +1,204 @@
 #!/usr/bin/env python3
 """
 Upload seat snapshots to Firestore.
-Merges batch files if present and uploads to seat_snapshots collection.
+Merges batch files if present and uploads to seat_snapshots, partitioned
+by showtime date (seat_snapshots/{date}/observations/{id}).
+
+Document IDs are derived from each observation, so uploads are
+idempotent, and a checkpoint file lets a failed upload resume without
+re-sending committed batches.
+
+Each batch also adds its snapshots to the daily rollups (seat_rollups) in
+the same commit. Snapshots are created rather than overwritten, so one
+that is already stored is dropped from the batch and never counted twice.
 """
 
-import json
-import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
-from google.cloud import firestore
-from google.oauth2 import service_account
+from backend.infrastructure.repositories.firestore_client import get_firestore_client
+from backend.infrastructure.repositories.firestore_seat import (
+    observations_path,
+    partition_date,
+    seat_snapshot_id,
+)
+from backend.infrastructure.repositories.seat_rollups import ROLLUP_COLLECTION, rollup_increments
 
 
-def get_firestore_client():
-    """Initialize Firestore client from service account."""
-    sa_json = os.environ.get("FIREBASE_SERVICE_ACCOUNT")
-    if sa_json:
-        sa_info = json.loads(sa_json)
-        credentials = service_account.Credentials.from_service_account_info(sa_info)
-        return firestore.Client(credentials=credentials, project=sa_info["project_id"])
-    else:
-        # Local development - use default credentials
-        return firestore.Client()
+def seat_results(data: dict) -> list:
+    """Extract seat records from a seat file (decoded in a worker process)."""
+    # Support both 'results' (new) and 'seats' (legacy) keys
+    seats = data.get("results", data.get("seats", []))
+
+    # Records carry the file's scrape mode as their snapshot type
+    mode = data.get("mode")
+    if mode:
+        for seat in seats:
+            if not seat.get("snapshot_type"):
+                seat["snapshot_type"] = mode
+    return seats
 
 
 def merge_seat_batches(data_dir: str = "data") -> list:
     """Merge all seat batch files into a single list."""
+    from backend.infrastructure.storage import glob_artifacts, load_json_files
+
     data_path = Path(data_dir)
     all_seats = []
 
     # Find all seat batch files
-    batch_files = list(data_path.glob("seats_*_batch*.json"))
+    batch_files = glob_artifacts(data_path, "seats_*_batch*")
     if batch_files:
         print(f"📂 Found {len(batch_files)} batch files to merge")
-        for batch_file in sorted(batch_files):
-            with open(batch_file, encoding="utf-8") as f:
-                batch_data = json.load(f)
-                # Support both 'results' (new) and 'seats' (legacy) keys
-                seats = batch_data.get("results", batch_data.get("seats", []))
-                all_seats.extend(seats)
-                print(f"   + {batch_file.name}: {len(seats)} seats")
     else:
         # Try single file
-        seat_files = list(data_path.glob("seats_*.json"))
-        for seat_file in seat_files:
-            if "batch" not in seat_file.name:
-                with open(seat_file, encoding="utf-8") as f:
-                    data = json.load(f)
-                    # Support both 'results' (new) and 'seats' (legacy) keys
-                    seats = data.get("results", data.get("seats", []))
-                    all_seats.extend(seats)
-                    print(f"   + {seat_file.name}: {len(seats)} seats")
+        batch_files = [p for p in glob_artifacts(data_path, "seats_*") if "batch" not in p.name]
+
+    # Decode files in parallel, then merge in file order
+    for seat_file, seats in load_json_files(batch_files, transform=seat_results).items():
+        all_seats.extend(seats)
+        print(f"   + {seat_file.name}: {len(seats)} seats")
 
     return all_seats
 
 
-def upload_seats_to_firestore(seats: list, batch_size: int = 500):
-    """Upload seat snapshots to Firestore in batches."""
+def load_checkpoint(checkpoint: Path | None) -> set[str]:
+    """Document IDs already committed by an earlier (partial) run."""
+    if checkpoint is None or not checkpoint.exists():
+        return set()
+    return set(checkpoint.read_text(encoding="utf-8").split())
+
+
+def upload_seats_to_firestore(
+    seats: list,
+    batch_size: int = 500,
+    workers: int = 4,
+    max_retries: int = 3,
+    checkpoint: Path | None = None,
+) -> bool:
+    """Upload seat snapshots to Firestore in parallel batches.
+
+    Document IDs come from the observation (see seat_snapshot_id), so
+    writes are idempotent. IDs of committed batches are appended to
+    `checkpoint`; a rerun skips them and only sends what is missing.
+    Daily rollups are incremented in the same commit, for new snapshots only.
+
+    Args:
+        seats: Seat snapshot records
+        batch_size: Writes per WriteBatch (max 500)
+        workers: Batches committed concurrently
+        max_retries: Retries per batch before it counts as failed
+        checkpoint: File recording committed document IDs (None: no resume)
+
+    Returns:
+        True if every batch was committed
+    """
     if not seats:
         print("ℹ️ No seats to upload")
-        return
+        return True
+
+    # Same ID means the same observation (e.g. listed in two files)
+    docs = {seat_snapshot_id(seat): seat for seat in seats}
+    committed = load_checkpoint(checkpoint)
+    pending = sorted(doc_id for doc_id in docs if doc_id not in committed)
+    if len(pending) < len(docs):
+        print(f"⏭️ Skipping {len(docs) - len(pending)} snapshots committed by an earlier run")
+    if not pending:
+        print("✅ All seat snapshots already uploaded")
+        return True
 
     db = get_firestore_client()
-    collection = db.collection("seat_snapshots")
-
-    print(f"📤 Uploading {len(seats)} seat snapshots to Firestore...")
-
-    uploaded = 0
-    for i in range(0, len(seats), batch_size):
-        batch = db.batch()
-        chunk = seats[i : i + batch_size]
+    rollups = db.collection(ROLLUP_COLLECTION)
+    chunks = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+    lock = threading.Lock()
+
+    def ref(doc_id: str) -> Any:
+        return db.collection(observations_path(partition_date(docs[doc_id]))).document(doc_id)
+
+    def commit(doc_ids: list[str]) -> int:
+        from google.api_core.exceptions import Conflict
+
+        new_ids = doc_ids
+        for attempt in range(max_retries + 1):
+            try:
+                batch = db.batch()
+                for doc_id in new_ids:
+                    batch.create(ref(doc_id), docs[doc_id])
+                for rollup_id, increments in rollup_increments(
+                    docs[doc_id] for doc_id in new_ids
+                ).items():
+                    batch.set(rollups.document(rollup_id), increments, merge=True)
+                if new_ids:
+                    batch.commit()
+                break
+            except Conflict:
+                # Stored by an earlier run without a checkpoint entry: skip
+                # those, so their seats are not added to the rollups again
+                refs = [ref(doc_id) for doc_id in new_ids]
+                stored = {doc.id for doc in db.get_all(refs) if doc.exists}
+                new_ids = [doc_id for doc_id in new_ids if doc_id not in stored]
+            except Exception:
+                if attempt == max_retries:
+                    raise
+                time.sleep(2**attempt)
+        else:
+            raise RuntimeError("snapshots kept conflicting with existing documents")
+
+        if checkpoint is not None:
+            with lock, open(checkpoint, "a", encoding="utf-8") as f:
+                f.write("\n".join(doc_ids) + "\n")
+        return len(doc_ids)
+
+    print(f"📤 Uploading {len(pending)} seat snapshots in {len(chunks)} batches...")
+    start = time.monotonic()
+    uploaded = failed = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(commit, chunk): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            try:
+                uploaded += future.result()
+                print(f"   Uploaded {uploaded}/{len(pending)}")
+            except Exception as e:
+                failed += len(futures[future])
+                print(f"   ❌ Batch of {len(futures[future])} failed: {e}")
+
+    seconds = time.monotonic() - start
+    rate = uploaded / seconds if seconds else 0.0
+    if failed:
+        print(f"❌ Uploaded {uploaded}, failed {failed} seat snapshots ({rate:.0f} docs/s)")
+        if checkpoint is not None:
+            print(f"   Rerun to resume; committed IDs are in {checkpoint}")
+        return False
+
+    print(
+        f"✅ Successfully uploaded {uploaded} seat snapshots in {seconds:.1f}s ({rate:.0f} docs/s)"
+    )
+    return True
 
-        for seat in chunk:
-            # Create document ID from showtime_id + snapshot_type + timestamp
-            doc_id = f"{seat.get('showtime_id')}_{seat.get('snapshot_type', 'unknown')}_{datetime.now().strftime('%H%M')}"
-            doc_ref = collection.document(doc_id)
-            batch.set(doc_ref, seat)
 
-        batch.commit()
-        uploaded += len(chunk)
-        print(f"   Uploaded {uploaded}/{len(seats)}")
-
-    print(f"✅ Successfully uploaded {len(seats)} seat snapshots")
+def main():
+    import argparse
 
+    parser = argparse.ArgumentParser(description="Upload seat snapshots to Firestore")
+    parser.add_argument("--data-dir", "-d", default="data", help="Data directory")
+    parser.add_argument("--workers", type=int, default=4, help="Batches committed concurrently")
+    parser.add_argument(
+        "--restart", action="store_true", help="Ignore the checkpoint and upload everything"
+    )
+    args = parser.parse_args()
 
-def main():
     print("\n" + "=" * 60)
     print("🪑 CineRadar Seat Data Upload")
     print("=" * 60 + "\n")
 
     # Merge batch files
-    seats = merge_seat_batches()
+    seats = merge_seat_batches(args.data_dir)
 
     if not seats:
         print("⚠️ No seat data found to upload")
@@ -99,10 +206,16 @@ def main():
 
     print(f"\n📊 Total seats to upload: {len(seats)}")
 
-    # Upload to Firestore
-    upload_seats_to_firestore(seats)
+    # Upload to Firestore, resuming from today's checkpoint
+    date_str = datetime.now().strftime("%Y-%m-%d")
+    checkpoint = Path(args.data_dir) / f"upload_seats_{date_str}.checkpoint"
+    if args.restart:
+        checkpoint.unlink(missing_ok=True)
+    success = upload_seats_to_firestore(seats, workers=args.workers, checkpoint=checkpoint)
 
     print("\n🏁 Done")
+    if not success:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
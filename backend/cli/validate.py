@@ -6,13 +6,18 @@ Validates scraped data before Firestore upload.
 Usage:
     python -m backend.cli.validate              # Validate today's data
     python -m backend.cli.validate --file X    # Validate specific file
+    python -m backend.cli.validate --sample 25 # Quick check of 25 movies
+    python -m backend.cli.validate --ignore-digest  # Revalidate even if merge did
+
+A file with a matching validation digest (written by merge_batches, see
+backend/infrastructure/storage/digest.py) is not schema-checked again;
+its stored report is used for the integrity checks.
 
 Exit codes:
     0 - Validation passed
     1 - Validation failed
 """
 
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -20,20 +25,32 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from pydantic import ValidationError
-
 
-def validate_daily_scrape(data_dir: str = "data", file_path: str | None = None) -> bool:
+def validate_daily_scrape(
+    data_dir: str = "data",
+    file_path: str | None = None,
+    sample: int | None = None,
+    use_digest: bool = True,
+) -> bool:
     """Validate a daily movie data file.
 
     Args:
         data_dir: Directory containing movie data files
         file_path: Optional specific file to validate
+        sample: Schema-check only this many movies (for data already
+            validated movie by movie during merge)
+        use_digest: Trust a validation digest that matches the file
 
     Returns:
         True if validation passed, False otherwise
     """
-    from backend.schemas.movie import DailySnapshotSchema
+    from backend.infrastructure.storage import (
+        find_artifact,
+        glob_artifacts,
+        load_digest,
+        read_bytes,
+    )
+    from backend.schemas.validator import SnapshotReport, validate_snapshot, validator_fingerprint
 
     data_path = Path(data_dir)
 
@@ -42,61 +59,52 @@ def validate_daily_scrape(data_dir: str = "data", file_path: str | None = None)
     else:
         # Find today's file
         today = datetime.now().strftime("%Y-%m-%d")
-        input_file = data_path / f"movies_{today}.json"
+        input_file = find_artifact(data_path, f"movies_{today}")
 
         # Fall back to latest if today's doesn't exist
-        if not input_file.exists():
-            movie_files = sorted(data_path.glob("movies_*.json"), reverse=True)
-            if movie_files:
-                input_file = movie_files[0]
+        if input_file is None:
+            movie_files = glob_artifacts(data_path, "movies_*")
+            input_file = movie_files[-1] if movie_files else data_path / f"movies_{today}.json"
 
     if not input_file.exists():
         print(f"❌ File not found: {input_file}")
         return False
 
-    print(f"📂 Validating: {input_file}")
-
-    try:
-        with open(input_file, encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        print(f"❌ Invalid JSON: {e}")
-        return False
+    cached = load_digest(input_file, validator_fingerprint()) if use_digest else None
+    if cached is not None:
+        print(f"📂 Validating: {input_file} (trusting validation digest)")
+        report = SnapshotReport.from_dict(cached)
+    else:
+        print(f"📂 Validating: {input_file}" + (f" (sample of {sample} movies)" if sample else ""))
+        # Schema validation and stats in one pass over the raw bytes
+        report = validate_snapshot(read_bytes(input_file), sample=sample)
 
-    # Schema validation
-    try:
-        validated = DailySnapshotSchema.model_validate(data)
-        print("✅ Schema validation PASSED")
-        print(f"   📅 Date: {validated.date}")
-        print(f"   🎬 Movies: {len(validated.movies)}")
-        print(f"   🏙️ Cities: {len(validated.city_stats)}")
-        print(f"   🎟️ Pre-sales: {validated.summary.presale_count}")
-    except ValidationError as e:
+    if not report.valid:
         print("❌ Schema validation FAILED:")
-        for error in e.errors():
-            loc = " → ".join(str(x) for x in error["loc"])
-            print(f"   {loc}: {error['msg']}")
+        for error in report.errors:
+            print(f"   {error}")
         return False
 
+    print("✅ Schema validation PASSED")
+    print(f"   📅 Date: {report.date}")
+    print(f"   🎬 Movies: {report.movies}")
+    print(f"   🏙️ Cities: {report.cities}")
+    print(f"   🎟️ Pre-sales: {report.presale_count}")
+
     # Integrity assertions
-    try:
-        validated.integrity_check(min_movies=10, min_cities=50)
-        print("✅ Integrity check PASSED")
-    except AssertionError as e:
-        print(f"❌ Integrity check FAILED: {e}")
+    integrity_errors = report.integrity_errors(min_movies=10, min_cities=50)
+    if integrity_errors:
+        print(f"❌ Integrity check FAILED: {'; '.join(integrity_errors)}")
         return False
+    print("✅ Integrity check PASSED")
 
     # Additional quality checks
-    movies_with_schedules = sum(1 for m in validated.movies if m.schedules)
-    merchants = set()
-    for m in validated.movies:
-        merchants.update(m.merchants)
-
-    print(f"   📊 Movies with schedules: {movies_with_schedules}")
-    print(f"   🏢 Merchants: {', '.join(sorted(merchants))}")
+    print(f"   📊 Movies with schedules: {report.movies_with_schedules}")
+    print(f"   🏢 Merchants: {', '.join(report.merchants)}")
+    print(f"   🎭 Theatres: {report.theatres}, showtimes: {report.showtimes}")
 
-    if movies_with_schedules < 5:
-        print(f"⚠️ Warning: Only {movies_with_schedules} movies have schedules")
+    if report.movies_with_schedules < 5:
+        print(f"⚠️ Warning: Only {report.movies_with_schedules} movies have schedules")
 
     return True
 
@@ -108,10 +116,21 @@ def main():
     parser = argparse.ArgumentParser(description="Validate CineRadar scraped data")
     parser.add_argument("--file", "-f", help="Specific file to validate")
     parser.add_argument("--data-dir", "-d", default="data", help="Data directory")
+    parser.add_argument(
+        "--sample", type=int, help="Schema-check only N movies (stats still cover all)"
+    )
+    parser.add_argument(
+        "--ignore-digest", action="store_true", help="Revalidate even if a digest matches"
+    )
 
     args = parser.parse_args()
 
-    success = validate_daily_scrape(data_dir=args.data_dir, file_path=args.file)
+    success = validate_daily_scrape(
+        data_dir=args.data_dir,
+        file_path=args.file,
+        sample=args.sample,
+        use_digest=not args.ignore_digest,
+    )
 
     if success:
         print("\n🎉 All validations passed!")
@@ -16,6 +16,7 @@ from backend.domain.errors import (
     FirestoreError,
     LoginFailedError,
     ScrapingError,
+    SQLiteError,
     StorageError,
     TokenExpiredError,
     ValidationError,
@@ -26,6 +27,7 @@ from backend.domain.models import (
     ScrapeResult,
     SeatOccupancy,
     Showtime,
+    ShowtimeIndex,
     Theatre,
     TheatreSchedule,
     Token,
@@ -41,6 +43,7 @@ __all__ = [
     "Token",
     "ScrapeResult",
     "SeatOccupancy",
+    "ShowtimeIndex",
     # Errors
     "CineRadarError",
     "ScrapingError",
@@ -50,4 +53,5 @@ __all__ = [
     "DataNotFoundError",
     "StorageError",
     "FirestoreError",
+    "SQLiteError",
 ]
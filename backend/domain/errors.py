@@ -193,6 +193,17 @@ class FileStorageError(StorageError):
     pass
 
 
+class SQLiteError(StorageError):
+    """Local SQLite database error.
+
+    Raised when:
+    - Database file cannot be opened or is locked
+    - Write transaction failed
+    """
+
+    pass
+
+
 # =============================================================================
 # Configuration Errors
 # =============================================================================
@@ -6,13 +6,22 @@ No external dependencies - these can be used anywhere.
 """
 
 from backend.domain.models.movie import (
+    MOVIE_FIELDS,
+    LazySchedules,
     Movie,
     Room,
     ScrapeResult,
     Showtime,
     TheatreSchedule,
+    movie_fields,
+)
+from backend.domain.models.seat import SeatGradeStats, SeatOccupancy, ShowtimeSummary
+from backend.domain.models.showtime_index import ShowtimeEntry, ShowtimeIndex
+from backend.domain.models.snapshot import (
+    NormalizedSnapshot,
+    denormalize_snapshot,
+    is_normalized,
 )
-from backend.domain.models.seat import SeatGradeStats, SeatOccupancy
 from backend.domain.models.theatre import Theatre
 from backend.domain.models.token import Token
 
@@ -21,9 +30,18 @@ __all__ = [
     "Room",
     "TheatreSchedule",
     "Movie",
+    "LazySchedules",
     "ScrapeResult",
+    "MOVIE_FIELDS",
+    "movie_fields",
     "Theatre",
     "Token",
     "SeatOccupancy",
     "SeatGradeStats",
+    "ShowtimeSummary",
+    "ShowtimeEntry",
+    "ShowtimeIndex",
+    "NormalizedSnapshot",
+    "denormalize_snapshot",
+    "is_normalized",
 ]
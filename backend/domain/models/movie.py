@@ -5,7 +5,8 @@ Core business entities for movies and showtimes.
 Pure Python dataclasses with no external dependencies.
 """
 
-from dataclasses import dataclass, field
+from collections.abc import Iterable, Iterator, MutableMapping
+from dataclasses import dataclass, field, fields, replace
 from typing import Any
 
 
@@ -176,6 +177,49 @@ class TheatreSchedule:
         )
 
 
+class LazySchedules(MutableMapping[str, list[TheatreSchedule]]):
+    """City -> theatre schedules, decoded from dicts one city at a time.
+
+    Movie.from_dict keeps a movie's raw schedules and only builds the
+    TheatreSchedule/Room/Showtime objects of a city when it is first read,
+    so callers that only need titles or cities never pay for them.
+    Behaves like a dict (equality, iteration, assignment).
+    """
+
+    def __init__(self, raw: dict[str, list[dict[str, Any]]] | None = None):
+        self._raw = dict(raw or {})
+        self._decoded: dict[str, list[TheatreSchedule]] = {}
+
+    def __getitem__(self, city: str) -> list[TheatreSchedule]:
+        if city not in self._decoded:
+            theatres = self._raw[city]  # KeyError for unknown cities, like a dict
+            self._decoded[city] = [TheatreSchedule.from_dict(t) for t in theatres]
+        return self._decoded[city]
+
+    def __setitem__(self, city: str, theatres: list[TheatreSchedule]) -> None:
+        self._raw[city] = []
+        self._decoded[city] = theatres
+
+    def __delitem__(self, city: str) -> None:
+        del self._raw[city]
+        self._decoded.pop(city, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        return f"LazySchedules({len(self._decoded)}/{len(self._raw)} cities decoded)"
+
+    def theatre_count(self, city: str) -> int:
+        """Theatres in a city, without decoding it."""
+        if city in self._decoded:
+            return len(self._decoded[city])
+        return len(self._raw[city])
+
+
 @dataclass
 class Movie:
     """A movie with all its schedules across cities.
@@ -211,11 +255,13 @@ class Movie:
     merchants: list[str] = field(default_factory=list)
     is_presale: bool = False
     cities: list[str] = field(default_factory=list)
-    schedules: dict[str, list[TheatreSchedule]] = field(default_factory=dict)
+    schedules: MutableMapping[str, list[TheatreSchedule]] = field(default_factory=dict)
 
     @property
     def total_theatres(self) -> int:
         """Total theatres showing this movie."""
+        if isinstance(self.schedules, LazySchedules):
+            return sum(self.schedules.theatre_count(city) for city in self.schedules)
         return sum(len(theatres) for theatres in self.schedules.values())
 
     @property
@@ -251,25 +297,43 @@ class Movie:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Movie":
-        """Create from dictionary."""
-        schedules = {}
-        for city, theatres in data.get("schedules", {}).items():
-            schedules[city] = [TheatreSchedule.from_dict(t) for t in theatres]
+        """Create from dictionary (schedules are decoded lazily, see LazySchedules).
 
+        `data` is not modified and no mutable part of it is shared, so one
+        dict can back several independent Movies.
+        """
         return cls(
             id=data.get("id", ""),
             title=data.get("title", ""),
-            genres=data.get("genres", []),
+            genres=list(data.get("genres", [])),
             poster=data.get("poster"),
             age_category=data.get("age_category"),
             country=data.get("country"),
-            merchants=data.get("merchants", []),
+            merchants=list(data.get("merchants", [])),
             is_presale=data.get("is_presale", False),
-            cities=data.get("cities", []),
-            schedules=schedules,
+            cities=list(data.get("cities", [])),
+            schedules=LazySchedules(data.get("schedules")),
         )
 
 
+MOVIE_FIELDS = tuple(f.name for f in fields(Movie))
+
+
+def movie_fields(names: Iterable[str] | None) -> frozenset[str] | None:
+    """Validate Movie field names for a projection (None means every field).
+
+    Raises:
+        ValueError: If a name is not a Movie field
+    """
+    if names is None:
+        return None
+    names = frozenset(names)
+    unknown = names.difference(MOVIE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown movie fields {sorted(unknown)}, expected {MOVIE_FIELDS}")
+    return names | {"id"}
+
+
 @dataclass
 class ScrapeResult:
     """Result of a scraping operation.
@@ -306,3 +370,38 @@ class ScrapeResult:
             },
             "movies": [m.to_dict() for m in self.movies],
         }
+
+    def select(
+        self, fields: Iterable[str] | None = None, cities: Iterable[str] | None = None
+    ) -> "ScrapeResult":
+        """A projection of this snapshot (the movies list is new, movies may be shared).
+
+        Args:
+            fields: Movie fields to keep; the rest get their defaults and
+                "id" is always kept (all fields if None)
+            cities: Only movies showing in one of these cities, with only
+                their schedules (all cities if None)
+
+        Returns:
+            ScrapeResult with the selected movies
+        """
+        names = movie_fields(fields)
+        movies = self.movies
+        if cities is not None:
+            cities = [city.upper() for city in cities]
+            movies = [
+                replace(
+                    m,
+                    schedules={
+                        c: m.get_schedules_for_city(c) for c in cities if m.is_showing_in(c)
+                    },
+                )
+                for m in movies
+                if any(m.is_showing_in(c) for c in cities)
+            ]
+        if names is not None:
+            movies = [
+                replace(Movie(id=m.id, title=""), **{name: getattr(m, name) for name in names})
+                for m in movies
+            ]
+        return replace(self, movies=list(movies))
@@ -4,7 +4,9 @@ Seat Occupancy Domain Model
 Represents seat availability data for a showtime.
 """
 
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
 from typing import Any
 
 
@@ -42,6 +44,7 @@ class SeatOccupancy:
         showtime: Time string (HH:MM)
         date: Date of showtime
         scraped_at: When occupancy was captured
+        snapshot_type: Capture that produced it (morning, final, ...)
         total_seats: Total seating capacity
         sold_seats: Number of sold/booked seats
         available_seats: Number of available seats
@@ -71,6 +74,7 @@ class SeatOccupancy:
     showtime: str | None = None
     date: str | None = None
     scraped_at: str | None = None
+    snapshot_type: str | None = None
     total_seats: int = 0
     sold_seats: int = 0
     available_seats: int = 0
@@ -124,6 +128,7 @@ class SeatOccupancy:
             "showtime": self.showtime,
             "date": self.date,
             "scraped_at": self.scraped_at,
+            "snapshot_type": self.snapshot_type,
             "total_seats": self.total_seats,
             "sold_seats": self.sold_seats,
             "available_seats": self.available_seats,
@@ -158,6 +163,7 @@ class SeatOccupancy:
             showtime=data.get("showtime"),
             date=data.get("date"),
             scraped_at=data.get("scraped_at"),
+            snapshot_type=data.get("snapshot_type"),
             total_seats=data.get("total_seats", 0),
             sold_seats=data.get("sold_seats", 0),
             available_seats=data.get("available_seats", 0),
@@ -165,3 +171,146 @@ class SeatOccupancy:
             seat_grades=seat_grades,
             layout=data.get("layout", []),
         )
+
+
+# Points in a ShowtimeSummary's sell curve
+CURVE_POINTS = 12
+
+
+def observed_at(observation: dict[str, Any]) -> str:
+    """When an observation was taken (seat snapshots: scraped_at, JIT lines: timestamp)."""
+    return observation.get("scraped_at") or observation.get("timestamp") or ""
+
+
+@dataclass
+class ShowtimeSummary:
+    """Compact record of every seat observation of one showtime.
+
+    Replaces raw observations once they are old enough to be compacted.
+
+    Attributes:
+        showtime_id: TIX.id showtime identifier
+        date: Showtime date
+        observations: Number of observations summarised
+        first_seen / last_seen: Times of the first and last observation
+        total_seats: Largest capacity observed
+        peak_sold / peak_at: Most seats sold and when
+        final_sold / final_occupancy_pct: From the final snap if there was
+            one, else the last observation
+        curve: Seats sold at `len(curve)` evenly spaced points from
+            first_seen to last_seen (latest observation at or before each)
+
+    Example:
+        >>> summary = ShowtimeSummary.from_observations(observations)
+        >>> summary.peak_sold, summary.curve
+    """
+
+    showtime_id: str
+    date: str | None = None
+    movie_id: str | None = None
+    movie_title: str | None = None
+    theatre_id: str | None = None
+    theatre_name: str | None = None
+    city: str | None = None
+    merchant: str | None = None
+    showtime: str | None = None
+    observations: int = 0
+    first_seen: str = ""
+    last_seen: str = ""
+    total_seats: int = 0
+    peak_sold: int = 0
+    peak_at: str = ""
+    final_sold: int = 0
+    final_occupancy_pct: float = 0.0
+    curve: list[int] = field(default_factory=list)
+
+    @classmethod
+    def from_observations(
+        cls, observations: list[dict[str, Any]], points: int = CURVE_POINTS
+    ) -> "ShowtimeSummary":
+        """Summarise raw observations (seat snapshot dicts or JIT lines) of one showtime."""
+        ordered = sorted(observations, key=observed_at)
+        first, last = ordered[0], ordered[-1]
+
+        def pick(*keys: str) -> Any:
+            # Latest non-empty value; JIT lines name fields differently
+            for obs in reversed(ordered):
+                for key in keys:
+                    if obs.get(key):
+                        return obs[key]
+            return None
+
+        def sold(obs: dict[str, Any]) -> int:
+            return obs.get("sold_seats", obs.get("unavailable_seats", 0)) or 0
+
+        peak = max(ordered, key=sold)
+        finals = [obs for obs in ordered if obs.get("snapshot_type") == "final"]
+        final = finals[-1] if finals else last
+        total_seats = max((obs.get("total_seats", 0) or 0) for obs in ordered)
+
+        return cls(
+            showtime_id=str(first.get("showtime_id", "")),
+            date=pick("date"),
+            movie_id=pick("movie_id"),
+            movie_title=pick("movie_title", "movie"),
+            theatre_id=pick("theatre_id"),
+            theatre_name=pick("theatre_name", "theatre"),
+            city=pick("city"),
+            merchant=pick("merchant"),
+            showtime=pick("showtime"),
+            observations=len(ordered),
+            first_seen=observed_at(first),
+            last_seen=observed_at(last),
+            total_seats=total_seats,
+            peak_sold=sold(peak),
+            peak_at=observed_at(peak),
+            final_sold=sold(final),
+            final_occupancy_pct=(
+                round(sold(final) / final["total_seats"] * 100, 1)
+                if final.get("total_seats")
+                else 0.0
+            ),
+            curve=_sell_curve(ordered, sold, points),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ShowtimeSummary":
+        """Create from dictionary."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+
+def _sell_curve(
+    ordered: list[dict[str, Any]], sold: Callable[[dict[str, Any]], int], points: int
+) -> list[int]:
+    """Seats sold at evenly spaced times (step function over the observations)."""
+    flat = [sold(ordered[-1])] * max(points, 1)
+    times: list[float] = []
+    for obs in ordered:
+        seconds = _seconds(observed_at(obs))
+        if seconds is None:
+            return flat
+        times.append(seconds)
+    if points < 2 or times[0] == times[-1]:
+        return flat
+
+    curve = []
+    i = 0
+    step = (times[-1] - times[0]) / (points - 1)
+    for n in range(points):
+        t = times[0] + n * step
+        while i + 1 < len(times) and times[i + 1] <= t + 1e-6:
+            i += 1
+        curve.append(sold(ordered[i]))
+    return curve
+
+
+def _seconds(timestamp: str) -> float | None:
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except ValueError:
+        return None
@@ -0,0 +1,250 @@
+"""
+Showtime Index Domain Model
+
+A flat, time-sorted view of every showtime in a daily snapshot.
+Built once at merge time so seat scrapers don't re-walk the nested
+movie -> city -> theatre -> room -> showtime structure.
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Any
+
+from backend.domain.models.movie import Movie
+from backend.domain.models.snapshot import NormalizedSnapshot, is_normalized
+
+INDEX_VERSION = 1
+
+# String columns are dictionary-encoded against a shared string table
+_STRING_COLUMNS = (
+    "merchant",
+    "theatre_id",
+    "theatre_name",
+    "movie_id",
+    "movie_title",
+    "city",
+    "room",
+)
+
+
+def parse_minutes(time_str: str) -> int | None:
+    """Convert HH:MM to minutes since midnight (None if unparseable)."""
+    try:
+        hours, minutes = time_str.split(":")
+        return int(hours) * 60 + int(minutes)
+    except (AttributeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class ShowtimeEntry:
+    """One row of the showtime index."""
+
+    showtime_id: str
+    minutes: int
+    merchant: str
+    theatre_id: str
+    theatre_name: str
+    movie_id: str
+    movie_title: str
+    city: str
+    room: str
+    is_available: bool = True
+
+    @property
+    def time(self) -> str:
+        """Showtime as HH:MM."""
+        return f"{self.minutes // 60:02d}:{self.minutes % 60:02d}"
+
+    def to_dict(self, date: str | None = None) -> dict[str, Any]:
+        """Convert to the showtime-info dict used by the seat scrapers."""
+        return {
+            "showtime_id": self.showtime_id,
+            "showtime": self.time,
+            "movie_id": self.movie_id,
+            "movie_title": self.movie_title,
+            "theatre_id": self.theatre_id,
+            "theatre_name": self.theatre_name,
+            "merchant": self.merchant,
+            "room_name": self.room,
+            "city": self.city,
+            "date": date,
+        }
+
+
+@dataclass
+class ShowtimeIndex:
+    """Showtimes for one day, sorted by (minutes, showtime_id).
+
+    Example:
+        >>> index = ShowtimeIndex.from_snapshot(data)
+        >>> upcoming = index.window(19 * 60, 19 * 60 + 20)
+        >>> jakarta = [e for e in upcoming if e.city == "JAKARTA"]
+    """
+
+    date: str
+    entries: list[ShowtimeEntry] = field(default_factory=list)
+    _minutes: list[int] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.entries.sort(key=lambda e: (e.minutes, e.showtime_id))
+        self._minutes = [e.minutes for e in self.entries]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def window(self, start_minutes: int, end_minutes: int) -> list[ShowtimeEntry]:
+        """Showtimes starting within [start_minutes, end_minutes] (binary search)."""
+        lo = bisect_left(self._minutes, start_minutes)
+        hi = bisect_right(self._minutes, end_minutes)
+        return self.entries[lo:hi]
+
+    def after(self, minutes: int) -> list[ShowtimeEntry]:
+        """Showtimes starting strictly after `minutes`."""
+        return self.entries[bisect_right(self._minutes, minutes) :]
+
+    def filter(
+        self,
+        city: str | None = None,
+        movie_title: str | None = None,
+        available_only: bool = False,
+        entries: list[ShowtimeEntry] | None = None,
+    ) -> list[ShowtimeEntry]:
+        """Filter entries by city (exact, case-insensitive) and title (substring)."""
+        city_upper = city.upper() if city else None
+        title_lower = movie_title.lower() if movie_title else None
+
+        return [
+            e
+            for e in (self.entries if entries is None else entries)
+            if (city_upper is None or e.city.upper() == city_upper)
+            and (title_lower is None or title_lower in e.movie_title.lower())
+            and (not available_only or e.is_available)
+        ]
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def entries_from_movie_dict(movie: dict[str, Any]) -> list[ShowtimeEntry]:
+        """Flatten one raw movie dict (as stored in movies_*.json)."""
+        entries = []
+        movie_id = str(movie.get("id") or movie.get("movie_id") or "")
+        movie_title = movie.get("title", "")
+
+        for city, theatres in movie.get("schedules", {}).items():
+            for theatre in theatres:
+                for room in theatre.get("rooms", []):
+                    room_name = room.get("category", room.get("room_name", ""))
+                    for st in room.get("all_showtimes", []):
+                        if not isinstance(st, dict) or not st.get("showtime_id"):
+                            continue
+                        minutes = parse_minutes(st.get("time", ""))
+                        if minutes is None:
+                            continue
+                        entries.append(
+                            ShowtimeEntry(
+                                showtime_id=str(st["showtime_id"]),
+                                minutes=minutes,
+                                merchant=theatre.get("merchant") or "",
+                                theatre_id=str(theatre.get("theatre_id") or ""),
+                                theatre_name=theatre.get("theatre_name") or "",
+                                movie_id=movie_id,
+                                movie_title=movie_title,
+                                city=city,
+                                room=room_name or "",
+                                is_available=st.get("is_available", True),
+                            )
+                        )
+
+        return entries
+
+    @classmethod
+    def from_snapshot(cls, data: dict[str, Any]) -> "ShowtimeIndex":
+        """Build from a raw daily snapshot dict (nested or normalized)."""
+        entries: list[ShowtimeEntry] = []
+        if is_normalized(data):
+            snapshot = NormalizedSnapshot.from_dict(data)
+            for movie in snapshot.movies:
+                entries.extend(cls.entries_from_movie_dict(snapshot.denormalize_movie(movie)))
+        else:
+            for movie in data.get("movies", []):
+                entries.extend(cls.entries_from_movie_dict(movie))
+        return cls(date=data.get("date", ""), entries=entries)
+
+    @classmethod
+    def from_movies(cls, movies: list[Movie], date: str) -> "ShowtimeIndex":
+        """Build from Movie domain objects."""
+        entries = []
+        for movie in movies:
+            for city, schedules in movie.schedules.items():
+                for schedule in schedules:
+                    for room in schedule.rooms:
+                        for st in room.showtimes:
+                            minutes = parse_minutes(st.time)
+                            if not st.showtime_id or minutes is None:
+                                continue
+                            entries.append(
+                                ShowtimeEntry(
+                                    showtime_id=st.showtime_id,
+                                    minutes=minutes,
+                                    merchant=schedule.merchant,
+                                    theatre_id=schedule.theatre_id,
+                                    theatre_name=schedule.theatre_name,
+                                    movie_id=movie.id,
+                                    movie_title=movie.title,
+                                    city=city,
+                                    room=room.category,
+                                    is_available=st.is_available,
+                                )
+                            )
+        return cls(date=date, entries=entries)
+
+    # ------------------------------------------------------------------
+    # Serialization (columnar, dictionary-encoded strings)
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a compact columnar dict for storage."""
+        strings: list[str] = []
+        codes: dict[str, int] = {}
+
+        def encode(value: str) -> int:
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(strings)
+                strings.append(value)
+            return code
+
+        columns: dict[str, list[Any]] = {
+            "showtime_id": [e.showtime_id for e in self.entries],
+            "minutes": self._minutes,
+            "available": [int(e.is_available) for e in self.entries],
+        }
+        for name in _STRING_COLUMNS:
+            columns[name] = [encode(getattr(e, name)) for e in self.entries]
+
+        return {
+            "version": INDEX_VERSION,
+            "date": self.date,
+            "count": len(self.entries),
+            "strings": strings,
+            "columns": columns,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ShowtimeIndex":
+        """Create from a columnar dict produced by to_dict()."""
+        strings = data.get("strings", [])
+        columns = data.get("columns", {})
+
+        # Column order matches ShowtimeEntry's field order
+        rows = zip(
+            columns.get("showtime_id", []),
+            columns.get("minutes", []),
+            *([strings[c] for c in columns.get(name, [])] for name in _STRING_COLUMNS),
+            (bool(a) for a in columns.get("available", [])),
+            strict=False,
+        )
+        return cls(date=data.get("date", ""), entries=[ShowtimeEntry(*row) for row in rows])
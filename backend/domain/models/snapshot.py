@@ -0,0 +1,203 @@
+"""
+Normalized Snapshot Domain Model
+
+The nested movies_*.json layout repeats a theatre's name, merchant and
+address under every movie that plays there. The normalized layout stores
+each theatre once in a top-level `theatres` table and has schedules refer
+to it by `theatre_id`:
+
+    {
+        "format": "normalized", "version": 1,
+        "scraped_at": ..., "date": ..., "summary": ...,
+        "theatres": [{"theatre_id": "9001", "city": "JAKARTA",
+                      "theatre_name": ..., "merchant": ..., "address": ...,
+                      "room_types": ["2D", "IMAX"]}, ...],
+        "movies": [{"id": ..., "schedules": {"JAKARTA": [
+            {"theatre_id": "9001", "rooms": [...]}, ...]}}, ...],
+        "city_stats": {...}
+    }
+
+The first schedule seen for a theatre supplies its table row; a later
+schedule whose theatre fields differ keeps just those fields inline, so
+rebuilding the nested shape keeps every value.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+SNAPSHOT_FORMAT = "normalized"
+SNAPSHOT_VERSION = 1
+
+# Table columns derived from the snapshot rather than copied from schedules
+_TABLE_ONLY_KEYS = ("city", "room_types")
+
+
+def is_normalized(data: dict[str, Any]) -> bool:
+    """True if `data` is a normalized snapshot."""
+    return data.get("format") == SNAPSHOT_FORMAT
+
+
+def _theatre_fields(schedule: dict[str, Any]) -> dict[str, Any]:
+    """Theatre-level fields of a schedule entry (everything except rooms)."""
+    return {k: v for k, v in schedule.items() if k not in ("theatre_id", "rooms")}
+
+
+@dataclass
+class NormalizedSnapshot:
+    """A daily snapshot with theatres stored once and referenced by id.
+
+    Example:
+        >>> snapshot = NormalizedSnapshot.from_snapshot(data)
+        >>> len(snapshot.theatres)
+        412
+        >>> nested = snapshot.to_snapshot()  # same shape as movies_*.json
+    """
+
+    header: dict[str, Any] = field(default_factory=dict)
+    theatres: dict[str, dict[str, Any]] = field(default_factory=dict)
+    movies: list[dict[str, Any]] = field(default_factory=list)
+
+    # ------------------------------------------------------------------
+    # Normalizing
+    # ------------------------------------------------------------------
+
+    def add_movie(self, movie: dict[str, Any]) -> dict[str, Any]:
+        """Normalize one nested movie dict, adding its theatres to the table.
+
+        Returns:
+            The normalized movie (also appended to `movies`)
+        """
+        normalized = self.normalize_movie(movie)
+        self.movies.append(normalized)
+        return normalized
+
+    def normalize_movie(self, movie: dict[str, Any]) -> dict[str, Any]:
+        """Normalize one nested movie dict without storing it."""
+        if "schedules" not in movie:
+            return dict(movie)
+
+        schedules = {}
+        for city, city_schedules in movie["schedules"].items():
+            refs = []
+            for schedule in city_schedules:
+                theatre_id = schedule.get("theatre_id")
+                if not theatre_id:
+                    # Nothing to reference: keep the entry as-is
+                    refs.append(schedule)
+                    continue
+
+                theatre_id = str(theatre_id)
+                fields = _theatre_fields(schedule)
+                row = self.theatres.get(theatre_id)
+                if row is None:
+                    row = {"theatre_id": theatre_id, "city": city, **fields, "room_types": []}
+                    self.theatres[theatre_id] = row
+
+                ref: dict[str, Any] = {"theatre_id": schedule["theatre_id"]}
+                ref.update({k: v for k, v in fields.items() if row.get(k) != v or k not in row})
+                if "rooms" in schedule:
+                    ref["rooms"] = schedule["rooms"]
+                    for room in schedule["rooms"]:
+                        category = room.get("category")
+                        if category and category not in row["room_types"]:
+                            row["room_types"].append(category)
+                refs.append(ref)
+            schedules[city] = refs
+
+        return {**movie, "schedules": schedules}
+
+    @classmethod
+    def from_snapshot(cls, data: dict[str, Any]) -> "NormalizedSnapshot":
+        """Normalize a nested snapshot dict (as stored in movies_*.json)."""
+        if is_normalized(data):
+            return cls.from_dict(data)
+
+        snapshot = cls(header={k: v for k, v in data.items() if k != "movies"})
+        for movie in data.get("movies", []):
+            snapshot.add_movie(movie)
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # Rebuilding the nested shape
+    # ------------------------------------------------------------------
+
+    def denormalize_movie(self, movie: dict[str, Any]) -> dict[str, Any]:
+        """Rebuild the nested `schedules` of one normalized movie."""
+        if "schedules" not in movie:
+            return dict(movie)
+
+        schedules = {}
+        for city, refs in movie["schedules"].items():
+            entries = []
+            for ref in refs:
+                row = self.theatres.get(str(ref.get("theatre_id")))
+                if row is None:
+                    entries.append(ref)
+                    continue
+                entry = {"theatre_id": ref["theatre_id"]}
+                entry.update(
+                    (k, v) for k, v in row.items() if k not in ("theatre_id", *_TABLE_ONLY_KEYS)
+                )
+                entry.update(ref)
+                # Rooms always last, as the scraper writes them
+                if "rooms" in entry:
+                    entry["rooms"] = entry.pop("rooms")
+                entries.append(entry)
+            schedules[city] = entries
+
+        return {**movie, "schedules": schedules}
+
+    def to_snapshot(self) -> dict[str, Any]:
+        """Rebuild the nested snapshot dict (movies_*.json shape)."""
+        data = {k: v for k, v in self.header.items() if k != "city_stats"}
+        data["movies"] = [self.denormalize_movie(m) for m in self.movies]
+        if "city_stats" in self.header:
+            data["city_stats"] = self.header["city_stats"]
+        return data
+
+    def theatre_list(self) -> list[dict[str, Any]]:
+        """Deduplicated theatre rows, sorted by city then id."""
+        return sorted(self.theatres.values(), key=lambda t: (t.get("city", ""), t["theatre_id"]))
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def header_dict(self) -> dict[str, Any]:
+        """Fields written before the theatres and movies tables."""
+        header = {"format": SNAPSHOT_FORMAT, "version": SNAPSHOT_VERSION}
+        header.update((k, v) for k, v in self.header.items() if k != "city_stats")
+        return header
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the normalized JSON layout."""
+        data = self.header_dict()
+        data["theatres"] = self.theatre_list()
+        data["movies"] = self.movies
+        if "city_stats" in self.header:
+            data["city_stats"] = self.header["city_stats"]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "NormalizedSnapshot":
+        """Create from the normalized JSON layout."""
+        version = data.get("version")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported normalized snapshot version: {version}")
+
+        return cls(
+            header={
+                k: v
+                for k, v in data.items()
+                if k not in ("format", "version", "theatres", "movies")
+            },
+            theatres={str(t["theatre_id"]): t for t in data.get("theatres", [])},
+            movies=data.get("movies", []),
+        )
+
+
+def denormalize_snapshot(data: dict[str, Any]) -> dict[str, Any]:
+    """Return `data` in the nested movies_*.json shape, whichever layout it uses."""
+    if not is_normalized(data):
+        return data
+    return NormalizedSnapshot.from_dict(data).to_snapshot()
@@ -0,0 +1,30 @@
+"""
+Analytics Package
+
+Columnar seat occupancy cube for local group-by queries (needs numpy, the
+`analytics` extra).
+"""
+
+from backend.infrastructure.analytics.cube import (
+    DIMENSIONS,
+    MEASURES,
+    GroupResult,
+    OccupancyCube,
+)
+from backend.infrastructure.analytics.store import (
+    CUBE_DIR,
+    build_shards,
+    cube_sources,
+    load_cube,
+)
+
+__all__ = [
+    "CUBE_DIR",
+    "DIMENSIONS",
+    "MEASURES",
+    "GroupResult",
+    "OccupancyCube",
+    "build_shards",
+    "cube_sources",
+    "load_cube",
+]
@@ -0,0 +1,415 @@
+"""
+Occupancy Cube
+
+Seat observations as NumPy columns, for group-by analytics without
+Python loops over dicts.
+
+Each observation is one row. Categorical dimensions (date, movie, city,
+...) are int32 codes into a per-dimension category list; hour is a small
+integer (-1 if unknown); measures are integer columns. A movie has several
+genres, so genres are kept per movie (CSR offsets into a genre list) and
+rows are only expanded when a query groups or filters by genre.
+
+Group-by combines the codes of the requested dimensions into one key per
+row (np.ravel_multi_index) and sums each measure with np.bincount, so a
+query costs a few passes over the columns whatever the number of groups.
+
+Cubes are saved as .npz shards (one per source file) and concatenated on
+load; concatenation only remaps category codes, never rows one by one.
+
+Usage:
+    cube = OccupancyCube.from_records(seats, movie_genres)
+    cube.save("data/cube/seats_morning_2026-10-18.npz")
+
+    cube = OccupancyCube.concat([OccupancyCube.load(p) for p in shards])
+    result = cube.where(snapshot_type=["final"]).group_by(["genre", "city"])
+    for row in result.rows(sort="sold", limit=10):
+        print(row)
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+# Dimensions stored as codes into a category list
+CATEGORICAL = ("date", "movie", "city", "merchant", "theatre", "room", "snapshot_type")
+
+# All dimensions a query can group or filter by
+DIMENSIONS = (*CATEGORICAL, "weekday", "hour", "genre")
+
+# Summable integer columns
+MEASURES = ("sold", "seats", "available")
+
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+UNKNOWN = ""
+
+# Record field each categorical dimension is read from
+_RECORD_FIELDS = {
+    "date": "date",
+    "movie": "movie_id",
+    "city": "city",
+    "merchant": "merchant",
+    "theatre": "theatre_id",
+    "room": "room_category",
+    "snapshot_type": "snapshot_type",
+}
+
+
+def _record_date(record: dict[str, Any]) -> str:
+    return record.get("date") or (record.get("scraped_at") or "")[:10]
+
+
+def _hour(showtime: Any) -> int:
+    text = str(showtime or "")
+    return int(text[:2]) if text[:2].isdigit() else -1
+
+
+@dataclass
+class GroupResult:
+    """Aggregates per group of a group_by() query."""
+
+    dims: list[str]
+    keys: dict[str, list[str]]  # dimension -> label per group
+    count: np.ndarray  # observations per group
+    sums: dict[str, np.ndarray]  # measure -> sum per group
+
+    def __len__(self) -> int:
+        return len(self.count)
+
+    def mean(self, measure: str) -> np.ndarray:
+        """Mean of a measure per group."""
+        return self.sums[measure] / np.maximum(self.count, 1)
+
+    @property
+    def occupancy_pct(self) -> np.ndarray:
+        """Seats sold as a share of capacity per group (capacity-weighted)."""
+        return np.round(self.sums["sold"] / np.maximum(self.sums["seats"], 1) * 100, 1)
+
+    def rows(self, sort: str | None = "sold", limit: int | None = None) -> list[dict[str, Any]]:
+        """Groups as dicts, largest `sort` first (a measure, "count" or "occupancy_pct")."""
+        order = np.arange(len(self))
+        if sort == "count":
+            order = np.argsort(-self.count, kind="stable")
+        elif sort == "occupancy_pct":
+            order = np.argsort(-self.occupancy_pct, kind="stable")
+        elif sort in self.sums:
+            order = np.argsort(-self.sums[sort], kind="stable")
+        if limit is not None:
+            order = order[:limit]
+
+        occupancy = self.occupancy_pct
+        return [
+            {
+                **{dim: self.keys[dim][i] for dim in self.dims},
+                "count": int(self.count[i]),
+                **{name: int(values[i]) for name, values in self.sums.items()},
+                "occupancy_pct": float(occupancy[i]),
+            }
+            for i in order
+        ]
+
+
+@dataclass
+class OccupancyCube:
+    """Seat observations in columnar form."""
+
+    codes: dict[str, np.ndarray]  # categorical dimension -> integer codes
+    categories: dict[str, list[str]]  # categorical dimension -> labels
+    hour: np.ndarray  # int8, -1 if unknown
+    measures: dict[str, np.ndarray]  # measure -> int32 values
+    genre_offsets: np.ndarray = field(default_factory=lambda: np.zeros(1, np.int64))
+    genre_codes: np.ndarray = field(default_factory=lambda: np.zeros(0, np.int32))
+    genres: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.hour)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[dict[str, Any]],
+        movie_genres: dict[str, list[str]] | None = None,
+    ) -> "OccupancyCube":
+        """Build from seat observation dicts.
+
+        Args:
+            records: Seat snapshot dicts (upload_seats / final snap shape)
+            movie_genres: Genres by movie id (e.g. from movies_{date}.json)
+        """
+        lookups: dict[str, dict[str, int]] = {dim: {} for dim in CATEGORICAL}
+        columns: dict[str, list[int]] = {dim: [] for dim in CATEGORICAL}
+        hours: list[int] = []
+        values: dict[str, list[int]] = {name: [] for name in MEASURES}
+
+        for record in records:
+            for dim in CATEGORICAL:
+                if dim == "date":
+                    label = _record_date(record)
+                else:
+                    label = str(record.get(_RECORD_FIELDS[dim]) or UNKNOWN)
+                lookup = lookups[dim]
+                columns[dim].append(lookup.setdefault(label, len(lookup)))
+            hours.append(_hour(record.get("showtime")))
+            values["sold"].append(record.get("sold_seats", record.get("unavailable_seats", 0)) or 0)
+            values["seats"].append(record.get("total_seats", 0) or 0)
+            values["available"].append(record.get("available_seats", 0) or 0)
+
+        cube = cls(
+            codes={dim: np.asarray(columns[dim], np.int32) for dim in CATEGORICAL},
+            categories={dim: list(lookups[dim]) for dim in CATEGORICAL},
+            hour=np.asarray(hours, np.int8),
+            measures={name: np.asarray(values[name], np.int32) for name in MEASURES},
+        )
+        cube._set_genres(movie_genres or {})
+        return cube
+
+    def _set_genres(self, movie_genres: dict[str, list[str]]) -> None:
+        """Genre CSR for this cube's movie categories."""
+        genre_lookup: dict[str, int] = {}
+        offsets = [0]
+        codes: list[int] = []
+        for movie_id in self.categories["movie"]:
+            for genre in movie_genres.get(movie_id) or [UNKNOWN]:
+                codes.append(genre_lookup.setdefault(genre, len(genre_lookup)))
+            offsets.append(len(codes))
+        self.genre_offsets = np.asarray(offsets, np.int64)
+        self.genre_codes = np.asarray(codes, np.int32)
+        self.genres = list(genre_lookup)
+
+    def _movie_genres(self) -> dict[str, list[str]]:
+        return {
+            movie_id: [
+                self.genres[c]
+                for c in self.genre_codes[self.genre_offsets[i] : self.genre_offsets[i + 1]]
+            ]
+            for i, movie_id in enumerate(self.categories["movie"])
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: str | Path) -> Path:
+        """Write the cube as an .npz shard (atomically)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays: dict[str, np.ndarray] = {"hour": self.hour}
+        for dim in CATEGORICAL:
+            # Codes take the smallest unsigned type their category count allows
+            dtype = np.min_scalar_type(max(len(self.categories[dim]) - 1, 0))
+            arrays[f"code_{dim}"] = self.codes[dim].astype(dtype)
+            arrays[f"cat_{dim}"] = np.asarray(self.categories[dim], dtype=str)
+        for name in MEASURES:
+            arrays[f"measure_{name}"] = self.measures[name].astype(np.int32)
+        arrays["genre_offsets"] = self.genre_offsets
+        arrays["genre_codes"] = self.genre_codes
+        arrays["genres"] = np.asarray(self.genres, dtype=str)
+
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        tmp_path.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "OccupancyCube":
+        """Read a shard written by save()."""
+        with np.load(path) as data:
+            return cls(
+                codes={dim: data[f"code_{dim}"] for dim in CATEGORICAL},
+                categories={dim: data[f"cat_{dim}"].tolist() for dim in CATEGORICAL},
+                hour=data["hour"],
+                measures={name: data[f"measure_{name}"] for name in MEASURES},
+                genre_offsets=data["genre_offsets"],
+                genre_codes=data["genre_codes"],
+                genres=data["genres"].tolist(),
+            )
+
+    @staticmethod
+    def dates(path: str | Path) -> list[str]:
+        """Dates a shard holds, without loading its columns."""
+        with np.load(path) as data:
+            return data["cat_date"].tolist()
+
+    @classmethod
+    def concat(cls, cubes: Sequence["OccupancyCube"]) -> "OccupancyCube":
+        """Combine cubes, remapping each one's codes onto shared categories."""
+        cubes = [cube for cube in cubes if len(cube)]
+        if not cubes:
+            return cls.from_records([])
+        if len(cubes) == 1:
+            return cubes[0]
+
+        bounds = np.cumsum([0, *(len(cube) for cube in cubes)])
+        categories: dict[str, list[str]] = {}
+        codes: dict[str, np.ndarray] = {}
+        for dim in CATEGORICAL:
+            lookup: dict[str, int] = {}
+            column = np.empty(bounds[-1], np.int32)
+            for cube, start, end in zip(cubes, bounds, bounds[1:], strict=False):
+                remap = np.asarray(
+                    [lookup.setdefault(label, len(lookup)) for label in cube.categories[dim]],
+                    np.int32,
+                )
+                np.take(remap, cube.codes[dim], out=column[start:end])
+            categories[dim] = list(lookup)
+            codes[dim] = column
+
+        # A movie keeps the genres of the latest shard that lists it
+        movie_genres: dict[str, list[str]] = {}
+        for cube in cubes:
+            movie_genres.update({m: g for m, g in cube._movie_genres().items() if g != [UNKNOWN]})
+
+        cube = cls(
+            codes=codes,
+            categories=categories,
+            hour=np.concatenate([c.hour for c in cubes]),
+            measures={name: np.concatenate([c.measures[name] for c in cubes]) for name in MEASURES},
+        )
+        cube._set_genres(movie_genres)
+        return cube
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _weekday_codes(self) -> np.ndarray:
+        """Weekday (0 = Monday, 7 = unknown) per row, computed per date category."""
+        per_date = np.asarray(
+            [date.fromisoformat(d).weekday() if d else 7 for d in self.categories["date"]],
+            np.int32,
+        )
+        return per_date[self.codes["date"]]
+
+    def _dimension(self, dim: str) -> tuple[np.ndarray, list[str]]:
+        """(codes per row, labels) for a non-genre dimension."""
+        if dim in CATEGORICAL:
+            return self.codes[dim], self.categories[dim]
+        if dim == "weekday":
+            return self._weekday_codes(), [*WEEKDAYS, UNKNOWN]
+        if dim == "hour":
+            return self.hour.astype(np.int32) + 1, [UNKNOWN] + [f"{h:02d}" for h in range(24)]
+        raise ValueError(f"Unknown dimension '{dim}' (choose from {', '.join(DIMENSIONS)})")
+
+    def _expand_genres(self) -> tuple[np.ndarray, np.ndarray]:
+        """(row index, genre code) with one entry per row and genre of its movie."""
+        movie = self.codes["movie"]
+        per_movie = np.diff(self.genre_offsets)
+        rows, genres = [], []
+        # One pass per genre slot (movies have a handful), each a gather
+        for slot in range(int(per_movie.max(initial=0))):
+            has_slot = np.flatnonzero(per_movie > slot)
+            lookup = np.full(len(per_movie), -1, np.int32)
+            lookup[has_slot] = self.genre_codes[self.genre_offsets[has_slot] + slot]
+            genre = lookup[movie]
+            hit = np.flatnonzero(genre >= 0)
+            rows.append(hit)
+            genres.append(genre[hit])
+        if not rows:
+            return np.zeros(0, np.int64), np.zeros(0, np.int32)
+        return np.concatenate(rows), np.concatenate(genres)
+
+    def where(self, **filters: Iterable[str]) -> "OccupancyCube":
+        """Rows whose dimensions take one of the given labels.
+
+        Example:
+            cube.where(city=["JAKARTA", "BANDUNG"], snapshot_type=["final"])
+        """
+        mask = np.ones(len(self), bool)
+        for dim, labels in filters.items():
+            wanted = set(labels)
+            if dim == "genre":
+                # A movie matches if any of its genres is wanted
+                movie_ok = np.asarray(
+                    [not wanted.isdisjoint(g) for g in self._movie_genres().values()], bool
+                )
+                mask &= movie_ok[self.codes["movie"]]
+                continue
+            codes, names = self._dimension(dim)
+            # Boolean lookup per category, then one gather over the rows
+            allowed = np.asarray([name in wanted for name in names], bool)
+            mask &= allowed[codes]
+        return self.take(mask)
+
+    def between(self, start: str | None = None, end: str | None = None) -> "OccupancyCube":
+        """Rows dated from start to end (inclusive, YYYY-MM-DD)."""
+        labels = np.asarray(self.categories["date"], dtype=str)
+        ok = np.ones(len(labels), bool)
+        if start:
+            ok &= labels >= start
+        if end:
+            ok &= labels <= end
+        return self.take(ok[self.codes["date"]] if len(labels) else np.zeros(len(self), bool))
+
+    def take(self, mask: np.ndarray) -> "OccupancyCube":
+        """Rows selected by a boolean mask (categories are kept)."""
+        if mask.all():
+            return self
+        # Gathering by index is cheaper than re-scanning the mask for every column
+        index = np.flatnonzero(mask)
+        return OccupancyCube(
+            codes={dim: codes[index] for dim, codes in self.codes.items()},
+            categories=self.categories,
+            hour=self.hour[index],
+            measures={name: values[index] for name, values in self.measures.items()},
+            genre_offsets=self.genre_offsets,
+            genre_codes=self.genre_codes,
+            genres=self.genres,
+        )
+
+    def group_by(self, dims: Sequence[str]) -> GroupResult:
+        """Count and sum every measure per combination of `dims`.
+
+        Grouping by genre counts an observation once per genre of its movie.
+        """
+        rows = None
+        columns = []
+        labels = []
+        for dim in dims:
+            if dim == "genre":
+                rows, genre = self._expand_genres()
+                columns.append(genre)
+                labels.append(self.genres or [UNKNOWN])
+            else:
+                codes, names = self._dimension(dim)
+                columns.append(codes)
+                labels.append(names)
+        if rows is not None:
+            columns = [
+                c if dim == "genre" else c[rows] for c, dim in zip(columns, dims, strict=True)
+            ]
+        else:
+            rows = slice(None)
+
+        shape = tuple(max(len(names), 1) for names in labels)
+        size = int(np.prod(shape)) if shape else 1
+        key = (
+            np.ravel_multi_index(columns, shape)
+            if columns
+            else np.zeros(len(self.hour[rows]), np.int64)
+        )
+        count = np.bincount(key, minlength=size)
+        sums = {
+            name: np.bincount(key, weights=values[rows], minlength=size).astype(np.int64)
+            for name, values in self.measures.items()
+        }
+
+        present = np.flatnonzero(count)
+        unraveled = np.unravel_index(present, shape) if columns else ()
+        return GroupResult(
+            dims=list(dims),
+            keys={
+                dim: [names[i] for i in index]
+                for dim, names, index in zip(dims, labels, unraveled, strict=True)
+            },
+            count=count[present],
+            sums={name: values[present] for name, values in sums.items()},
+        )
@@ -0,0 +1,146 @@
+"""
+Cube Store
+
+Keeps one OccupancyCube shard per local seat source under data/cube/:
+
+    data/seats_{mode}_{date}.json       -> data/cube/seats_{mode}_{date}.npz
+    data/final_snaps/final_{date}_*.json -> data/cube/final_snaps_{date}.npz
+
+A shard is rebuilt when any of its sources is newer than it, so repeated
+builds only decode what changed. Shards are not removed with their
+sources, so history survives seat compaction (backend.cli.compact_seats).
+
+Genres come from the movies_{date} snapshot of the shard's date when it
+is available locally.
+
+Usage:
+    build_shards("data")
+    cube = load_cube("data", start="2026-08-01", end="2026-10-31")
+"""
+
+import re
+from collections import defaultdict
+from pathlib import Path
+
+from backend.infrastructure.analytics.cube import OccupancyCube
+from backend.infrastructure.storage import (
+    artifact_name,
+    find_artifact,
+    glob_artifacts,
+    load_json,
+    load_json_files,
+)
+
+CUBE_DIR = "cube"
+
+_DATE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+
+def _name_date(name: str) -> str | None:
+    match = _DATE.search(name)
+    return match.group(1) if match else None
+
+
+def cube_sources(data_dir: str | Path) -> dict[str, list[Path]]:
+    """Source files per shard name."""
+    data_path = Path(data_dir)
+    sources: dict[str, list[Path]] = {}
+    for path in glob_artifacts(data_path, "seats_*"):
+        sources[artifact_name(path)] = [path]
+
+    finals: dict[str, list[Path]] = defaultdict(list)
+    for path in sorted((data_path / "final_snaps").glob("final_*.json")):
+        date_str = _name_date(path.name)
+        if date_str:
+            finals[f"final_snaps_{date_str}"].append(path)
+    sources.update(finals)
+    return sources
+
+
+def _seat_records(data: dict) -> list:
+    """Seat records of a seat file, typed by the file's scrape mode."""
+    seats = data.get("results", data.get("seats", []))
+    for seat in seats:
+        if not seat.get("snapshot_type"):
+            seat["snapshot_type"] = data.get("mode")
+    return seats
+
+
+def _movie_genres(data_path: Path, date_str: str | None) -> dict[str, list[str]]:
+    snapshot = find_artifact(data_path, f"movies_{date_str}") if date_str else None
+    if snapshot is None:
+        return {}
+    return {m["id"]: m.get("genres", []) for m in load_json(snapshot).get("movies", [])}
+
+
+def _is_stale(shard: Path, sources: list[Path]) -> bool:
+    if not shard.exists():
+        return True
+    built = shard.stat().st_mtime
+    return any(path.stat().st_mtime > built for path in sources)
+
+
+def build_shards(data_dir: str | Path = "data", rebuild: bool = False) -> dict[str, int]:
+    """Write a shard for every source that changed since its shard was built.
+
+    Args:
+        data_dir: Directory holding the seat files (shards go to {data_dir}/cube)
+        rebuild: Rebuild every shard
+
+    Returns:
+        Rows per shard written
+    """
+    data_path = Path(data_dir)
+    cube_dir = data_path / CUBE_DIR
+    stale = {
+        name: paths
+        for name, paths in cube_sources(data_path).items()
+        if rebuild or _is_stale(cube_dir / f"{name}.npz", paths)
+    }
+
+    # Seat files are decoded in parallel; final snaps are one record per file
+    seat_files = [paths[0] for name, paths in stale.items() if name.startswith("seats_")]
+    decoded = load_json_files(seat_files, transform=_seat_records)
+
+    written: dict[str, int] = {}
+    genres_by_date: dict[str | None, dict[str, list[str]]] = {}
+    for name, paths in sorted(stale.items()):
+        if name.startswith("seats_"):
+            records = decoded.get(paths[0], [])
+        else:
+            records = [load_json(path) for path in paths]
+
+        date_str = _name_date(name)
+        if date_str not in genres_by_date:
+            genres_by_date[date_str] = _movie_genres(data_path, date_str)
+
+        cube = OccupancyCube.from_records(records, genres_by_date[date_str])
+        cube.save(cube_dir / f"{name}.npz")
+        written[name] = len(cube)
+    return written
+
+
+def load_cube(
+    data_dir: str | Path = "data", start: str | None = None, end: str | None = None
+) -> OccupancyCube:
+    """Concatenate the shards holding showtimes in [start, end] and filter rows.
+
+    Args:
+        data_dir: Directory holding cube/
+        start: First showtime date (YYYY-MM-DD), or None
+        end: Last showtime date (YYYY-MM-DD), or None
+    """
+    shards = []
+    for path in sorted((Path(data_dir) / CUBE_DIR).glob("*.npz")):
+        # Files hold showtimes on or after their date, so only `end` rules one out by name
+        date_str = _name_date(path.name)
+        if date_str and end and date_str > end:
+            continue
+        if start or end:
+            dates = [d for d in OccupancyCube.dates(path) if d]
+            if dates and ((start and max(dates) < start) or (end and min(dates) > end)):
+                continue
+        shards.append(OccupancyCube.load(path))
+
+    cube = OccupancyCube.concat(shards)
+    return cube.between(start, end) if start or end else cube
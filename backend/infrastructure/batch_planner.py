@@ -0,0 +1,203 @@
+"""
+Seat Batch Planner
+
+Splits a set of showtimes into batches of roughly equal expected scrape
+time, so the parallel seat jobs finish together instead of waiting on the
+one batch that happened to get all the big JAKARTA theatres.
+
+Each showtime gets an expected cost (ms) from:
+- the merchant's layout endpoint (prior latency per chain)
+- historical fetch latency for the theatre, from previous seats_*.json files
+- layout size (seats to download and count), historical or by room category
+
+Batches are filled with the longest-processing-time-first greedy rule.
+The plan depends only on its inputs, so every job computes the same split
+as long as each sees the same showtimes and the same history files: the
+history is read in path order and used only if every file could be read.
+
+Usage:
+    from backend.infrastructure.batch_planner import BatchPlanner
+
+    planner = BatchPlanner.from_history("data", before=date_str)
+    batches = planner.plan(showtimes, total_batches=9)
+    mine = batches[batch]
+"""
+
+import heapq
+import statistics
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from backend.infrastructure.storage import artifact_name, glob_artifacts, load_json_files
+
+# Prior layout API latency per merchant endpoint (ms)
+MERCHANT_LATENCY_MS = {
+    "XXI": 450.0,
+    "CGV": 600.0,
+    "CINEPOLIS": 650.0,
+}
+DEFAULT_LATENCY_MS = 550.0
+
+# Prior layout size by room category keyword (seats)
+ROOM_SEATS = {
+    "IMAX": 350,
+    "4DX": 120,
+    "SCREENX": 250,
+    "PREMIERE": 40,
+    "GOLD": 30,
+    "VELVET": 40,
+    "SATIN": 60,
+}
+DEFAULT_ROOM_SEATS = 180
+
+# Download + occupancy counting cost per seat (ms)
+PER_SEAT_MS = 0.5
+
+# Minimum spacing between requests enforced by the scraper's rate limiter (ms)
+REQUEST_INTERVAL_MS = 300.0
+
+# Most recent seat files considered for history
+HISTORY_FILES = 7
+
+
+def _seat_results(data: dict | list) -> list[dict]:
+    """Seat records from a seats_*.json file (runs in a loader worker)."""
+    return data.get("results", []) if isinstance(data, dict) else data
+
+
+def _room_key(theatre_id: str | None, room: str | None) -> tuple[str, str]:
+    return (theatre_id or "", (room or "").upper())
+
+
+@dataclass
+class SeatHistory:
+    """Per-theatre latency and per-room layout size seen in past scrapes."""
+
+    latency_ms: dict[str, float] = field(default_factory=dict)
+    room_seats: dict[tuple[str, str], int] = field(default_factory=dict)
+
+    @classmethod
+    def from_results(cls, results: list[dict]) -> "SeatHistory":
+        """Aggregate seat scrape results (median latency, max layout size)."""
+        latencies: dict[str, list[float]] = defaultdict(list)
+        room_seats: dict[tuple[str, str], int] = {}
+
+        for r in results:
+            theatre_id = r.get("theatre_id")
+            if not theatre_id:
+                continue
+            if r.get("fetch_ms") is not None:
+                latencies[theatre_id].append(float(r["fetch_ms"]))
+            if r.get("total_seats"):
+                key = _room_key(theatre_id, r.get("room_category"))
+                room_seats[key] = max(room_seats.get(key, 0), int(r["total_seats"]))
+
+        return cls(
+            latency_ms={t: statistics.median(v) for t, v in latencies.items()},
+            room_seats=room_seats,
+        )
+
+    @classmethod
+    def load(
+        cls, data_dir: str = "data", before: str | None = None, max_files: int = HISTORY_FILES
+    ) -> "SeatHistory":
+        """Load history from the most recent seats_*_{date}.json files in data_dir.
+
+        Args:
+            data_dir: Directory containing seat scrape output
+            before: Only use files dated before this day (YYYY-MM-DD). Batches
+                of the current run write today's files while others are still
+                planning, so including them would make the split inconsistent.
+            max_files: Maximum number of files to read
+
+        Returns:
+            History of the newest files (by date, then path), or an empty
+            history if any of them can't be read - never a partial one
+        """
+        files = sorted(
+            (
+                p
+                for p in glob_artifacts(data_dir, "seats_*")
+                if before is None or artifact_name(p)[-10:] < before
+            ),
+            key=lambda p: (artifact_name(p)[-10:], str(p)),
+            reverse=True,
+        )[:max_files]
+
+        try:
+            loaded = load_json_files(sorted(files), transform=_seat_results)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read seat history, planning from priors: {e}")
+            return cls()
+
+        return cls.from_results([seat for seats in loaded.values() for seat in seats])
+
+
+@dataclass
+class BatchPlanner:
+    """Cost-aware, deterministic showtime batch splitter."""
+
+    history: SeatHistory = field(default_factory=SeatHistory)
+    request_interval_ms: float = REQUEST_INTERVAL_MS
+
+    @classmethod
+    def from_history(cls, data_dir: str = "data", before: str | None = None) -> "BatchPlanner":
+        """Create a planner using past seat scrapes found in data_dir."""
+        return cls(history=SeatHistory.load(data_dir, before=before))
+
+    def layout_seats(self, showtime: dict) -> int:
+        """Expected layout size for a showtime's room."""
+        room = showtime.get("room_category") or showtime.get("room_name") or ""
+        seen = self.history.room_seats.get(_room_key(showtime.get("theatre_id"), room))
+        if seen:
+            return seen
+
+        room_upper = room.upper()
+        for keyword, seats in ROOM_SEATS.items():
+            if keyword in room_upper:
+                return seats
+        return DEFAULT_ROOM_SEATS
+
+    def estimate_cost(self, showtime: dict) -> float:
+        """Expected time (ms) to scrape one showtime."""
+        latency = self.history.latency_ms.get(showtime.get("theatre_id") or "")
+        if latency is None:
+            merchant = (showtime.get("merchant") or "").upper().replace("É", "E")
+            latency = MERCHANT_LATENCY_MS.get(merchant, DEFAULT_LATENCY_MS)
+
+        # Requests are paced, so a fast response still occupies a full slot
+        return max(latency, self.request_interval_ms) + self.layout_seats(showtime) * PER_SEAT_MS
+
+    def plan(self, showtimes: list[dict], total_batches: int) -> list[list[dict]]:
+        """Split showtimes into `total_batches` batches of balanced cost.
+
+        Showtimes keep their input order within a batch.
+
+        Returns:
+            List of `total_batches` lists (some may be empty)
+        """
+        if total_batches < 1:
+            raise ValueError("total_batches must be at least 1")
+
+        costs = [self.estimate_cost(st) for st in showtimes]
+
+        # Longest first; showtime_id breaks ties so the plan is reproducible
+        order = sorted(
+            range(len(showtimes)),
+            key=lambda i: (-costs[i], str(showtimes[i].get("showtime_id", "")), i),
+        )
+
+        # (load, batch number) - least-loaded batch first, lowest number on ties
+        heap = [(0.0, b) for b in range(total_batches)]
+        assigned: list[list[int]] = [[] for _ in range(total_batches)]
+
+        for i in order:
+            load, b = heapq.heappop(heap)
+            assigned[b].append(i)
+            heapq.heappush(heap, (load + costs[i], b))
+
+        return [[showtimes[i] for i in sorted(indices)] for indices in assigned]
+
+    def batch_costs(self, batches: list[list[dict]]) -> list[float]:
+        """Expected total time (ms) of each batch."""
+        return [sum(self.estimate_cost(st) for st in batch) for batch in batches]
@@ -5,13 +5,15 @@ Provides geocoding functionality using OpenStreetMap Nominatim API.
 Includes caching to avoid repeated API calls.
 """
 
-import asyncio
 import json
 import os
 from typing import Any
 
 import aiohttp
 
+from backend.domain.models import NormalizedSnapshot
+from backend.infrastructure.rate_limiter import TokenBucketLimiter
+
 # Default cache file location
 DEFAULT_CACHE_PATH = os.path.join(
     os.path.dirname(__file__), "..", "..", "data", "geocode_cache.json"
@@ -128,29 +130,6 @@ class Geocoder:
         self.cache = load_geocode_cache(cache_path)
         self.log = logger or (lambda msg: print(msg))
 
-    def _collect_theatres_to_geocode(
-        self, movie_map: dict[str, Any]
-    ) -> list[dict[str, Any]]:
-        """Collect theatres that need geocoding from movie data."""
-        theatres_to_geocode = []
-
-        for _movie_id, movie in movie_map.items():
-            if "schedules" in movie:
-                for city_name, theatres in movie["schedules"].items():
-                    for theatre in theatres:
-                        if theatre.get("address"):
-                            cache_key = f"{theatre['address']}|{city_name}"
-                            if cache_key not in self.cache:
-                                theatres_to_geocode.append(
-                                    {
-                                        "address": theatre["address"],
-                                        "city": city_name,
-                                        "theatre": theatre,
-                                    }
-                                )
-
-        return theatres_to_geocode
-
     def _apply_cached_coordinates(self, movie_map: dict[str, Any]) -> None:
         """Apply cached coordinates to theatres that haven't been geocoded yet."""
         for _movie_id, movie in movie_map.items():
@@ -167,8 +146,10 @@ class Geocoder:
         """
         Geocode all theatre addresses in movie data.
 
-        Updates theatres in-place with 'lat' and 'lng' fields.
-        Uses cache to avoid repeated API calls.
+        Theatres are collected into a deduplicated table first (the same
+        one merge_batches writes to snapshot_{date}), so a theatre playing
+        many movies is looked up once. Updates theatres in-place with 'lat'
+        and 'lng' fields.
 
         Args:
             movie_map: Dict of movie_id -> movie data with schedules
@@ -176,22 +157,31 @@ class Geocoder:
         Returns:
             The same movie_map with geocoded theatre locations
         """
-        self.log("📍 Starting theatre geocoding...")
-        self.log(f"   Loaded {len(self.cache)} cached locations")
+        table = NormalizedSnapshot()
+        for movie in movie_map.values():
+            table.normalize_movie(movie)
+        await self.geocode_theatres(table.theatre_list())
+
+        # Every schedule of a geocoded theatre picks up its cached location
+        self._apply_cached_coordinates(movie_map)
+        return movie_map
 
-        # Collect theatres needing geocoding
-        theatres_to_geocode = self._collect_theatres_to_geocode(movie_map)
-        self.log(f"   {len(theatres_to_geocode)} theatres need geocoding")
+    async def _geocode_items(self, items: list[dict[str, Any]]) -> tuple[int, int]:
+        """Geocode {address, city, theatre} items, setting lat/lng on each theatre.
 
-        # Geocode with rate limiting
+        Returns:
+            (geocoded, failed) counts
+        """
         geocoded = 0
         failed = 0
 
+        limiter = TokenBucketLimiter(rate=1 / self.RATE_LIMIT_SECONDS, capacity=1)
+
         async with aiohttp.ClientSession() as session:
-            for i, item in enumerate(theatres_to_geocode):
-                coords = await geocode_address(
-                    item["address"], item["city"], session, self.cache
-                )
+            for i, item in enumerate(items):
+                # Rate limit for Nominatim
+                await limiter.acquire()
+                coords = await geocode_address(item["address"], item["city"], session, self.cache)
 
                 if coords:
                     item["theatre"]["lat"] = coords["lat"]
@@ -202,22 +192,51 @@ class Geocoder:
 
                 # Progress every 10
                 if (i + 1) % 10 == 0:
-                    self.log(
-                        f"   Geocoded {i + 1}/{len(theatres_to_geocode)} "
-                        f"({geocoded} ok, {failed} failed)"
-                    )
+                    self.log(f"   Geocoded {i + 1}/{len(items)} ({geocoded} ok, {failed} failed)")
 
-                # Rate limit for Nominatim
-                await asyncio.sleep(self.RATE_LIMIT_SECONDS)
+        return geocoded, failed
 
-        # Apply cached coordinates to remaining theatres
-        self._apply_cached_coordinates(movie_map)
+    async def geocode_theatres(self, theatres: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Geocode a deduplicated theatre table (NormalizedSnapshot.theatre_list()).
 
-        # Save updated cache
-        if save_geocode_cache(self.cache, self.cache_path):
-            self.log(f"   Saved {len(self.cache)} locations to cache")
-        else:
+        Each row needs 'address' and 'city'; rows are updated in-place with
+        'lat' and 'lng'. Every address is looked up at most once.
+
+        Args:
+            theatres: Theatre rows
+
+        Returns:
+            The same rows with geocoded locations
+        """
+        self.log(f"📍 Geocoding {len(theatres)} theatres ({len(self.cache)} cached)...")
+
+        pending: dict[str, dict[str, Any]] = {}
+        for theatre in theatres:
+            if not theatre.get("address") or "lat" in theatre:
+                continue
+            cache_key = f"{theatre['address']}|{theatre.get('city', '')}"
+            if cache_key in self.cache:
+                theatre["lat"] = self.cache[cache_key]["lat"]
+                theatre["lng"] = self.cache[cache_key]["lng"]
+            elif cache_key not in pending:
+                pending[cache_key] = {
+                    "address": theatre["address"],
+                    "city": theatre.get("city", ""),
+                    "theatre": theatre,
+                }
+
+        geocoded, failed = await self._geocode_items(list(pending.values()))
+
+        # Rows sharing an address pick up the result from the cache
+        for theatre in theatres:
+            cache_key = f"{theatre.get('address')}|{theatre.get('city', '')}"
+            if "lat" not in theatre and cache_key in self.cache:
+                theatre["lat"] = self.cache[cache_key]["lat"]
+                theatre["lng"] = self.cache[cache_key]["lng"]
+
+        if not save_geocode_cache(self.cache, self.cache_path):
             self.log("   ⚠️ Failed to save cache")
 
         self.log(f"📍 Geocoding complete: {geocoded} new, {failed} failed")
-        return movie_map
+        return theatres
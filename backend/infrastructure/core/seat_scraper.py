@@ -8,7 +8,6 @@ Approach:
 3. This bypasses Flutter UI navigation issues
 """
 
-import asyncio
 import time
 from datetime import datetime
 
@@ -16,6 +15,7 @@ import aiohttp
 
 from backend.config import USER_AGENT
 from backend.infrastructure.core.base_scraper import BaseScraper
+from backend.infrastructure.rate_limiter import TokenBucketLimiter
 from backend.infrastructure.repositories import FirestoreTokenRepository
 
 
@@ -219,7 +219,9 @@ class SeatScraper(BaseScraper):
         if not show_time_id or not merchant:
             return None
 
+        fetch_start = time.perf_counter()
         layout_data = await self._fetch_seat_layout_api(show_time_id, merchant)
+        fetch_ms = round((time.perf_counter() - fetch_start) * 1000)
 
         if not layout_data:
             return None
@@ -235,12 +237,22 @@ class SeatScraper(BaseScraper):
             "theatre_name": showtime_info.get("theatre_name"),
             "city": showtime_info.get("city"),
             "merchant": merchant,
-            "room_category": showtime_info.get("room_category"),
+            "room_category": showtime_info.get("room_category") or showtime_info.get("room_name"),
             "showtime": showtime_info.get("showtime"),
             "scraped_at": datetime.now().isoformat(),
+            "fetch_ms": fetch_ms,  # Used by the batch planner's cost model
             **occupancy,
         }
 
+    @staticmethod
+    def _request_limiter(delay_between_requests: float) -> TokenBucketLimiter:
+        """Pace requests to at most one per `delay_between_requests` seconds.
+
+        Unlike a fixed sleep after each call, time spent waiting on the
+        API counts towards the spacing.
+        """
+        return TokenBucketLimiter(rate=1 / max(delay_between_requests, 1e-3), capacity=1)
+
     async def _init_browser_and_auth(self, headless: bool = True) -> tuple:
         """
         Initialize browser and login to TIX.id using base class methods.
@@ -281,9 +293,11 @@ class SeatScraper(BaseScraper):
 
         results = []
         start_time = time.time()
+        limiter = self._request_limiter(delay_between_requests)
 
         try:
             for i, showtime_info in enumerate(showtimes, 1):
+                await limiter.acquire()
                 result = await self.scrape_showtime_occupancy(showtime_info)
 
                 if result:
@@ -298,9 +312,6 @@ class SeatScraper(BaseScraper):
                         f"{showtime_info.get('showtime', '')} - ❌ Failed"
                     )
 
-                # Rate limiting
-                await asyncio.sleep(delay_between_requests)
-
                 # Progress update every batch_size
                 if i % batch_size == 0:
                     elapsed = time.time() - start_time
@@ -341,8 +352,10 @@ class SeatScraper(BaseScraper):
 
         results = []
         start_time = time.time()
+        limiter = self._request_limiter(delay_between_requests)
 
         for i, showtime_info in enumerate(showtimes, 1):
+            await limiter.acquire()
             result = await self.scrape_showtime_occupancy(showtime_info)
 
             if result:
@@ -357,8 +370,7 @@ class SeatScraper(BaseScraper):
                     f"{showtime_info.get('showtime', '')} - ❌ Failed"
                 )
 
-            await asyncio.sleep(delay_between_requests)
-
         elapsed = time.time() - start_time
         self.log(f"🏁 API scrape complete: {len(results)}/{len(showtimes)} in {elapsed:.1f}s")
+        self.log(f"   🚦 Rate limiter: {limiter.stats.summary()}")
         return results
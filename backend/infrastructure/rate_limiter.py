@@ -0,0 +1,247 @@
+"""
+Async Rate Limiters
+
+Reusable request limiters for the JIT, seat and geocoding paths.
+
+Both limiters park waiters on a FIFO queue and arm a single timer for the
+moment the head of the queue can proceed, so acquiring a slot is O(1) and
+nobody busy-polls. Every acquire reports how long it waited.
+
+Usage:
+    from backend.infrastructure.rate_limiter import SlidingWindowLimiter
+
+    limiter = SlidingWindowLimiter(max_rate=10, time_window=60)
+    waited = await limiter.acquire()
+    print(limiter.stats.summary())
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass
+class LimiterStats:
+    """Wait-time statistics collected by a limiter."""
+
+    acquired: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def avg_wait(self) -> float:
+        """Average wait per acquire, in seconds."""
+        if self.acquired == 0:
+            return 0.0
+        return self.total_wait / self.acquired
+
+    def record(self, waited: float) -> None:
+        """Record a completed acquire."""
+        self.acquired += 1
+        if waited > 0:
+            self.delayed += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    def summary(self) -> str:
+        """Human-readable one-line summary."""
+        return (
+            f"{self.acquired} acquired, {self.delayed} delayed, "
+            f"avg wait {self.avg_wait:.2f}s, max wait {self.max_wait:.2f}s"
+        )
+
+
+class AsyncRateLimiter(ABC):
+    """Base class for FIFO, timer-driven async limiters.
+
+    Subclasses implement `_try_take(now)` (consume capacity if available),
+    `_next_ready(now)` (loop time at which capacity frees up) and
+    `_refund(granted_at)` (return a slot nobody used).
+    """
+
+    def __init__(self) -> None:
+        # Each waiter's future resolves to the loop time its slot was granted
+        self._waiters: deque[asyncio.Future[float]] = deque()
+        self._timer: asyncio.TimerHandle | None = None
+        self.stats = LimiterStats()
+
+    @abstractmethod
+    def _try_take(self, now: float) -> bool:
+        """Consume one slot at loop time `now` if capacity allows."""
+
+    @abstractmethod
+    def _next_ready(self, now: float) -> float:
+        """Loop time at which the next slot frees up."""
+
+    @abstractmethod
+    def _refund(self, granted_at: float) -> None:
+        """Return a slot taken at `granted_at` whose waiter was cancelled."""
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers currently parked."""
+        return len(self._waiters)
+
+    async def acquire(self) -> float:
+        """Wait until a request slot is available.
+
+        Returns:
+            Seconds spent waiting for the slot
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+
+        # Fast path: nobody queued ahead of us and capacity is free
+        if not self._waiters and self._try_take(now):
+            self.stats.record(0.0)
+            return 0.0
+
+        future: asyncio.Future[float] = loop.create_future()
+        self._waiters.append(future)
+        self._arm(loop)
+
+        try:
+            granted_at = await future
+        except asyncio.CancelledError:
+            # Cancelled after the slot was granted: hand it back instead of losing it
+            if future.done() and not future.cancelled():
+                self._refund(future.result())
+            # A cancelled head may have been holding the timer; re-arm for the next one
+            self._arm(loop)
+            raise
+
+        waited = granted_at - now
+        self.stats.record(waited)
+        return waited
+
+    async def __aenter__(self) -> float:
+        return await self.acquire()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def _arm(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Schedule a wake-up for when the head waiter can proceed."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        self._drop_cancelled()
+        if not self._waiters:
+            return
+
+        self._timer = loop.call_at(self._next_ready(loop.time()), self._release, loop)
+
+    def _release(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Grant slots to waiters in FIFO order while capacity allows."""
+        self._timer = None
+        now = loop.time()
+
+        while self._waiters:
+            future = self._waiters[0]
+            if future.done():
+                self._waiters.popleft()
+                continue
+            if not self._try_take(now):
+                break
+            self._waiters.popleft()
+            future.set_result(now)
+
+        self._arm(loop)
+
+    def _drop_cancelled(self) -> None:
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()
+
+
+class TokenBucketLimiter(AsyncRateLimiter):
+    """Token bucket limiter.
+
+    Refills `rate` tokens per second up to `capacity`; each acquire takes one.
+    Use capacity=1 for strict pacing (e.g. Nominatim's 1 req/sec policy).
+
+    Example:
+        limiter = TokenBucketLimiter(rate=1 / 1.1, capacity=1)
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        super().__init__()
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated: float | None = None
+
+    def _refill(self, now: float) -> None:
+        if self._updated is not None:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _try_take(self, now: float) -> bool:
+        self._refill(now)
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def _next_ready(self, now: float) -> float:
+        self._refill(now)
+        return now + max(0.0, (1 - self._tokens) / self.rate)
+
+    def _refund(self, granted_at: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + 1)
+
+
+class SlidingWindowLimiter(AsyncRateLimiter):
+    """Sliding window limiter: at most `max_rate` grants per `time_window` seconds.
+
+    Keeps a deque of the last `max_rate` grant times, so expiring old
+    entries is amortised O(1) instead of rebuilding a list per call.
+
+    Example:
+        limiter = SlidingWindowLimiter(max_rate=10, time_window=60)
+    """
+
+    def __init__(self, max_rate: int, time_window: float = 60) -> None:
+        """
+        Args:
+            max_rate: Requests allowed per window
+            time_window: Window length in seconds
+        """
+        if max_rate < 1:
+            raise ValueError("max_rate must be at least 1")
+        super().__init__()
+        self.max_rate = max_rate
+        self.time_window = time_window
+        self._grants: deque[float] = deque()
+
+    def _expire(self, now: float) -> None:
+        while self._grants and now - self._grants[0] >= self.time_window:
+            self._grants.popleft()
+
+    def _try_take(self, now: float) -> bool:
+        self._expire(now)
+        if len(self._grants) < self.max_rate:
+            self._grants.append(now)
+            return True
+        return False
+
+    def _next_ready(self, now: float) -> float:
+        self._expire(now)
+        if len(self._grants) < self.max_rate:
+            return now
+        return self._grants[0] + self.time_window
+
+    def _refund(self, granted_at: float) -> None:
+        if granted_at in self._grants:
+            self._grants.remove(granted_at)
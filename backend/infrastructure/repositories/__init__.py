@@ -6,12 +6,24 @@ Data persistence implementations.
 
 from backend.infrastructure.repositories.file_movie import FileMovieRepository
 from backend.infrastructure.repositories.firestore_movie import FirestoreMovieRepository
+from backend.infrastructure.repositories.firestore_seat import FirestoreSeatRepository
 from backend.infrastructure.repositories.firestore_theatre import FirestoreTheatreRepository
 from backend.infrastructure.repositories.firestore_token import FirestoreTokenRepository
+from backend.infrastructure.repositories.sqlite_movie import SQLiteMovieRepository
+from backend.infrastructure.repositories.sqlite_scraper_run import SQLiteScraperRunRepository
+from backend.infrastructure.repositories.sqlite_seat import SQLiteSeatRepository
+from backend.infrastructure.repositories.sqlite_theatre import SQLiteTheatreRepository
+from backend.infrastructure.repositories.sqlite_token import SQLiteTokenRepository
 
 __all__ = [
     "FirestoreMovieRepository",
+    "FirestoreSeatRepository",
     "FirestoreTheatreRepository",
     "FirestoreTokenRepository",
     "FileMovieRepository",
+    "SQLiteMovieRepository",
+    "SQLiteScraperRunRepository",
+    "SQLiteSeatRepository",
+    "SQLiteTheatreRepository",
+    "SQLiteTokenRepository",
 ]
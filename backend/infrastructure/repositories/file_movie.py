@@ -3,13 +3,37 @@ File-based Movie Repository
 
 Implements IMovieRepository using local JSON files.
 Useful for development and batch processing.
+
+Files may be plain, compact or compressed JSON (see storage.codec);
+the format is detected on read.
+
+Decoded snapshot JSON is kept in a process-wide FileCache keyed by path,
+mtime and size, so repeated reads of an unchanged file skip decoding.
+Every read builds its own Movie objects from it, so callers may modify
+what they get back; schedules are only built when accessed (see
+LazySchedules).
 """
 
-import json
+from collections.abc import Iterable
 from pathlib import Path
 
 from backend.application.ports.storage import IMovieRepository
-from backend.domain.models import Movie, ScrapeResult
+from backend.domain.models import Movie, NormalizedSnapshot, ScrapeResult, ShowtimeIndex
+from backend.infrastructure.storage import (
+    SNAP_SUFFIX,
+    FileCache,
+    IndexedSnapshot,
+    artifact_name,
+    artifact_path,
+    default_codec,
+    dump_json,
+    find_artifact,
+    glob_artifacts,
+    load_json,
+)
+
+# Shared by every repository instance in the process
+_SNAPSHOT_CACHE = FileCache()
 
 
 class FileMovieRepository(IMovieRepository):
@@ -28,14 +52,16 @@ class FileMovieRepository(IMovieRepository):
         latest = repo.get_latest_snapshot()
     """
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", cache: FileCache | None = None):
         """Initialize with data directory.
 
         Args:
             data_dir: Path to data directory
+            cache: Cache for parsed snapshots (shared process-wide cache if None)
         """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        self.cache = cache if cache is not None else _SNAPSHOT_CACHE
 
     def save_snapshot(self, result: ScrapeResult) -> bool:
         """Save a daily movie snapshot.
@@ -57,9 +83,7 @@ class FileMovieRepository(IMovieRepository):
             data["city_stats"] = city_stats
 
             # Save to dated file
-            output_file = self.data_dir / f"movies_{result.date}.json"
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            dump_json(data, artifact_path(self.data_dir, f"movies_{result.date}"))
 
             return True
 
@@ -70,13 +94,13 @@ class FileMovieRepository(IMovieRepository):
     def get_latest_snapshot(self) -> ScrapeResult | None:
         """Get the most recent movie snapshot.
 
-        Finds the newest movies_*.json file.
+        Finds the newest movies_* file.
 
         Returns:
             ScrapeResult or None if no snapshots exist
         """
         try:
-            movie_files = sorted(self.data_dir.glob("movies_*.json"), reverse=True)
+            movie_files = glob_artifacts(self.data_dir, "movies_*")[::-1]
 
             if not movie_files:
                 return None
@@ -96,45 +120,211 @@ class FileMovieRepository(IMovieRepository):
         Returns:
             ScrapeResult or None if not found
         """
-        file_path = self.data_dir / f"movies_{date}.json"
+        file_path = find_artifact(self.data_dir, f"movies_{date}")
 
-        if not file_path.exists():
+        if file_path is None:
             return None
 
         return self._load_file(file_path)
 
     def _load_file(self, file_path: Path) -> ScrapeResult | None:
-        """Load a movie data file."""
+        """Load a movie data file (decoded JSON is cached until the file changes)."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
-
-            movies = [Movie.from_dict(m) for m in data.get("movies", [])]
-
+            # The cached dict is never handed out or modified: Movie.from_dict
+            # copies what it keeps and decodes schedules into new objects
+            data = self.cache.get(file_path, load_json, kind="movies")
             return ScrapeResult(
-                movies=movies,
+                movies=[Movie.from_dict(m) for m in data.get("movies", [])],
                 scraped_at=data.get("scraped_at", ""),
                 date=data.get("date", ""),
                 cities_scraped=len(data.get("city_stats", {})),
                 success=True,
             )
-
         except Exception as e:
             print(f"⚠️ Error loading {file_path}: {e}")
             return None
 
+    def save_showtime_index(self, index: ShowtimeIndex) -> Path:
+        """Save a precomputed showtime index as compact columnar JSON.
+
+        Args:
+            index: ShowtimeIndex to persist
+
+        Returns:
+            Path of the written file
+        """
+        # Never pretty-printed: the index is machine-only
+        codec = default_codec()
+        codec = "compact" if codec == "json" else codec
+        return dump_json(
+            index.to_dict(), artifact_path(self.data_dir, f"showtimes_{index.date}", codec), codec
+        )
+
+    def get_showtime_index(self, date: str | None = None) -> ShowtimeIndex | None:
+        """Get the showtime index for a date (latest if None).
+
+        Loads the precomputed showtimes_{date}.json written at merge time,
+        falling back to building it from the movie snapshot.
+
+        Args:
+            date: Date string in YYYY-MM-DD format
+
+        Returns:
+            ShowtimeIndex or None if no data exists
+        """
+        if date:
+            index_file = find_artifact(self.data_dir, f"showtimes_{date}")
+        else:
+            index_files = glob_artifacts(self.data_dir, "showtimes_*")
+            snapshot_dates = self.list_snapshots()
+            # Only trust the newest index if no newer snapshot supersedes it
+            index_file = index_files[-1] if index_files else None
+            if index_file and snapshot_dates and artifact_name(index_file)[10:] < snapshot_dates[0]:
+                index_file = None
+
+        if index_file:
+            try:
+                return ShowtimeIndex.from_dict(load_json(index_file))
+            except Exception as e:
+                print(f"⚠️ Error loading {index_file}: {e}")
+
+        return super().get_showtime_index(date)
+
+    def _indexed_snapshot_path(self, date: str | None) -> Path | None:
+        """Path of the indexed movies_{date}.snap (latest snapshot if date is None)."""
+        date = date or next(iter(self.list_snapshots()), None)
+        if not date:
+            return None
+        path = self.data_dir / f"movies_{date}{SNAP_SUFFIX}"
+        return path if path.exists() else None
+
+    def get_movie(self, movie_id: str, date: str | None = None) -> Movie | None:
+        """Get one movie, reading only its records from the indexed snapshot.
+
+        Falls back to the full movies_{date} file when no .snap exists.
+
+        Args:
+            movie_id: TIX.id movie identifier
+            date: Date string in YYYY-MM-DD format (latest if None)
+
+        Returns:
+            Movie or None if not found
+        """
+        path = self._indexed_snapshot_path(date)
+        if path is None:
+            return super().get_movie(movie_id, date)
+
+        try:
+            with IndexedSnapshot(path) as snap:
+                data = snap.get_movie(movie_id)
+            return Movie.from_dict(data) if data else None
+        except Exception as e:
+            print(f"⚠️ Error loading {path}: {e}")
+            return super().get_movie(movie_id, date)
+
+    def get_movies_in_city(self, city: str, date: str | None = None) -> list[Movie]:
+        """Get movies showing in a city, reading only that city's records.
+
+        Falls back to the full movies_{date} file when no .snap exists.
+
+        Args:
+            city: City name (case-insensitive)
+            date: Date string in YYYY-MM-DD format (latest if None)
+
+        Returns:
+            Movies in display order, with only that city's schedules
+        """
+        path = self._indexed_snapshot_path(date)
+        if path is None:
+            return super().get_movies_in_city(city, date)
+
+        try:
+            with IndexedSnapshot(path) as snap:
+                return [Movie.from_dict(m) for m in snap.get_city(city.upper())]
+        except Exception as e:
+            print(f"⚠️ Error loading {path}: {e}")
+            return super().get_movies_in_city(city, date)
+
+    def get_snapshot_projection(
+        self,
+        date: str,
+        fields: Iterable[str] | None = None,
+        cities: Iterable[str] | None = None,
+    ) -> ScrapeResult | None:
+        """Get part of a snapshot, reading only the records needed.
+
+        With an indexed movies_{date}.snap, schedule records are skipped
+        unless "schedules" is in fields, and only the given cities' records
+        are read. Otherwise the (cached) movies_{date} file is projected.
+
+        Args:
+            date: Date string in YYYY-MM-DD format
+            fields: Movie fields to keep ("id" always is; all if None)
+            cities: Only movies showing in these cities, with only their
+                schedules (all cities if None)
+
+        Returns:
+            ScrapeResult or None if not found
+        """
+        path = self._indexed_snapshot_path(date)
+        if path is None:
+            return super().get_snapshot_projection(date, fields, cities)
+
+        cities = None if cities is None else [city.upper() for city in cities]
+        try:
+            with IndexedSnapshot(path) as snap:
+                data = snap.iter_movies(cities, schedules=fields is None or "schedules" in fields)
+                result = ScrapeResult(
+                    movies=[Movie.from_dict(m) for m in data],
+                    scraped_at=snap.header.get("scraped_at", ""),
+                    date=snap.date or date,
+                    cities_scraped=len(snap.header.get("city_stats", {})),
+                    success=True,
+                )
+            return result.select(fields, cities)
+        except Exception as e:
+            print(f"⚠️ Error loading {path}: {e}")
+            return super().get_snapshot_projection(date, fields, cities)
+
+    def get_normalized_snapshot(self, date: str | None = None) -> NormalizedSnapshot | None:
+        """Get the normalized snapshot (shared theatre table) for a date.
+
+        Loads the snapshot_{date} file written at merge time, falling back
+        to normalizing the nested movies_{date} file.
+
+        Args:
+            date: Date string in YYYY-MM-DD format (latest if None)
+
+        Returns:
+            NormalizedSnapshot or None if no data exists
+        """
+        date = date or next(iter(self.list_snapshots()), None)
+        if not date:
+            return None
+
+        for name in (f"snapshot_{date}", f"movies_{date}"):
+            file_path = find_artifact(self.data_dir, name)
+            if file_path is None:
+                continue
+            try:
+                return NormalizedSnapshot.from_snapshot(load_json(file_path))
+            except Exception as e:
+                print(f"⚠️ Error loading {file_path}: {e}")
+
+        return None
+
     def list_snapshots(self) -> list[str]:
         """List all available snapshot dates.
 
         Returns:
             List of date strings
         """
-        files = self.data_dir.glob("movies_*.json")
+        files = glob_artifacts(self.data_dir, "movies_*")
         dates = []
 
-        for f in sorted(files, reverse=True):
+        for f in reversed(files):
             # Extract date from filename
-            name = f.stem  # movies_2025-12-18
+            name = artifact_name(f)  # movies_2025-12-18
             if name.startswith("movies_"):
                 dates.append(name[7:])  # 2025-12-18
 
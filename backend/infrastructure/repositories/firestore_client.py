@@ -0,0 +1,168 @@
+"""
+Firestore Client Provider
+
+One Firestore client per process, shared by every repository and CLI.
+Credentials are resolved once:
+
+- FIREBASE_SERVICE_ACCOUNT env var (JSON string) for CI/CD, loaded in memory
+- GOOGLE_APPLICATION_CREDENTIALS file path
+- Default application credentials (local dev)
+
+Client creations and RPCs are counted so connection churn shows up in
+logs; a one-line summary is printed at exit once a client was created.
+
+Usage:
+    from backend.infrastructure.repositories.firestore_client import get_firestore_client
+
+    db = get_firestore_client()               # same client on every call
+    db = await get_async_firestore_client()   # one per event loop
+    print(client_stats().summary())
+"""
+
+import asyncio
+import atexit
+import json
+import os
+import threading
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import cache, wraps
+from typing import Any
+
+DEFAULT_PROJECT = "cineradar-481014"
+
+# Firestore API methods that each issue one RPC (streaming ones included)
+RPC_METHODS = (
+    "batch_get_documents",
+    "batch_write",
+    "begin_transaction",
+    "commit",
+    "create_document",
+    "delete_document",
+    "get_document",
+    "list_collection_ids",
+    "list_documents",
+    "partition_query",
+    "rollback",
+    "run_aggregation_query",
+    "run_query",
+    "update_document",
+)
+
+
+@dataclass
+class ClientStats:
+    """Firestore client creations and RPCs for this process."""
+
+    clients_created: int = 0
+    rpcs: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def total_rpcs(self) -> int:
+        return sum(self.rpcs.values())
+
+    def summary(self) -> str:
+        """One printable line, e.g. `1 client, 6 RPCs (commit 3, batch_get_documents 3)`."""
+        clients = f"{self.clients_created} client" + ("s" if self.clients_created != 1 else "")
+        calls = ", ".join(f"{name} {count}" for name, count in self.rpcs.most_common())
+        return f"{clients}, {self.total_rpcs} RPCs" + (f" ({calls})" if calls else "")
+
+
+_stats = ClientStats()
+_lock = threading.Lock()
+_client: Any = None
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def client_stats() -> ClientStats:
+    """Counters for every client created by this provider."""
+    return _stats
+
+
+@cache
+def _resolve_credentials() -> tuple[Any, str]:
+    """(credentials or None for the default chain, project id), resolved once."""
+    service_account_json = os.environ.get("FIREBASE_SERVICE_ACCOUNT")
+    if service_account_json:
+        from google.oauth2 import service_account
+
+        info = json.loads(service_account_json)
+        credentials = service_account.Credentials.from_service_account_info(info)
+        return credentials, info.get("project_id", DEFAULT_PROJECT)
+
+    return None, os.environ.get("FIREBASE_PROJECT_ID", DEFAULT_PROJECT)
+
+
+def _count_rpcs(client: Any) -> Any:
+    """Wrap the client's API methods so each call is counted."""
+    try:
+        api = client._firestore_api
+    except Exception:
+        return client  # Counting is best-effort; never block client creation
+
+    def counted(name: str, method: Any) -> Any:
+        @wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            _stats.rpcs[name] += 1
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    for name in RPC_METHODS:
+        method = getattr(api, name, None)
+        if method is not None:
+            setattr(api, name, counted(name, method))
+    return client
+
+
+def _print_stats() -> None:
+    print(f"🔌 Firestore: {_stats.summary()}")
+
+
+def _created(client: Any) -> Any:
+    if _stats.clients_created == 0:
+        atexit.register(_print_stats)
+    _stats.clients_created += 1
+    return _count_rpcs(client)
+
+
+def get_firestore_client() -> Any:
+    """The process-wide synchronous Firestore client (created on first use)."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                from google.cloud import firestore
+
+                credentials, project = _resolve_credentials()
+                _client = _created(firestore.Client(project=project, credentials=credentials))
+    return _client
+
+
+async def get_async_firestore_client() -> Any:
+    """An async Firestore client for the running event loop.
+
+    gRPC async channels belong to the loop they were created on, so one
+    client is kept per loop (usually one per process).
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        from google.cloud import firestore
+
+        credentials, project = _resolve_credentials()
+        client = _created(firestore.AsyncClient(project=project, credentials=credentials))
+        _async_clients[loop] = client
+    return client
+
+
+def reset_firestore_clients() -> None:
+    """Drop cached clients and credentials (e.g. after changing env vars)."""
+    global _client
+    with _lock:
+        _client = None
+        _async_clients.clear()
+        _resolve_credentials.cache_clear()
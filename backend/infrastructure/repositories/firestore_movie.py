@@ -1,14 +1,22 @@
 """
 Firestore Movie Repository
 
-Implements IMovieRepository using Firebase Firestore.
+Implements IMovieRepository using Firebase Firestore. Snapshots use the
+chunked layout (see firestore_snapshot), so city reads fetch only the
+chunks covering that city.
 """
 
+from collections.abc import Iterable
+from dataclasses import replace
 from typing import Any
 
 from backend.application.ports.storage import IMovieRepository
 from backend.domain.models import Movie, ScrapeResult
-from backend.infrastructure.repositories.firestore_token import _get_firestore_client
+from backend.infrastructure.repositories.firestore_client import get_firestore_client
+from backend.infrastructure.repositories.firestore_snapshot import (
+    read_chunked_snapshot,
+    write_chunked_snapshot,
+)
 
 
 class FirestoreMovieRepository(IMovieRepository):
@@ -36,7 +44,7 @@ class FirestoreMovieRepository(IMovieRepository):
     @property
     def db(self) -> Any:
         if self._db is None:
-            self._db = _get_firestore_client()
+            self._db = get_firestore_client()
         return self._db
 
     def save_snapshot(self, result: ScrapeResult) -> bool:
@@ -68,13 +76,9 @@ class FirestoreMovieRepository(IMovieRepository):
                     theatre_counts[city] = len(schedules)
                 movie_data["theatre_counts"] = theatre_counts
 
-            # Save to dated document
-            date_doc = self.db.collection(self.COLLECTION).document(result.date)
-            date_doc.set(data)
-
-            # Update latest
-            latest_doc = self.db.collection(self.COLLECTION).document(self.LATEST_DOC)
-            latest_doc.set(data)
+            # Save to dated document, then update latest
+            for doc_id in (result.date, self.LATEST_DOC):
+                write_chunked_snapshot(self.db.collection(self.COLLECTION).document(doc_id), data)
 
             return True
 
@@ -82,6 +86,11 @@ class FirestoreMovieRepository(IMovieRepository):
             print(f"⚠️ Error saving snapshot: {e}")
             return False
 
+    def _read(self, doc_id: str, cities: Iterable[str] | None = None) -> dict | None:
+        """Snapshot dict for a document id (chunks fetched in parallel)."""
+        doc_ref = self.db.collection(self.COLLECTION).document(doc_id)
+        return read_chunked_snapshot(doc_ref, cities)
+
     def get_latest_snapshot(self) -> ScrapeResult | None:
         """Get the most recent movie snapshot.
 
@@ -89,14 +98,8 @@ class FirestoreMovieRepository(IMovieRepository):
             ScrapeResult or None if no snapshots exist
         """
         try:
-            doc_ref = self.db.collection(self.COLLECTION).document(self.LATEST_DOC)
-            doc = doc_ref.get()
-
-            if not doc.exists:
-                return None
-
-            data = doc.to_dict()
-            return self._dict_to_result(data)
+            data = self._read(self.LATEST_DOC)
+            return self._dict_to_result(data) if data else None
 
         except Exception as e:
             print(f"⚠️ Error getting latest snapshot: {e}")
@@ -112,19 +115,80 @@ class FirestoreMovieRepository(IMovieRepository):
             ScrapeResult or None if not found
         """
         try:
-            doc_ref = self.db.collection(self.COLLECTION).document(date)
-            doc = doc_ref.get()
+            data = self._read(date)
+            return self._dict_to_result(data) if data else None
 
-            if not doc.exists:
-                return None
+        except Exception as e:
+            print(f"⚠️ Error getting snapshot for {date}: {e}")
+            return None
 
-            data = doc.to_dict()
-            return self._dict_to_result(data)
+    def get_movies_in_city(self, city: str, date: str | None = None) -> list[Movie]:
+        """Get movies showing in a city, fetching only that city's chunks.
+
+        Args:
+            city: City name (case-insensitive)
+            date: Date string in YYYY-MM-DD format
+
+        Returns:
+            Movies in display order (empty if none)
+        """
+        city = city.upper()
+        try:
+            data = self._read(date or self.LATEST_DOC, cities=[city])
+        except Exception as e:
+            print(f"⚠️ Error getting movies in {city}: {e}")
+            return []
+        if not data:
+            return []
+
+        # Older single-document snapshots still carry every city's schedules
+        movies = [Movie.from_dict(m) for m in data.get("movies", [])]
+        return [
+            replace(m, schedules={city: m.get_schedules_for_city(city)})
+            for m in movies
+            if m.is_showing_in(city)
+        ]
+
+    def get_snapshot_projection(
+        self,
+        date: str,
+        fields: Iterable[str] | None = None,
+        cities: Iterable[str] | None = None,
+    ) -> ScrapeResult | None:
+        """Get part of a snapshot, fetching only the chunks needed.
+
+        Schedule chunks are only fetched when "schedules" is in fields, and
+        then only those covering the given cities.
+
+        Args:
+            date: Date string in YYYY-MM-DD format
+            fields: Movie fields to keep ("id" always is; all if None)
+            cities: Only movies showing in these cities, with only their
+                schedules (all cities if None)
+
+        Returns:
+            ScrapeResult or None if not found
+        """
+        cities = None if cities is None else [city.upper() for city in cities]
+        chunk_cities = cities if fields is None or "schedules" in fields else []
+        try:
+            data = self._read(date, cities=chunk_cities)
+            return self._dict_to_result(data).select(fields, cities) if data else None
 
         except Exception as e:
             print(f"⚠️ Error getting snapshot for {date}: {e}")
             return None
 
+    def list_snapshots(self) -> list[str]:
+        """List all stored snapshot dates (document ids, no reads), newest first."""
+        try:
+            refs = self.db.collection(self.COLLECTION).list_documents()
+            return sorted((ref.id for ref in refs if ref.id != self.LATEST_DOC), reverse=True)
+
+        except Exception as e:
+            print(f"⚠️ Error listing snapshots: {e}")
+            return []
+
     def _dict_to_result(self, data: dict) -> ScrapeResult:
         """Convert Firestore dict to ScrapeResult."""
         movies = [Movie.from_dict(m) for m in data.get("movies", [])]
@@ -0,0 +1,170 @@
+"""
+Firestore Seat Repository
+
+Implements ISeatRepository using Firebase Firestore.
+
+Seat snapshots are partitioned by showtime date:
+
+    seat_snapshots/{date}/observations/{showtime_id}_{type}_{YYYYMMDDHHMMSS}
+
+A day's observations are one subcollection, and movie or showtime lookups
+within a day use Firestore's automatic single-field indexes. Lookups
+across days are collection group queries on `observations`, backed by the
+field overrides in firebase/firestore.indexes.json.
+
+Old days are compacted (backend.cli.compact_seats) into one summary per
+showtime under seat_archive/{date}/showtimes/{showtime_id}; the
+seat_archive/{date} document marks a day whose raw observations are gone.
+"""
+
+import hashlib
+import json
+import re
+from typing import Any
+
+from backend.application.ports.storage import ISeatRepository
+from backend.domain.models import SeatOccupancy, ShowtimeSummary
+from backend.infrastructure.repositories.firestore_client import get_firestore_client
+
+SEAT_COLLECTION = "seat_snapshots"
+OBSERVATIONS = "observations"
+ARCHIVE_COLLECTION = "seat_archive"
+ARCHIVE_SHOWTIMES = "showtimes"
+
+_DATE_ID = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def partition_date(seat: dict[str, Any]) -> str | None:
+    """Partition of an observation: its showtime date, else its scrape day."""
+    return seat.get("date") or (seat.get("scraped_at") or "")[:10] or None
+
+
+def seat_snapshot_id(seat: dict) -> str:
+    """Stable document ID for one observation: showtime, snapshot type and scrape time.
+
+    Re-uploading the same file writes the same documents, and two
+    observations of a showtime never share an ID just because they were
+    uploaded in the same minute.
+    """
+    scraped_at = seat.get("scraped_at")
+    if scraped_at:
+        stamp = re.sub(r"\D", "", scraped_at)[:14]  # YYYYMMDDHHMMSS
+    else:
+        # No timestamp: fall back to the record's content
+        encoded = json.dumps(seat, sort_keys=True, default=str).encode("utf-8")
+        stamp = hashlib.sha256(encoded).hexdigest()[:16]
+    return f"{seat.get('showtime_id')}_{seat.get('snapshot_type') or 'unknown'}_{stamp}"
+
+
+def observations_path(date: str) -> str:
+    """Collection path holding a date's observations."""
+    return f"{SEAT_COLLECTION}/{date}/{OBSERVATIONS}"
+
+
+def archive_path(date: str) -> str:
+    """Collection path holding a compacted date's showtime summaries."""
+    return f"{ARCHIVE_COLLECTION}/{date}/{ARCHIVE_SHOWTIMES}"
+
+
+class FirestoreSeatRepository(ISeatRepository):
+    """Firestore implementation of seat snapshot storage.
+
+    Example:
+        repo = FirestoreSeatRepository()
+
+        # Every observation of the day
+        seats = repo.get_by_date("2026-10-19")
+
+        # One showtime's morning and final snaps
+        history = repo.get_by_showtime("12345", date="2026-10-19")
+    """
+
+    def __init__(self, db: Any = None) -> None:
+        self._db = db
+
+    @property
+    def db(self) -> Any:
+        if self._db is None:
+            self._db = get_firestore_client()
+        return self._db
+
+    def observations(self, date: str) -> Any:
+        """CollectionReference for a date's observations."""
+        return self.db.collection(observations_path(date))
+
+    def stream_date(self, date: str) -> Any:
+        """Raw observation dicts for a date (streamed)."""
+        return (doc.to_dict() for doc in self.observations(date).stream())
+
+    def partition_dates(self) -> list[str]:
+        """Dates that have an observations partition, oldest first."""
+        refs = self.db.collection(SEAT_COLLECTION).list_documents()
+        return sorted(ref.id for ref in refs if _DATE_ID.match(ref.id))
+
+    def is_compacted(self, date: str) -> bool:
+        """True if a date's observations were (or are being) compacted."""
+        return self.db.collection(ARCHIVE_COLLECTION).document(date).get().exists
+
+    def get_summaries(self, date: str) -> list[ShowtimeSummary]:
+        """Showtime summaries of a compacted date."""
+        try:
+            docs = self.db.collection(archive_path(date)).stream()
+            return [ShowtimeSummary.from_dict(doc.to_dict()) for doc in docs]
+        except Exception as e:
+            print(f"⚠️ Error getting seat archive for {date}: {e}")
+            return []
+
+    def _query(self, field: str, value: str, date: str | None) -> list[SeatOccupancy]:
+        if date:
+            query = self.observations(date).where(field, "==", value)
+        else:
+            query = self.db.collection_group(OBSERVATIONS).where(field, "==", value)
+        return [SeatOccupancy.from_dict(doc.to_dict()) for doc in query.stream()]
+
+    def get_by_date(self, date: str) -> list[SeatOccupancy]:
+        """Get all observations for a date.
+
+        Args:
+            date: Showtime date in YYYY-MM-DD format
+
+        Returns:
+            Observations (empty if none or on error)
+        """
+        try:
+            return [SeatOccupancy.from_dict(data) for data in self.stream_date(date)]
+        except Exception as e:
+            print(f"⚠️ Error getting seat snapshots for {date}: {e}")
+            return []
+
+    def get_by_movie(self, movie_id: str, date: str | None = None) -> list[SeatOccupancy]:
+        """Get observations of a movie's showtimes.
+
+        Args:
+            movie_id: TIX.id movie identifier
+            date: Only this showtime date (all dates if None)
+
+        Returns:
+            Observations (empty if none or on error)
+        """
+        try:
+            return self._query("movie_id", str(movie_id), date)
+        except Exception as e:
+            print(f"⚠️ Error getting seat snapshots for movie {movie_id}: {e}")
+            return []
+
+    def get_by_showtime(self, showtime_id: str, date: str | None = None) -> list[SeatOccupancy]:
+        """Get every observation of one showtime, oldest first.
+
+        Args:
+            showtime_id: TIX.id showtime identifier
+            date: Showtime date, if known (narrows the read to one partition)
+
+        Returns:
+            Observations ordered by scraped_at (empty if none or on error)
+        """
+        try:
+            seats = self._query("showtime_id", str(showtime_id), date)
+        except Exception as e:
+            print(f"⚠️ Error getting seat snapshots for showtime {showtime_id}: {e}")
+            return []
+        return sorted(seats, key=lambda s: s.scraped_at or "")
@@ -0,0 +1,269 @@
+"""
+Chunked Firestore Snapshots
+
+A daily snapshot no longer fits in one Firestore document (1 MiB limit)
+once schedules or enough movies are included. The chunked layout stores a
+small manifest document plus chunk documents in its `chunks` subcollection:
+
+    snapshots/{date|latest}
+        format, version, scraped_at, date, summary, city_stats
+        movies          movies without schedules (web app reads these)
+        movie_chunks    ids of chunks holding the movies instead, when
+                        they don't fit in the manifest
+        chunks          [{id, cities, movies}] schedule chunks
+    snapshots/{date|latest}/chunks/{id}
+        {"movies": [...]} or {"schedules": {movie_id: {city: [...]}}}
+
+Schedules are packed city by city, so a client reading one city fetches
+only the chunks listing it. Chunk ids start with a hash of the movies
+(chunks hold nothing else), so a re-upload of the same data with a new
+scraped_at reuses them: only chunk ids missing from the subcollection are
+written. Changed chunks are written next to the old ones, the manifest is
+switched over, and only then are stale chunks deleted, so readers never
+see a manifest pointing at missing chunks.
+
+Usage:
+    write_chunked_snapshot(db.collection("snapshots").document("latest"), data)
+    data = read_chunked_snapshot(doc_ref)                     # everything
+    data = read_chunked_snapshot(doc_ref, cities=["MALANG"])  # one city
+"""
+
+import hashlib
+import json
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+CHUNKED_FORMAT = "chunked"
+CHUNKED_VERSION = 1
+CHUNKS_COLLECTION = "chunks"
+
+# Firestore's limit is 1 MiB per document; stay well below it
+MAX_CHUNK_BYTES = 512 * 1024
+MAX_MANIFEST_BYTES = 768 * 1024
+
+# Chunk documents fetched or written at once
+CHUNK_WORKERS = 8
+
+
+def _size(value: Any) -> int:
+    return len(
+        json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+    )
+
+
+def is_chunked(manifest: dict[str, Any] | None) -> bool:
+    """True if a snapshot document is a chunked-layout manifest."""
+    return bool(manifest) and manifest.get("format") == CHUNKED_FORMAT
+
+
+def _pack(items: Iterable[tuple[Any, int]], max_bytes: int) -> list[list[Any]]:
+    """Group items (with their sizes) into consecutive runs under max_bytes."""
+    groups: list[list[Any]] = []
+    size = 0
+    for item, item_size in items:
+        if not groups or (groups[-1] and size + item_size > max_bytes):
+            groups.append([])
+            size = 0
+        groups[-1].append(item)
+        size += item_size
+    return groups
+
+
+def build_chunked_snapshot(data: dict[str, Any]) -> tuple[dict[str, Any], dict[str, dict]]:
+    """Split a snapshot dict (movies_*.json shape) into a manifest and chunks.
+
+    Returns:
+        (manifest, {chunk_id: chunk document})
+    """
+    # Chunks only hold movies and schedules: header fields (scraped_at,
+    # summary, ...) go in the manifest and must not change chunk ids
+    generation = hashlib.sha256(
+        json.dumps(data.get("movies", []), sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()[:8]
+
+    movies = []
+    records = []  # (city, movie_id, schedules)
+    for movie in data.get("movies", []):
+        # Keep an empty schedules key where there was one, to preserve field order
+        movies.append({k: ({} if k == "schedules" else v) for k, v in movie.items()})
+        for city, city_schedules in (movie.get("schedules") or {}).items():
+            records.append((city, str(movie["id"]), city_schedules))
+
+    chunks: dict[str, dict] = {}
+    entries = []
+    records.sort(key=lambda r: r[0])
+    for n, group in enumerate(_pack(((r, _size(r)) for r in records), MAX_CHUNK_BYTES)):
+        chunk_id = f"{generation}-s{n:03d}"
+        schedules: dict[str, dict] = {}
+        for city, movie_id, city_schedules in group:
+            schedules.setdefault(movie_id, {})[city] = city_schedules
+        chunks[chunk_id] = {"schedules": schedules}
+        entries.append(
+            {
+                "id": chunk_id,
+                "cities": list(dict.fromkeys(city for city, _, _ in group)),
+                "movies": len(schedules),
+            }
+        )
+
+    manifest = {"format": CHUNKED_FORMAT, "version": CHUNKED_VERSION}
+    manifest.update((k, v) for k, v in data.items() if k != "movies")
+    manifest["chunks"] = entries
+
+    if _size(manifest) + _size(movies) <= MAX_MANIFEST_BYTES:
+        manifest["movies"] = movies
+        manifest["movie_chunks"] = []
+    else:
+        movie_chunk_ids = []
+        for n, group in enumerate(_pack(((m, _size(m)) for m in movies), MAX_CHUNK_BYTES)):
+            chunk_id = f"{generation}-m{n:03d}"
+            chunks[chunk_id] = {"movies": group}
+            movie_chunk_ids.append(chunk_id)
+        manifest["movies"] = []
+        manifest["movie_chunks"] = movie_chunk_ids
+
+    return manifest, chunks
+
+
+def assemble_snapshot(
+    manifest: dict[str, Any], chunks: dict[str, dict], cities: Iterable[str] | None = None
+) -> dict[str, Any]:
+    """Rebuild the snapshot dict from a manifest and its fetched chunks.
+
+    Args:
+        manifest: Manifest document
+        chunks: Chunk documents by id (at least those needed_chunks() names)
+        cities: Only fill schedules for these cities (all if None)
+    """
+    wanted = None if cities is None else set(cities)
+
+    movies = list(manifest.get("movies", []))
+    for chunk_id in manifest.get("movie_chunks", []):
+        movies.extend(chunks[chunk_id]["movies"])
+    by_id = {str(m["id"]): m for m in movies}
+
+    for entry in manifest.get("chunks", []):
+        if entry["id"] not in chunks:
+            continue
+        for movie_id, city_schedules in chunks[entry["id"]]["schedules"].items():
+            movie = by_id.get(movie_id)
+            if movie is None:
+                continue
+            for city, schedules in city_schedules.items():
+                if wanted is None or city in wanted:
+                    movie.setdefault("schedules", {})[city] = schedules
+
+    # Chunks are packed by city; restore each movie's own city order
+    for movie in movies:
+        schedules = movie.get("schedules")
+        if schedules:
+            order = {city: i for i, city in enumerate(movie.get("cities", []))}
+            movie["schedules"] = dict(
+                sorted(schedules.items(), key=lambda item: order.get(item[0], len(order)))
+            )
+
+    data = {
+        k: v
+        for k, v in manifest.items()
+        if k not in ("format", "version", "chunks", "movies", "movie_chunks", "city_stats")
+    }
+    data["movies"] = movies
+    if "city_stats" in manifest:
+        data["city_stats"] = manifest["city_stats"]
+    return data
+
+
+def needed_chunks(manifest: dict[str, Any], cities: Iterable[str] | None = None) -> list[str]:
+    """Chunk ids to fetch for the given cities (all chunks if None)."""
+    wanted = None if cities is None else set(cities)
+    ids = list(manifest.get("movie_chunks", []))
+    ids.extend(
+        entry["id"]
+        for entry in manifest.get("chunks", [])
+        if wanted is None or wanted.intersection(entry["cities"])
+    )
+    return ids
+
+
+def fetch_chunks(
+    ids: list[str], fetch: Callable[[str], dict], workers: int = CHUNK_WORKERS
+) -> dict[str, dict]:
+    """Fetch chunk documents in parallel."""
+    if len(ids) <= 1:
+        return {chunk_id: fetch(chunk_id) for chunk_id in ids}
+    with ThreadPoolExecutor(max_workers=min(workers, len(ids))) as pool:
+        return dict(zip(ids, pool.map(fetch, ids), strict=True))
+
+
+def read_chunked_snapshot(
+    doc_ref: Any, cities: Iterable[str] | None = None, manifest: dict[str, Any] | None = None
+) -> dict[str, Any] | None:
+    """Read a snapshot document in either layout.
+
+    Args:
+        doc_ref: Snapshot DocumentReference (e.g. snapshots/latest)
+        cities: Only load schedules for these cities (all if None)
+        manifest: Already fetched document data, to skip re-reading it
+
+    Returns:
+        Snapshot dict (movies_*.json shape), or None if the document is missing
+    """
+    if manifest is None:
+        doc = doc_ref.get()
+        if not doc.exists:
+            return None
+        manifest = doc.to_dict()
+
+    if not is_chunked(manifest):
+        return manifest  # Single-document snapshot written before chunking
+
+    cities = None if cities is None else list(cities)
+    chunk_refs = doc_ref.collection(CHUNKS_COLLECTION)
+
+    def fetch(chunk_id: str) -> dict:
+        doc = chunk_refs.document(chunk_id).get()
+        if not doc.exists:
+            raise LookupError(f"Snapshot chunk {chunk_id} is missing")
+        return doc.to_dict()
+
+    chunks = fetch_chunks(needed_chunks(manifest, cities), fetch)
+    return assemble_snapshot(manifest, chunks, cities)
+
+
+def write_chunked_snapshot(doc_ref: Any, data: dict[str, Any]) -> dict[str, int]:
+    """Write a snapshot dict as a manifest plus chunk documents.
+
+    Chunk ids are content hashes, so only ids not stored yet are written
+    (in parallel, before the manifest). The manifest is written unless the
+    stored one is identical; chunks it no longer points to are deleted
+    afterwards.
+
+    Args:
+        doc_ref: Snapshot DocumentReference (e.g. snapshots/latest)
+        data: Snapshot dict (movies_*.json shape)
+
+    Returns:
+        Counts: {"chunks": ..., "written": ..., "deleted": ...}
+    """
+    manifest, chunks = build_chunked_snapshot(data)
+    chunk_refs = doc_ref.collection(CHUNKS_COLLECTION)
+    stored = {ref.id for ref in chunk_refs.list_documents()}
+    missing = [(chunk_id, chunk) for chunk_id, chunk in chunks.items() if chunk_id not in stored]
+
+    with ThreadPoolExecutor(max_workers=CHUNK_WORKERS) as pool:
+        list(pool.map(lambda item: chunk_refs.document(item[0]).set(item[1]), missing))
+    written = len(missing)
+
+    current = doc_ref.get()
+    if not (current.exists and current.to_dict() == manifest):
+        doc_ref.set(manifest)
+        written += 1
+
+    # Only now is it safe to drop chunks the manifest no longer points to
+    deleted = 0
+    for chunk_id in sorted(stored - chunks.keys()):
+        chunk_refs.document(chunk_id).delete()
+        deleted += 1
+
+    return {"chunks": len(chunks), "written": written, "deleted": deleted}
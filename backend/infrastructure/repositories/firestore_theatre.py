@@ -4,14 +4,16 @@ Firestore Theatre Repository
 Implements ITheatreRepository using Firebase Firestore.
 """
 
+from dataclasses import replace
 from datetime import datetime
 from typing import Any
 
 from backend.application.ports.storage import ITheatreRepository
 from backend.domain.models import Theatre
 
-# Reuse firestore client helper
-from backend.infrastructure.repositories.firestore_token import _get_firestore_client
+# Shared process-wide client
+from backend.infrastructure.repositories.firestore_client import get_firestore_client
+from backend.infrastructure.repositories.firestore_writer import MAX_BATCH_SIZE
 
 
 class FirestoreTheatreRepository(ITheatreRepository):
@@ -26,6 +28,9 @@ class FirestoreTheatreRepository(ITheatreRepository):
         theatre = Theatre(theatre_id="123", name="XXI", merchant="XXI", city="JAKARTA")
         repo.upsert(theatre)
 
+        # Upsert a whole scrape's theatres in batches
+        repo.upsert_many(theatres)
+
         # Get theatres without location
         ungeocoded = repo.get_without_location()
     """
@@ -38,9 +43,52 @@ class FirestoreTheatreRepository(ITheatreRepository):
     @property
     def db(self) -> Any:
         if self._db is None:
-            self._db = _get_firestore_client()
+            self._db = get_firestore_client()
         return self._db
 
+    @staticmethod
+    def _upsert_data(theatre: Theatre, existing: dict | None, now: str) -> dict[str, Any]:
+        """Fields to write for `theatre`, given its stored document (None if new)."""
+        if existing is None:
+            return {
+                "theatre_id": str(theatre.theatre_id),
+                "name": theatre.name,
+                "merchant": theatre.merchant,
+                "city": theatre.city,
+                "address": theatre.address,
+                "lat": theatre.lat,
+                "lng": theatre.lng,
+                "place_id": theatre.place_id,
+                "room_types": theatre.room_types,
+                "last_seen": now,
+                "created_at": now,
+                "updated_at": now,
+            }
+
+        # Merge room types
+        existing_rooms = set(existing.get("room_types", []))
+        new_rooms = set(theatre.room_types)
+        merged_rooms = list(existing_rooms | new_rooms)
+
+        update_data = {
+            "name": theatre.name,
+            "merchant": theatre.merchant,
+            "city": theatre.city,
+            "address": theatre.address,
+            "last_seen": now,
+            "updated_at": now,
+            "room_types": merged_rooms,
+        }
+
+        # Only update location if provided and not already set
+        if theatre.lat is not None and existing.get("lat") is None:
+            update_data["lat"] = theatre.lat
+        if theatre.lng is not None and existing.get("lng") is None:
+            update_data["lng"] = theatre.lng
+        if theatre.place_id and not existing.get("place_id"):
+            update_data["place_id"] = theatre.place_id
+        return update_data
+
     def upsert(self, theatre: Theatre) -> bool:
         """Insert or update a theatre.
 
@@ -58,51 +106,9 @@ class FirestoreTheatreRepository(ITheatreRepository):
             now = datetime.utcnow().isoformat()
 
             if doc.exists:
-                # Update existing
-                existing = doc.to_dict()
-
-                # Merge room types
-                existing_rooms = set(existing.get("room_types", []))
-                new_rooms = set(theatre.room_types)
-                merged_rooms = list(existing_rooms | new_rooms)
-
-                update_data = {
-                    "name": theatre.name,
-                    "merchant": theatre.merchant,
-                    "city": theatre.city,
-                    "address": theatre.address,
-                    "last_seen": now,
-                    "updated_at": now,
-                    "room_types": merged_rooms,
-                }
-
-                # Only update location if provided and not already set
-                if theatre.lat is not None and existing.get("lat") is None:
-                    update_data["lat"] = theatre.lat
-                if theatre.lng is not None and existing.get("lng") is None:
-                    update_data["lng"] = theatre.lng
-                if theatre.place_id and not existing.get("place_id"):
-                    update_data["place_id"] = theatre.place_id
-
-                doc_ref.update(update_data)
+                doc_ref.update(self._upsert_data(theatre, doc.to_dict(), now))
             else:
-                # Create new
-                doc_ref.set(
-                    {
-                        "theatre_id": str(theatre.theatre_id),
-                        "name": theatre.name,
-                        "merchant": theatre.merchant,
-                        "city": theatre.city,
-                        "address": theatre.address,
-                        "lat": theatre.lat,
-                        "lng": theatre.lng,
-                        "place_id": theatre.place_id,
-                        "room_types": theatre.room_types,
-                        "last_seen": now,
-                        "created_at": now,
-                        "updated_at": now,
-                    }
-                )
+                doc_ref.set(self._upsert_data(theatre, None, now))
 
             return True
 
@@ -110,6 +116,58 @@ class FirestoreTheatreRepository(ITheatreRepository):
             print(f"⚠️ Error upserting theatre {theatre.theatre_id}: {e}")
             return False
 
+    def upsert_many(self, theatres: list[Theatre]) -> dict[str, int]:
+        """Insert or update theatres with batched reads and writes.
+
+        Theatres are handled in chunks of up to 500: existing documents are
+        fetched with one get_all() and the changes committed in one
+        WriteBatch, instead of a get and a write per theatre. Room types of
+        theatres listed more than once are merged first. Every theatre is
+        written, so last_seen always reflects the latest scrape.
+
+        Args:
+            theatres: Theatre domain objects
+
+        Returns:
+            Counts: {"total": ..., "success": ..., "failed": ...}
+        """
+        unique: dict[str, Theatre] = {}
+        for theatre in theatres:
+            theatre_id = str(theatre.theatre_id)
+            if theatre_id in unique:
+                first = unique[theatre_id]
+                rooms = list(dict.fromkeys([*first.room_types, *theatre.room_types]))
+                unique[theatre_id] = replace(first, room_types=rooms)
+            else:
+                unique[theatre_id] = theatre
+
+        items = list(unique.values())
+        success = 0
+        failed = 0
+
+        for start in range(0, len(items), MAX_BATCH_SIZE):
+            chunk = items[start : start + MAX_BATCH_SIZE]
+            try:
+                collection = self.db.collection(self.COLLECTION)
+                refs = [collection.document(str(t.theatre_id)) for t in chunk]
+                existing = {doc.id: doc.to_dict() for doc in self.db.get_all(refs) if doc.exists}
+                now = datetime.utcnow().isoformat()
+
+                batch = self.db.batch()
+                for ref, theatre in zip(refs, chunk, strict=True):
+                    current = existing.get(ref.id)
+                    if current is None:
+                        batch.set(ref, self._upsert_data(theatre, None, now))
+                    else:
+                        batch.update(ref, self._upsert_data(theatre, current, now))
+                batch.commit()
+                success += len(chunk)
+            except Exception as e:
+                print(f"⚠️ Error upserting theatres {start}-{start + len(chunk) - 1}: {e}")
+                failed += len(chunk)
+
+        return {"total": len(unique), "success": success, "failed": failed}
+
     def get_by_id(self, theatre_id: str) -> Theatre | None:
         """Get theatre by ID."""
         try:
@@ -3,35 +3,28 @@ Firestore client for CineRadar theatre database.
 Manages theatre collection with geocoding data.
 """
 
-import json
-import os
-import tempfile
 from datetime import datetime
 
+from backend.domain.models import Theatre
+from backend.infrastructure.repositories.firestore_client import get_firestore_client
+from backend.infrastructure.repositories.firestore_snapshot import write_chunked_snapshot
+from backend.infrastructure.repositories.firestore_theatre import FirestoreTheatreRepository
 
-def get_firestore_client():
-    """Get Firestore client with proper credentials.
 
-    Supports:
-    - FIREBASE_SERVICE_ACCOUNT env var (JSON string) for CI/CD
-    - GOOGLE_APPLICATION_CREDENTIALS file path
-    - Default application credentials (local dev)
-    """
-    from google.cloud import firestore
+def _validate_theatre(theatre_data: dict) -> bool:
+    """Check a theatre dict with Pydantic (True if valid or Pydantic is missing)."""
+    try:
+        from pydantic import ValidationError
 
-    # Check for service account JSON in env (for GitHub Actions)
-    service_account_json = os.environ.get("FIREBASE_SERVICE_ACCOUNT")
-    if service_account_json:
-        # Write to temp file for google-cloud-firestore
-        creds_data = json.loads(service_account_json)
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(creds_data, f)
-            temp_path = f.name
-        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = temp_path
-        return firestore.Client(project=creds_data.get("project_id", "cineradar-481014"))
+        from backend.schemas.theatre import TheatreSchema
 
-    # Default: use ADC or GOOGLE_APPLICATION_CREDENTIALS
-    return firestore.Client(project=os.environ.get("FIREBASE_PROJECT_ID", "cineradar-481014"))
+        TheatreSchema.model_validate(theatre_data)
+    except ValidationError as e:
+        print(f"⚠️ Validation failed for theatre {theatre_data.get('theatre_id')}: {e.errors()}")
+        return False
+    except ImportError:
+        pass  # Pydantic not available, skip validation
+    return True
 
 
 def upsert_theatre(theatre_data: dict, validate: bool = True) -> bool:
@@ -46,18 +39,8 @@ def upsert_theatre(theatre_data: dict, validate: bool = True) -> bool:
         True if successful
     """
     # Validate with Pydantic if enabled
-    if validate:
-        try:
-            from pydantic import ValidationError
-
-            from backend.schemas.theatre import TheatreSchema
-
-            TheatreSchema.model_validate(theatre_data)
-        except ValidationError as e:
-            print(f"⚠️ Validation failed for theatre {theatre_data.get('theatre_id')}: {e.errors()}")
-            return False
-        except ImportError:
-            pass  # Pydantic not available, skip validation
+    if validate and not _validate_theatre(theatre_data):
+        return False
 
     try:
         db = get_firestore_client()
@@ -157,58 +140,95 @@ def get_theatres_by_city(city: str) -> list[dict]:
         return []
 
 
-def sync_theatres_from_scrape(movies: list[dict]) -> dict:
+def sync_theatres_from_scrape(movies: list[dict], theatres: list[dict] | None = None) -> dict:
     """
     Sync theatres from scraped movie data to Firestore.
 
+    Uses one client and FirestoreTheatreRepository.upsert_many, so existing
+    documents are read with batched get_all calls and changes committed in
+    write batches rather than one round-trip pair per theatre. Theatres
+    unchanged since their last write are skipped (see write_skip).
+
     Args:
         movies: List of movie dicts with schedules
+        theatres: Deduplicated theatre table from a normalized snapshot;
+            when given, movies are not walked
 
     Returns:
         Summary dict with counts
     """
     seen_theatres = {}
 
-    for movie in movies:
-        schedules = movie.get("schedules", {})
-        for city, theatres in schedules.items():
-            for theatre in theatres:
-                theatre_id = theatre.get("theatre_id")
-                if not theatre_id:
-                    continue
-
-                # Collect room types from this movie
-                room_types = [
-                    r.get("category") for r in theatre.get("rooms", []) if r.get("category")
-                ]
-
-                if theatre_id in seen_theatres:
-                    # Merge room types
-                    seen_theatres[theatre_id]["room_types"].extend(room_types)
-                else:
-                    seen_theatres[theatre_id] = {
-                        "theatre_id": theatre_id,
-                        "name": theatre.get("theatre_name"),
-                        "merchant": theatre.get("merchant"),
-                        "city": city,
-                        "address": theatre.get("address"),
-                        "lat": theatre.get("lat"),
-                        "lng": theatre.get("lng"),
-                        "room_types": room_types,
-                    }
-
-    # Dedupe room types and upsert
-    success = 0
+    if theatres is not None:
+        for row in theatres:
+            seen_theatres[row["theatre_id"]] = {
+                "theatre_id": row["theatre_id"],
+                "name": row.get("theatre_name"),
+                "merchant": row.get("merchant"),
+                "city": row.get("city"),
+                "address": row.get("address"),
+                "lat": row.get("lat"),
+                "lng": row.get("lng"),
+                "room_types": list(row.get("room_types", [])),
+            }
+    else:
+        for movie in movies:
+            schedules = movie.get("schedules", {})
+            for city, city_theatres in schedules.items():
+                for theatre in city_theatres:
+                    theatre_id = theatre.get("theatre_id")
+                    if not theatre_id:
+                        continue
+
+                    # Collect room types from this movie
+                    room_types = [
+                        r.get("category") for r in theatre.get("rooms", []) if r.get("category")
+                    ]
+
+                    if theatre_id in seen_theatres:
+                        # Merge room types
+                        seen_theatres[theatre_id]["room_types"].extend(room_types)
+                    else:
+                        seen_theatres[theatre_id] = {
+                            "theatre_id": theatre_id,
+                            "name": theatre.get("theatre_name"),
+                            "merchant": theatre.get("merchant"),
+                            "city": city,
+                            "address": theatre.get("address"),
+                            "lat": theatre.get("lat"),
+                            "lng": theatre.get("lng"),
+                            "room_types": room_types,
+                        }
+
+    # Dedupe room types, validate and upsert in bulk
+    valid = []
     failed = 0
 
-    for _theatre_id, data in seen_theatres.items():
-        data["room_types"] = list(set(data["room_types"]))
-        if upsert_theatre(data):
-            success += 1
-        else:
+    for theatre_id, data in seen_theatres.items():
+        data["room_types"] = list(dict.fromkeys(data["room_types"]))
+        if not _validate_theatre(data):
             failed += 1
+            continue
+        valid.append(
+            Theatre(
+                theatre_id=str(theatre_id),
+                name=data["name"],
+                merchant=data["merchant"],
+                city=data["city"],
+                address=data["address"],
+                lat=data["lat"],
+                lng=data["lng"],
+                room_types=data["room_types"],
+            )
+        )
 
-    return {"total": len(seen_theatres), "success": success, "failed": failed}
+    repo = FirestoreTheatreRepository()
+    result = repo.upsert_many(valid)
+    return {
+        "total": len(seen_theatres),
+        "success": result["success"],
+        "failed": failed + result["failed"],
+    }
 
 
 def log_scraper_run(run_data: dict, run_type: str = "movies") -> bool:
@@ -244,6 +264,7 @@ def save_daily_snapshot(data: dict) -> bool:
     """Save daily movie snapshot to Firestore for web app.
 
     Saves to both 'latest' (for current access) and dated document (for history).
+    Documents whose content is unchanged since the last save are skipped.
     """
     try:
         db = get_firestore_client()
@@ -277,13 +298,18 @@ def save_daily_snapshot(data: dict) -> bool:
             "city_stats": data.get("city_stats", {}),
         }
 
-        # Save to 'latest' (overwrites previous)
-        db.collection("snapshots").document("latest").set(snapshot_data)
-        print("   Saved snapshot to 'latest'")
-
-        # Also save to dated document (archive)
-        db.collection("snapshots").document(date).set(snapshot_data)
-        print(f"   Archived snapshot to '{date}'")
+        # Save to 'latest' (overwrites previous), then the dated archive. Each
+        # is a manifest plus chunks, so big days stay under the 1 MiB limit
+        for doc_id, label in (
+            ("latest", "Saved snapshot to 'latest'"),
+            (date, f"Archived snapshot to '{date}'"),
+        ):
+            doc_ref = db.collection("snapshots").document(doc_id)
+            counts = write_chunked_snapshot(doc_ref, snapshot_data)
+            if counts["written"] == 0:
+                print(f"   Unchanged: snapshots/{doc_id}")
+                continue
+            print(f"   {label} ({counts['chunks']} chunks, {counts['written']} documents written)")
 
         return True
     except Exception as e:
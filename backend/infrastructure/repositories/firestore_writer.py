@@ -0,0 +1,365 @@
+"""
+Background Firestore Batch Writer
+
+Streams documents into Firestore from a background thread so producers
+(async scrapers, CLI loops) never block on a commit round-trip.
+Writes are grouped into WriteBatches and flushed when a batch fills up
+or when the flush interval elapses, whichever comes first.
+
+A write can be a create() with follow-up writes (e.g. rollup increments)
+that are only applied when the document is new, so reruns and retries
+of a commit that did go through don't apply them twice.
+
+For one-off uploads of many independent documents, bulk_set() sends
+writes through Firestore's BulkWriter instead: batches go out
+concurrently, rate-limited, and failed writes are retried.
+"""
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from backend.infrastructure.repositories.firestore_client import get_firestore_client
+from backend.infrastructure.repositories.write_skip import WriteSkipper
+
+# Firestore allows at most 500 writes per batch
+MAX_BATCH_SIZE = 500
+
+# gRPC status codes worth retrying: DEADLINE_EXCEEDED, RESOURCE_EXHAUSTED
+# (quota), ABORTED (contention), UNAVAILABLE
+RETRYABLE_CODES = frozenset({4, 8, 10, 14})
+
+
+@dataclass
+class PendingWrite:
+    """A single document write waiting to be committed.
+
+    With create=True the document must not exist yet; if it does, the
+    write and its followups are dropped instead of committed.
+    """
+
+    collection: str
+    doc_id: str
+    data: dict[str, Any]
+    merge: bool = False
+    create: bool = False
+    followups: list["PendingWrite"] = field(default_factory=list)
+
+
+def _is_conflict(error: Exception) -> bool:
+    """True if a commit failed because a created document already exists."""
+    try:
+        from google.api_core.exceptions import Conflict
+    except ImportError:
+        return False
+    return isinstance(error, Conflict)
+
+
+@dataclass
+class WriterStats:
+    """Counters for a BackgroundBatchWriter."""
+
+    queued: int = 0
+    written: int = 0
+    skipped: int = 0
+    failed: int = 0
+    batches: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+class BackgroundBatchWriter:
+    """Batched, non-blocking Firestore writer.
+
+    Example:
+        writer = BackgroundBatchWriter(on_failure=spill_to_disk)
+        writer.start()
+        writer.put("seat_snapshots", doc_id, data)
+        ...
+        writer.close()  # Drains the queue and joins the thread
+    """
+
+    def __init__(
+        self,
+        db: Any = None,
+        batch_size: int = 100,
+        flush_interval: float = 2.0,
+        max_retries: int = 2,
+        on_failure: Callable[[list[PendingWrite]], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            db: Firestore client (lazily created if None)
+            batch_size: Writes per commit (capped at 500)
+            flush_interval: Max seconds a write waits before being committed
+            max_retries: Commit retries before handing writes to on_failure
+            on_failure: Called with writes that could not be committed
+        """
+        self._db = db
+        self.batch_size = min(batch_size, MAX_BATCH_SIZE)
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.on_failure = on_failure
+        self.stats = WriterStats()
+        self._queue: queue.Queue[PendingWrite | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def db(self) -> Any:
+        if self._db is None:
+            self._db = get_firestore_client()
+        return self._db
+
+    def start(self) -> "BackgroundBatchWriter":
+        """Start the background flush thread (again, if it has stopped)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="firestore-batch-writer", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def put(
+        self,
+        collection: str,
+        doc_id: str,
+        data: dict[str, Any],
+        merge: bool = False,
+        create: bool = False,
+        followups: list[PendingWrite] | None = None,
+    ) -> None:
+        """Queue a document write. Returns immediately.
+
+        Args:
+            collection: Collection path
+            doc_id: Document ID
+            data: Document data
+            merge: Merge into an existing document instead of replacing it
+            create: Only write if the document doesn't exist yet
+            followups: Writes committed in the same batch, dropped together
+                with this one if create finds the document already stored
+        """
+        self.start()
+        self.stats.queued += 1
+        self._queue.put(PendingWrite(collection, doc_id, data, merge, create, followups or []))
+
+    def close(self, timeout: float | None = None) -> WriterStats:
+        """Flush outstanding writes and stop the thread.
+
+        Returns:
+            Final writer statistics
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                return self.stats
+            self._thread = None
+        # Queued after the thread stopped: these were never committed
+        self._fail(self._drain(), "writer thread stopped")
+        return self.stats
+
+    def __enter__(self) -> "BackgroundBatchWriter":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        pending: list[PendingWrite] = []
+        deadline: float | None = None
+
+        try:
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    # Flush interval elapsed - commit whatever is pending
+                    self._commit(pending)
+                    pending = []
+                    deadline = None
+                    continue
+
+                if item is None:
+                    self._commit(pending)
+                    pending = []
+                    return
+
+                if not pending:
+                    deadline = time.monotonic() + self.flush_interval
+                pending.append(item)
+                if len(pending) < self.batch_size:
+                    continue
+
+                self._commit(pending)
+                pending = []
+                deadline = None
+        finally:
+            # Only non-empty if the thread is dying on an unexpected error
+            self._fail(pending, "writer thread stopped")
+
+    def _commit(self, writes: list[PendingWrite]) -> None:
+        last_error: Exception | None = None
+        attempt = 0
+        while writes:
+            try:
+                batch = self.db.batch()
+                for w in writes:
+                    ref = self._ref(w)
+                    if w.create:
+                        batch.create(ref, w.data)
+                    else:
+                        batch.set(ref, w.data, merge=w.merge)
+                    for f in w.followups:
+                        batch.set(self._ref(f), f.data, merge=f.merge)
+                batch.commit()
+                self.stats.batches += 1
+                self.stats.written += len(writes)
+                return
+            except Exception as e:
+                last_error = e
+                if _is_conflict(e):
+                    # Stored by an earlier run, or by this commit before a
+                    # retry: drop those, so followups are not applied twice
+                    try:
+                        kept = self._drop_stored(writes)
+                    except Exception as read_error:
+                        last_error = read_error
+                    else:
+                        if len(kept) < len(writes):
+                            # Not an attempt: every pass drops a write, so
+                            # the rest gets its commit even after a last try
+                            writes = kept
+                            continue
+
+            if attempt >= self.max_retries:
+                break
+            time.sleep(2**attempt)
+            attempt += 1
+
+        self._fail(writes, str(last_error))
+
+    def _fail(self, writes: list[PendingWrite], error: str) -> None:
+        """Count writes that will not be committed and hand them to on_failure."""
+        if not writes:
+            return
+        self.stats.failed += len(writes)
+        self.stats.errors.append(error)
+        if self.on_failure:
+            try:
+                self.on_failure(writes)
+            except Exception as e:
+                print(f"⚠️ Could not hand off {len(writes)} failed writes: {e}")
+
+    def _drain(self) -> list[PendingWrite]:
+        """Remove and return the writes left in the queue."""
+        writes = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return writes
+            if item is not None:
+                writes.append(item)
+
+    def _ref(self, w: PendingWrite) -> Any:
+        return self.db.collection(w.collection).document(w.doc_id)
+
+    def _drop_stored(self, writes: list[PendingWrite]) -> list[PendingWrite]:
+        """Writes minus creates whose document already exists."""
+        creates = [w for w in writes if w.create]
+        stored = {
+            doc.reference.path
+            for doc in self.db.get_all([self._ref(w) for w in creates])
+            if doc.exists
+        }
+        kept = [w for w in writes if not (w.create and self._ref(w).path in stored)]
+        self.stats.skipped += len(writes) - len(kept)
+        return kept
+
+
+@dataclass
+class BulkWriteStats:
+    """Outcome and throughput of a bulk_set() upload."""
+
+    written: int = 0
+    failed: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.written / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.written} written, {self.failed} failed, {self.retries} retries "
+            f"in {self.seconds:.1f}s ({self.docs_per_second:.0f} docs/s)"
+        )
+
+
+def bulk_set(
+    writes: Iterable[tuple[Any, dict[str, Any]]],
+    db: Any = None,
+    max_attempts: int = 10,
+    skipper: WriteSkipper | None = None,
+) -> BulkWriteStats:
+    """Write documents with Firestore's BulkWriter.
+
+    Writes are queued as `writes` is consumed, so a streaming source is
+    uploaded while it is still being read. Writes failing with contention,
+    quota or availability errors are retried with exponential backoff.
+
+    Args:
+        writes: (DocumentReference, data) pairs, each written with set()
+        db: Firestore client (shared client if None)
+        max_attempts: Attempts per write before it counts as failed
+        skipper: Skip documents unchanged since they were last written
+            (the manifest is saved when the upload finishes)
+
+    Returns:
+        BulkWriteStats (timed from the first queued write to the final flush)
+    """
+    from google.cloud.firestore_v1.bulk_writer import BulkRetry, BulkWriterOptions
+
+    db = db or get_firestore_client()
+    stats = BulkWriteStats()
+    lock = threading.Lock()
+
+    # Callbacks run on the BulkWriter's worker threads
+    def on_result(reference: Any, result: Any, writer: Any) -> None:
+        with lock:
+            stats.written += 1
+        if skipper is not None:
+            skipper.record(reference.path)
+
+    def on_error(error: Any, writer: Any) -> bool:
+        retry = error.code in RETRYABLE_CODES and error.attempts < max_attempts
+        with lock:
+            if retry:
+                stats.retries += 1
+            else:
+                stats.failed += 1
+                stats.errors.append(f"{error.operation.reference.path}: {error.message}")
+        return retry
+
+    writer = db.bulk_writer(options=BulkWriterOptions(retry=BulkRetry.exponential))
+    writer.on_write_result(on_result)
+    writer.on_write_error(on_error)
+
+    start = time.monotonic()
+    try:
+        for reference, data in writes:
+            if skipper is None or skipper.check(reference.path, data):
+                writer.set(reference, data)
+    finally:
+        writer.close()  # Flushes and waits for every write (and retry)
+    stats.seconds = time.monotonic() - start
+
+    if skipper is not None:
+        skipper.save()
+    return stats
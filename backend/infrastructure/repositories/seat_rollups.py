@@ -0,0 +1,172 @@
+"""
+Daily Seat Rollups
+
+Audience totals per day, maintained as seat snapshots are uploaded, so
+the daily summary reads one document instead of scanning seat_snapshots:
+
+    seat_rollups/{date}
+        showtimes, sold, seats, available
+        movies/cities/merchants/hours/theatres
+            {key: {"showtimes": n, "sold": n, "seats": n}}
+
+A snapshot counts for the day of its seat_snapshots partition (the
+showtime date, see firestore_seat). Uploaders add each batch's deltas with
+Firestore Increment in the same commit as the snapshots, so rollups move
+atomically with the data; rebuild_rollup() recomputes a day from that
+day's partition (backfills, or days uploaded before rollups existed).
+
+Usage:
+    for doc_id, data in rollup_increments(seats).items():
+        batch.set(db.collection(ROLLUP_COLLECTION).document(doc_id), data, merge=True)
+
+    rollup = get_rollup("2026-10-18")
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from backend.infrastructure.repositories.firestore_client import get_firestore_client
+from backend.infrastructure.repositories.firestore_seat import (
+    FirestoreSeatRepository,
+    partition_date,
+)
+
+ROLLUP_COLLECTION = "seat_rollups"
+
+# Breakdown maps and the snapshot field (or derived key) each groups by
+DIMENSIONS = ("movies", "cities", "merchants", "hours", "theatres")
+COUNTERS = ("showtimes", "sold", "seats")
+
+
+def _keys(seat: dict[str, Any]) -> dict[str, str | None]:
+    showtime = seat.get("showtime") or ""
+    return {
+        "movies": seat.get("movie_id"),
+        "cities": seat.get("city"),
+        "merchants": seat.get("merchant"),
+        "hours": showtime[:2] if showtime[:2].isdigit() else None,
+        "theatres": seat.get("theatre_id"),
+    }
+
+
+@dataclass
+class SeatRollup:
+    """Counters for one day of seat snapshots."""
+
+    date: str
+    showtimes: int = 0
+    sold: int = 0
+    seats: int = 0
+    available: int = 0
+    breakdown: dict[str, dict[str, dict[str, int]]] = field(
+        default_factory=lambda: {
+            d: defaultdict(lambda: dict.fromkeys(COUNTERS, 0)) for d in DIMENSIONS
+        }
+    )
+
+    def add(self, seat: dict[str, Any]) -> None:
+        """Count one seat snapshot."""
+        sold = seat.get("sold_seats", seat.get("unavailable_seats", 0)) or 0
+        seats = seat.get("total_seats", 0) or 0
+        self.showtimes += 1
+        self.sold += sold
+        self.seats += seats
+        self.available += seat.get("available_seats", 0) or 0
+
+        for dimension, key in _keys(seat).items():
+            if key:
+                counters = self.breakdown[dimension][str(key)]
+                counters["showtimes"] += 1
+                counters["sold"] += sold
+                counters["seats"] += seats
+
+    def to_dict(self) -> dict[str, Any]:
+        """Absolute values (for rebuilding a day)."""
+        return {
+            "date": self.date,
+            "showtimes": self.showtimes,
+            "sold": self.sold,
+            "seats": self.seats,
+            "available": self.available,
+            **{d: {k: dict(v) for k, v in self.breakdown[d].items()} for d in DIMENSIONS},
+        }
+
+    def to_increments(self) -> dict[str, Any]:
+        """Firestore Increment deltas (for set(..., merge=True))."""
+        from google.cloud.firestore import Increment
+
+        data = self.to_dict()
+        for name in ("showtimes", "sold", "seats", "available"):
+            data[name] = Increment(data[name])
+        for dimension in DIMENSIONS:
+            data[dimension] = {
+                key: {name: Increment(value) for name, value in counters.items()}
+                for key, counters in data[dimension].items()
+            }
+        return data
+
+
+def build_rollups(seats: Iterable[dict[str, Any]]) -> dict[str, SeatRollup]:
+    """Rollups by day for a set of seat snapshots."""
+    rollups: dict[str, SeatRollup] = {}
+    for seat in seats:
+        day = partition_date(seat)
+        if day:
+            rollups.setdefault(day, SeatRollup(day)).add(seat)
+    return rollups
+
+
+def rollup_increments(seats: Iterable[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Increment documents by rollup id for newly written snapshots."""
+    return {day: rollup.to_increments() for day, rollup in build_rollups(seats).items()}
+
+
+def summarize_rollup(rollup: dict[str, Any]) -> dict[str, Any]:
+    """daily_summary stats from a rollup document."""
+    sold = rollup.get("sold", 0)
+    seats = rollup.get("seats", 0)
+    return {
+        "date": rollup.get("date", ""),
+        "total_audience": sold,
+        "total_seats": seats,
+        "total_available": rollup.get("available", 0),
+        "occupancy_pct": round(sold / seats * 100, 1) if seats > 0 else 0,
+        "showtime_count": rollup.get("showtimes", 0),
+        "movie_count": len(rollup.get("movies", {})),
+        "theatre_count": len(rollup.get("theatres", {})),
+        "city_count": len(rollup.get("cities", {})),
+    }
+
+
+def get_rollup(date_str: str, db: Any = None) -> dict[str, Any] | None:
+    """The rollup document for a day, or None if none was written."""
+    db = db or get_firestore_client()
+    doc = db.collection(ROLLUP_COLLECTION).document(date_str).get()
+    return doc.to_dict() if doc.exists else None
+
+
+def rebuild_rollup(date_str: str, db: Any = None) -> dict[str, Any]:
+    """Recompute a day's rollup from its seat_snapshots partition and overwrite it.
+
+    Run it for days with no upload in flight: increments committed while
+    it reads would be overwritten. Compacted days keep their rollup, since
+    their raw observations are gone.
+
+    Returns:
+        The rollup document written (or kept)
+    """
+    db = db or get_firestore_client()
+    repo = FirestoreSeatRepository(db)
+    if repo.is_compacted(date_str):
+        print(f"⚠️ {date_str} was compacted, keeping its existing rollup")
+        return get_rollup(date_str, db) or SeatRollup(date_str).to_dict()
+
+    rollup = SeatRollup(date_str)
+    for seat in repo.stream_date(date_str):
+        rollup.add(seat)
+
+    data = rollup.to_dict()
+    db.collection(ROLLUP_COLLECTION).document(date_str).set(data)
+    return data
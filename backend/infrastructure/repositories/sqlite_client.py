@@ -0,0 +1,231 @@
+"""
+SQLite Database Provider
+
+A local SQLite database holding the same data as the Firestore
+collections, so use cases, tests and historical queries can run offline
+with the SQLite repositories (sqlite_movie, sqlite_theatre, ...).
+
+One SQLiteDatabase per file per process. Connections are per thread,
+in WAL mode (readers never block the writer) with synchronous=NORMAL.
+The schema is created (and older databases migrated) on first connection.
+
+Path resolution:
+- CINERADAR_SQLITE_PATH env var
+- data/cineradar.db
+
+Usage:
+    from backend.infrastructure.repositories.sqlite_client import get_sqlite_database
+
+    db = get_sqlite_database()                  # same database on every call
+    with db.transaction() as conn:              # commit, or rollback on error
+        conn.executemany("INSERT ...", rows)
+    rows = db.connection().execute("SELECT ...").fetchall()
+"""
+
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+SQLITE_PATH_ENV = "CINERADAR_SQLITE_PATH"
+DEFAULT_SQLITE_PATH = "data/cineradar.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    date TEXT PRIMARY KEY,
+    scraped_at TEXT,
+    cities_scraped INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS movies (
+    date TEXT NOT NULL REFERENCES snapshots(date) ON DELETE CASCADE,
+    movie_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT,
+    genres TEXT,
+    poster TEXT,
+    age_category TEXT,
+    country TEXT,
+    merchants TEXT,
+    is_presale INTEGER NOT NULL DEFAULT 0,
+    cities TEXT,
+    schedule_cities TEXT, -- schedules keys, including cities with no theatres
+    PRIMARY KEY (date, movie_id)
+);
+CREATE INDEX IF NOT EXISTS idx_movies_movie ON movies(movie_id, date);
+
+-- One row per movie, city and theatre; rooms and showtimes hang off it
+CREATE TABLE IF NOT EXISTS movie_theatres (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL REFERENCES snapshots(date) ON DELETE CASCADE,
+    movie_id TEXT NOT NULL,
+    city TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    theatre_id TEXT,
+    theatre_name TEXT,
+    merchant TEXT,
+    address TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_movie_theatres_movie ON movie_theatres(date, movie_id);
+CREATE INDEX IF NOT EXISTS idx_movie_theatres_city ON movie_theatres(date, city);
+CREATE INDEX IF NOT EXISTS idx_movie_theatres_theatre ON movie_theatres(theatre_id, date);
+
+CREATE TABLE IF NOT EXISTS rooms (
+    id INTEGER PRIMARY KEY,
+    movie_theatre_id INTEGER NOT NULL REFERENCES movie_theatres(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    category TEXT,
+    price TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_rooms_movie_theatre ON rooms(movie_theatre_id);
+
+CREATE TABLE IF NOT EXISTS showtimes (
+    room_id INTEGER NOT NULL REFERENCES rooms(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    time TEXT,
+    showtime_id TEXT,
+    status INTEGER,
+    is_available INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_showtimes_room ON showtimes(room_id);
+CREATE INDEX IF NOT EXISTS idx_showtimes_showtime ON showtimes(showtime_id);
+CREATE INDEX IF NOT EXISTS idx_showtimes_date_time ON showtimes(date, time);
+
+CREATE TABLE IF NOT EXISTS theatres (
+    theatre_id TEXT PRIMARY KEY,
+    name TEXT,
+    merchant TEXT,
+    city TEXT,
+    address TEXT,
+    lat REAL,
+    lng REAL,
+    place_id TEXT,
+    room_types TEXT,
+    last_seen TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_theatres_city ON theatres(city);
+CREATE INDEX IF NOT EXISTS idx_theatres_merchant ON theatres(merchant);
+
+CREATE TABLE IF NOT EXISTS seat_snapshots (
+    id TEXT PRIMARY KEY,
+    date TEXT,
+    showtime_id TEXT NOT NULL,
+    movie_id TEXT,
+    theatre_id TEXT,
+    city TEXT,
+    scraped_at TEXT,
+    snapshot_type TEXT,
+    total_seats INTEGER,
+    sold_seats INTEGER,
+    available_seats INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_seat_snapshots_date ON seat_snapshots(date);
+CREATE INDEX IF NOT EXISTS idx_seat_snapshots_movie ON seat_snapshots(movie_id, date);
+CREATE INDEX IF NOT EXISTS idx_seat_snapshots_showtime ON seat_snapshots(showtime_id, scraped_at);
+
+CREATE TABLE IF NOT EXISTS auth_tokens (
+    id TEXT PRIMARY KEY,
+    token TEXT NOT NULL,
+    phone TEXT,
+    stored_at TEXT NOT NULL,
+    refresh_token TEXT
+);
+
+CREATE TABLE IF NOT EXISTS scraper_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    status TEXT NOT NULL,
+    movies INTEGER,
+    theatres INTEGER,
+    cities INTEGER,
+    error TEXT
+);
+"""
+
+# Columns added after a table was first released: (table, column, type)
+COLUMN_MIGRATIONS = [
+    ("movies", "schedule_cities", "TEXT"),
+]
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Add columns that databases created by older versions lack."""
+    for table, column, column_type in COLUMN_MIGRATIONS:
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+
+class SQLiteDatabase:
+    """A SQLite file with one connection per thread."""
+
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path: Database file (":memory:" for a private in-memory database)
+        """
+        self.path = str(path)
+        self._local = threading.local()
+        self._memory: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=self.path != ":memory:")
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.executescript(SCHEMA)
+        _migrate(conn)
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """This thread's connection (opened on first use)."""
+        if self.path == ":memory:":
+            # Every connection to :memory: is a new database, so share one
+            with self._lock:
+                if self._memory is None:
+                    self._memory = self._open()
+            return self._memory
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._open()
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """One write transaction: committed on success, rolled back on error."""
+        conn = self.connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+
+
+_databases: dict[str, SQLiteDatabase] = {}
+_lock = threading.Lock()
+
+
+def sqlite_path() -> str:
+    """Database file used when none is given."""
+    return os.environ.get(SQLITE_PATH_ENV, DEFAULT_SQLITE_PATH)
+
+
+def get_sqlite_database(path: str | Path | None = None) -> SQLiteDatabase:
+    """The process-wide database for a file (default: sqlite_path())."""
+    key = str(path or sqlite_path())
+    if key == ":memory:":
+        return SQLiteDatabase(key)
+    key = os.path.abspath(key)
+    with _lock:
+        if key not in _databases:
+            _databases[key] = SQLiteDatabase(key)
+        return _databases[key]
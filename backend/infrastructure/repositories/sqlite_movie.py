@@ -0,0 +1,387 @@
+"""
+SQLite Movie Repository
+
+Implements IMovieRepository using a local SQLite database.
+
+A snapshot is stored relationally (movies, movie_theatres, rooms,
+showtimes; see sqlite_client.SCHEMA) so single movies, single cities and
+showtime lookups only read their own rows. Saving a snapshot replaces
+that date in one transaction with bulk executemany inserts.
+"""
+
+import json
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+from backend.application.ports.storage import IMovieRepository
+from backend.domain.models import Movie, Room, ScrapeResult, Showtime, TheatreSchedule
+from backend.infrastructure.repositories.sqlite_client import SQLiteDatabase, get_sqlite_database
+
+
+class SQLiteMovieRepository(IMovieRepository):
+    """SQLite implementation of movie storage.
+
+    Example:
+        repo = SQLiteMovieRepository()              # data/cineradar.db
+
+        # Import a scraped snapshot
+        repo.save_snapshot(FileMovieRepository("data").get_latest_snapshot())
+
+        # Read one city without loading the rest
+        movies = repo.get_movies_in_city("BANDUNG")
+    """
+
+    def __init__(self, db: SQLiteDatabase | str | None = None) -> None:
+        """
+        Args:
+            db: Database or database file (shared default database if None)
+        """
+        self.db = db if isinstance(db, SQLiteDatabase) else get_sqlite_database(db)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def save_snapshot(self, result: ScrapeResult) -> bool:
+        """Save a daily movie snapshot, replacing any stored for that date.
+
+        Args:
+            result: ScrapeResult containing movies and metadata
+
+        Returns:
+            True if save successful
+        """
+        try:
+            with self.db.transaction() as conn:
+                conn.execute("DELETE FROM snapshots WHERE date = ?", (result.date,))
+                conn.execute(
+                    "INSERT INTO snapshots (date, scraped_at, cities_scraped) VALUES (?, ?, ?)",
+                    (result.date, result.scraped_at, result.cities_scraped),
+                )
+                conn.executemany(
+                    """
+                    INSERT INTO movies (
+                        date, movie_id, position, title, genres, poster, age_category,
+                        country, merchants, is_presale, cities, schedule_cities
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            result.date,
+                            str(movie.id),
+                            position,
+                            movie.title,
+                            json.dumps(movie.genres),
+                            movie.poster,
+                            movie.age_category,
+                            movie.country,
+                            json.dumps(movie.merchants),
+                            int(movie.is_presale),
+                            json.dumps(movie.cities),
+                            json.dumps(list(movie.schedules)),
+                        )
+                        for position, movie in enumerate(result.movies)
+                    ],
+                )
+                self._insert_schedules(conn, result)
+            return True
+        except Exception as e:
+            print(f"⚠️ Error saving snapshot {result.date} to {self.db.path}: {e}")
+            return False
+
+    def _insert_schedules(self, conn: Any, result: ScrapeResult) -> None:
+        """Bulk insert every movie's theatres, rooms and showtimes.
+
+        Row ids are assigned here (after the current maximum) so child rows
+        can reference their parents without a round trip per insert.
+        """
+
+        def next_id(table: str) -> int:
+            return conn.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}").fetchone()[0]
+
+        theatre_id, room_id = next_id("movie_theatres"), next_id("rooms")
+        theatre_rows, room_rows, showtime_rows = [], [], []
+        for movie in result.movies:
+            for city, schedules in movie.schedules.items():
+                for position, schedule in enumerate(schedules):
+                    theatre_rows.append(
+                        (
+                            theatre_id,
+                            result.date,
+                            str(movie.id),
+                            city,
+                            position,
+                            schedule.theatre_id,
+                            schedule.theatre_name,
+                            schedule.merchant,
+                            schedule.address,
+                        )
+                    )
+                    for room_position, room in enumerate(schedule.rooms):
+                        room_rows.append(
+                            (room_id, theatre_id, room_position, room.category, room.price)
+                        )
+                        showtime_rows.extend(
+                            (
+                                room_id,
+                                st_position,
+                                result.date,
+                                st.time,
+                                st.showtime_id,
+                                st.status,
+                                int(st.is_available),
+                            )
+                            for st_position, st in enumerate(room.showtimes)
+                        )
+                        room_id += 1
+                    theatre_id += 1
+
+        conn.executemany(
+            "INSERT INTO movie_theatres VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", theatre_rows
+        )
+        conn.executemany("INSERT INTO rooms VALUES (?, ?, ?, ?, ?)", room_rows)
+        conn.executemany("INSERT INTO showtimes VALUES (?, ?, ?, ?, ?, ?, ?)", showtime_rows)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _latest_date(self) -> str | None:
+        row = self.db.connection().execute("SELECT MAX(date) FROM snapshots").fetchone()
+        return row[0]
+
+    def _movies(self, date: str, movie_id: str | None = None) -> list[Movie]:
+        """Movies of a date in display order, schedules keyed but not yet filled."""
+        if movie_id is None:
+            query, params = "SELECT * FROM movies WHERE date = ? ORDER BY position", (date,)
+        else:
+            query, params = "SELECT * FROM movies WHERE date = ? AND movie_id = ?", (date, movie_id)
+        rows = self.db.connection().execute(query, params)
+        return [
+            Movie(
+                id=row["movie_id"],
+                title=row["title"],
+                genres=json.loads(row["genres"] or "[]"),
+                poster=row["poster"],
+                age_category=row["age_category"],
+                country=row["country"],
+                merchants=json.loads(row["merchants"] or "[]"),
+                is_presale=bool(row["is_presale"]),
+                cities=json.loads(row["cities"] or "[]"),
+                # Cities listed with no theatres have no movie_theatres rows
+                schedules={city: [] for city in json.loads(row["schedule_cities"] or "[]")},
+            )
+            for row in rows
+        ]
+
+    def _attach_schedules(self, movies: list[Movie], date: str, **filters: str | list[str]) -> None:
+        """Fill movies' schedules from their rows of a date, optionally filtered.
+
+        Args:
+            movies: Movies to fill (schedules of other movies are ignored)
+            date: Snapshot date
+            filters: movie_theatres column -> value or list of values
+                (e.g. city="BANDUNG", city=["BANDUNG", "MALANG"])
+        """
+        where, params = "", [date]
+        for column, value in filters.items():
+            values = value if isinstance(value, list) else [value]
+            where += f" AND t.{column} IN ({','.join('?' * len(values))})"
+            params.extend(values)
+        conn = self.db.connection()
+
+        by_room: dict[int, Room] = {}
+        rooms: dict[int, list[Room]] = defaultdict(list)
+        for row in conn.execute(
+            f"""
+            SELECT r.* FROM rooms r JOIN movie_theatres t ON t.id = r.movie_theatre_id
+            WHERE t.date = ?{where} ORDER BY r.id
+            """,
+            params,
+        ):
+            room = Room(category=row["category"], price=row["price"])
+            rooms[row["movie_theatre_id"]].append(room)
+            by_room[row["id"]] = room
+
+        for row in conn.execute(
+            f"""
+            SELECT s.* FROM showtimes s
+            JOIN rooms r ON r.id = s.room_id
+            JOIN movie_theatres t ON t.id = r.movie_theatre_id
+            WHERE t.date = ?{where} ORDER BY s.room_id, s.position
+            """,
+            params,
+        ):
+            by_room[row["room_id"]].showtimes.append(
+                Showtime(
+                    time=row["time"],
+                    showtime_id=row["showtime_id"],
+                    status=row["status"],
+                    is_available=bool(row["is_available"]),
+                )
+            )
+
+        by_movie = {str(movie.id): movie for movie in movies}
+        for row in conn.execute(
+            f"SELECT * FROM movie_theatres t WHERE t.date = ?{where} ORDER BY t.id", params
+        ):
+            movie = by_movie.get(row["movie_id"])
+            if movie is not None:
+                movie.schedules.setdefault(row["city"], []).append(
+                    TheatreSchedule(
+                        theatre_id=row["theatre_id"],
+                        theatre_name=row["theatre_name"],
+                        merchant=row["merchant"],
+                        address=row["address"],
+                        rooms=rooms.get(row["id"], []),
+                    )
+                )
+
+    def get_snapshot_by_date(self, date: str) -> ScrapeResult | None:
+        """Get snapshot for a specific date.
+
+        Args:
+            date: Date string in YYYY-MM-DD format
+
+        Returns:
+            ScrapeResult or None if not found
+        """
+        return self.get_snapshot_projection(date)
+
+    def get_snapshot_projection(
+        self,
+        date: str,
+        fields: Iterable[str] | None = None,
+        cities: Iterable[str] | None = None,
+    ) -> ScrapeResult | None:
+        """Get part of a snapshot, querying only the rows needed.
+
+        Theatre, room and showtime rows are only read when "schedules" is
+        in fields, and then only those of the given cities.
+
+        Args:
+            date: Date string in YYYY-MM-DD format
+            fields: Movie fields to keep ("id" always is; all if None)
+            cities: Only movies showing in these cities, with only their
+                schedules (all cities if None)
+
+        Returns:
+            ScrapeResult or None if not found
+        """
+        try:
+            conn = self.db.connection()
+            row = conn.execute("SELECT * FROM snapshots WHERE date = ?", (date,)).fetchone()
+            if row is None:
+                return None
+
+            movies = self._movies(date)
+            filters = {}
+            if cities is not None:
+                cities = [city.upper() for city in cities]
+                placeholders = ",".join("?" * len(cities))
+                scheduled = {
+                    r[0]
+                    for r in conn.execute(
+                        "SELECT DISTINCT movie_id FROM movie_theatres "
+                        f"WHERE date = ? AND city IN ({placeholders})",
+                        (date, *cities),
+                    )
+                }
+                movies = [
+                    m for m in movies if m.id in scheduled or not set(cities).isdisjoint(m.cities)
+                ]
+                filters["city"] = cities
+            if fields is None or "schedules" in fields:
+                self._attach_schedules(movies, date, **filters)
+
+            result = ScrapeResult(
+                movies=movies,
+                scraped_at=row["scraped_at"] or "",
+                date=date,
+                cities_scraped=row["cities_scraped"],
+                success=True,
+            )
+            return result.select(fields, cities)
+        except Exception as e:
+            print(f"⚠️ Error loading snapshot {date} from {self.db.path}: {e}")
+            return None
+
+    def get_latest_snapshot(self) -> ScrapeResult | None:
+        """Get the most recent movie snapshot.
+
+        Returns:
+            ScrapeResult or None if no snapshots exist
+        """
+        date = self._latest_date()
+        return self.get_snapshot_by_date(date) if date else None
+
+    def get_movie(self, movie_id: str, date: str | None = None) -> Movie | None:
+        """Get one movie with all its schedules, reading only its rows.
+
+        Args:
+            movie_id: TIX.id movie identifier
+            date: Date string in YYYY-MM-DD format (latest if None)
+
+        Returns:
+            Movie or None if not found
+        """
+        date = date or self._latest_date()
+        if not date:
+            return None
+        try:
+            movies = self._movies(date, str(movie_id))
+            self._attach_schedules(movies, date, movie_id=str(movie_id))
+            return movies[0] if movies else None
+        except Exception as e:
+            print(f"⚠️ Error loading movie {movie_id} from {self.db.path}: {e}")
+            return None
+
+    def get_movies_in_city(self, city: str, date: str | None = None) -> list[Movie]:
+        """Get movies showing in a city, reading only that city's schedules.
+
+        Args:
+            city: City name (case-insensitive)
+            date: Date string in YYYY-MM-DD format (latest if None)
+
+        Returns:
+            Movies in display order, with only that city's schedules
+        """
+        snapshot = self.get_snapshot_projection(date or self._latest_date() or "", cities=[city])
+        return snapshot.movies if snapshot else []
+
+    def find_showtime(self, showtime_id: str) -> dict[str, Any] | None:
+        """Context of a showtime (movie, theatre, city, room, date) by its ID.
+
+        Args:
+            showtime_id: TIX.id showtime identifier
+
+        Returns:
+            Dict of showtime fields or None if not stored
+        """
+        row = (
+            self.db.connection()
+            .execute(
+                """
+                SELECT s.showtime_id, s.date, s.time AS showtime, s.status, s.is_available,
+                       r.category AS room_category, r.price,
+                       t.movie_id, m.title AS movie_title, t.city,
+                       t.theatre_id, t.theatre_name, t.merchant
+                FROM showtimes s
+                JOIN rooms r ON r.id = s.room_id
+                JOIN movie_theatres t ON t.id = r.movie_theatre_id
+                JOIN movies m ON m.date = t.date AND m.movie_id = t.movie_id
+                WHERE s.showtime_id = ?
+                ORDER BY s.date DESC
+                LIMIT 1
+                """,
+                (str(showtime_id),),
+            )
+            .fetchone()
+        )
+        return dict(row) if row else None
+
+    def list_snapshots(self) -> list[str]:
+        """List all stored snapshot dates, newest first."""
+        rows = self.db.connection().execute("SELECT date FROM snapshots ORDER BY date DESC")
+        return [row[0] for row in rows]
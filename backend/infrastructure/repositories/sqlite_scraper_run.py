@@ -0,0 +1,65 @@
+"""
+SQLite Scraper Run Repository
+
+Implements IScraperRunRepository using a local SQLite database.
+"""
+
+from datetime import datetime
+
+from backend.application.ports.storage import IScraperRunRepository
+from backend.infrastructure.repositories.sqlite_client import SQLiteDatabase, get_sqlite_database
+
+
+class SQLiteScraperRunRepository(IScraperRunRepository):
+    """SQLite implementation of scraper run logging.
+
+    Example:
+        repo = SQLiteScraperRunRepository()
+        repo.log_run("success", movies=42, theatres=310, cities=83)
+        last = repo.get_recent_runs(1)
+    """
+
+    def __init__(self, db: SQLiteDatabase | str | None = None) -> None:
+        """
+        Args:
+            db: Database or database file (shared default database if None)
+        """
+        self.db = db if isinstance(db, SQLiteDatabase) else get_sqlite_database(db)
+
+    def log_run(
+        self,
+        status: str,
+        movies: int,
+        theatres: int,
+        cities: int,
+        error: str | None = None,
+    ) -> bool:
+        """Log a scraper run.
+
+        Returns:
+            True if logged successfully
+        """
+        try:
+            with self.db.transaction() as conn:
+                conn.execute(
+                    "INSERT INTO scraper_runs (timestamp, status, movies, theatres, cities, error) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (datetime.utcnow().isoformat(), status, movies, theatres, cities, error),
+                )
+            return True
+        except Exception as e:
+            print(f"⚠️ Error logging scraper run: {e}")
+            return False
+
+    def get_recent_runs(self, limit: int = 10) -> list[dict[str, str | int | None]]:
+        """Get recent scraper runs, most recent first."""
+        try:
+            rows = self.db.connection().execute(
+                "SELECT timestamp, status, movies, theatres, cities, error "
+                "FROM scraper_runs ORDER BY id DESC LIMIT ?",
+                (limit,),
+            )
+            return [dict(row) for row in rows]
+        except Exception as e:
+            print(f"⚠️ Error getting scraper runs: {e}")
+            return []
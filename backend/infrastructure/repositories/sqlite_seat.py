@@ -0,0 +1,131 @@
+"""
+SQLite Seat Repository
+
+Implements ISeatRepository using a local SQLite database.
+
+Observations are one row each, keyed like the Firestore documents
+({showtime_id}_{type}_{YYYYMMDDHHMMSS}), with the queried fields as
+indexed columns and the full record as JSON.
+"""
+
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from backend.application.ports.storage import ISeatRepository
+from backend.domain.models import SeatOccupancy
+from backend.infrastructure.repositories.firestore_seat import partition_date, seat_snapshot_id
+from backend.infrastructure.repositories.sqlite_client import SQLiteDatabase, get_sqlite_database
+
+
+class SQLiteSeatRepository(ISeatRepository):
+    """SQLite implementation of seat snapshot storage.
+
+    Example:
+        repo = SQLiteSeatRepository()
+        repo.save_many(seat_dicts)                  # one transaction
+
+        history = repo.get_by_showtime("12345")
+    """
+
+    def __init__(self, db: SQLiteDatabase | str | None = None) -> None:
+        """
+        Args:
+            db: Database or database file (shared default database if None)
+        """
+        self.db = db if isinstance(db, SQLiteDatabase) else get_sqlite_database(db)
+
+    def save_many(self, seats: Iterable[dict[str, Any]]) -> int:
+        """Store observations in one transaction (re-saving one replaces it).
+
+        Args:
+            seats: Seat snapshot dicts (upload_seats / final snap shape)
+
+        Returns:
+            Observations written (0 on error)
+        """
+        rows = [
+            (
+                seat_snapshot_id(seat),
+                partition_date(seat),
+                str(seat.get("showtime_id", "")),
+                seat.get("movie_id"),
+                seat.get("theatre_id"),
+                seat.get("city"),
+                seat.get("scraped_at"),
+                seat.get("snapshot_type"),
+                seat.get("total_seats", 0),
+                seat.get("sold_seats", seat.get("unavailable_seats", 0)),
+                seat.get("available_seats", 0),
+                json.dumps(seat, ensure_ascii=False, default=str),
+            )
+            for seat in seats
+        ]
+        try:
+            with self.db.transaction() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO seat_snapshots VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            return len(rows)
+        except Exception as e:
+            print(f"⚠️ Error saving {len(rows)} seat snapshots: {e}")
+            return 0
+
+    def _query(self, where: str, params: tuple) -> list[SeatOccupancy]:
+        rows = self.db.connection().execute(
+            f"SELECT data FROM seat_snapshots WHERE {where} ORDER BY scraped_at", params
+        )
+        return [SeatOccupancy.from_dict(json.loads(row[0])) for row in rows]
+
+    def get_by_date(self, date: str) -> list[SeatOccupancy]:
+        """Get all observations for a date.
+
+        Args:
+            date: Showtime date in YYYY-MM-DD format
+
+        Returns:
+            Observations (empty if none or on error)
+        """
+        try:
+            return self._query("date = ?", (date,))
+        except Exception as e:
+            print(f"⚠️ Error getting seat snapshots for {date}: {e}")
+            return []
+
+    def get_by_movie(self, movie_id: str, date: str | None = None) -> list[SeatOccupancy]:
+        """Get observations of a movie's showtimes.
+
+        Args:
+            movie_id: TIX.id movie identifier
+            date: Only this showtime date (all dates if None)
+
+        Returns:
+            Observations (empty if none or on error)
+        """
+        try:
+            if date:
+                return self._query("movie_id = ? AND date = ?", (str(movie_id), date))
+            return self._query("movie_id = ?", (str(movie_id),))
+        except Exception as e:
+            print(f"⚠️ Error getting seat snapshots for movie {movie_id}: {e}")
+            return []
+
+    def get_by_showtime(self, showtime_id: str, date: str | None = None) -> list[SeatOccupancy]:
+        """Get every observation of one showtime, oldest first.
+
+        Args:
+            showtime_id: TIX.id showtime identifier
+            date: Showtime date, if known
+
+        Returns:
+            Observations ordered by scraped_at (empty if none or on error)
+        """
+        try:
+            if date:
+                return self._query("showtime_id = ? AND date = ?", (str(showtime_id), date))
+            return self._query("showtime_id = ?", (str(showtime_id),))
+        except Exception as e:
+            print(f"⚠️ Error getting seat snapshots for showtime {showtime_id}: {e}")
+            return []
@@ -0,0 +1,206 @@
+"""
+SQLite Theatre Repository
+
+Implements ITheatreRepository using a local SQLite database, with the
+same merge rules as the Firestore repository: room types accumulate and
+a stored location is never overwritten by an upsert.
+"""
+
+import json
+from datetime import datetime
+from typing import Any
+
+from backend.application.ports.storage import ITheatreRepository
+from backend.domain.models import Theatre
+from backend.infrastructure.repositories.sqlite_client import SQLiteDatabase, get_sqlite_database
+
+# SQLite's default limit on host parameters per statement is 999
+_LOOKUP_CHUNK = 500
+
+_UPSERT = """
+INSERT INTO theatres (
+    theatre_id, name, merchant, city, address, lat, lng, place_id,
+    room_types, last_seen, created_at, updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(theatre_id) DO UPDATE SET
+    name = excluded.name,
+    merchant = excluded.merchant,
+    city = excluded.city,
+    address = excluded.address,
+    lat = COALESCE(theatres.lat, excluded.lat),
+    lng = COALESCE(theatres.lng, excluded.lng),
+    place_id = COALESCE(NULLIF(theatres.place_id, ''), excluded.place_id),
+    room_types = excluded.room_types,
+    last_seen = excluded.last_seen,
+    updated_at = excluded.updated_at
+"""
+
+
+def _from_row(row: Any) -> Theatre:
+    data = dict(row)
+    data["room_types"] = json.loads(data["room_types"] or "[]")
+    return Theatre.from_dict(data)
+
+
+class SQLiteTheatreRepository(ITheatreRepository):
+    """SQLite implementation of theatre storage.
+
+    Example:
+        repo = SQLiteTheatreRepository()
+
+        # Upsert a whole scrape's theatres in one transaction
+        repo.upsert_many(theatres)
+
+        # Get theatres without location
+        ungeocoded = repo.get_without_location()
+    """
+
+    def __init__(self, db: SQLiteDatabase | str | None = None) -> None:
+        """
+        Args:
+            db: Database or database file (shared default database if None)
+        """
+        self.db = db if isinstance(db, SQLiteDatabase) else get_sqlite_database(db)
+
+    def _stored_rooms(self, conn: Any, theatre_ids: list[str]) -> dict[str, list[str]]:
+        rooms = {}
+        for start in range(0, len(theatre_ids), _LOOKUP_CHUNK):
+            chunk = theatre_ids[start : start + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                f"SELECT theatre_id, room_types FROM theatres WHERE theatre_id IN ({placeholders})",
+                chunk,
+            ):
+                rooms[row["theatre_id"]] = json.loads(row["room_types"] or "[]")
+        return rooms
+
+    def upsert(self, theatre: Theatre) -> bool:
+        """Insert or update a theatre.
+
+        If theatre exists, merges room_types and updates last_seen.
+
+        Args:
+            theatre: Theatre domain object
+
+        Returns:
+            True if operation successful
+        """
+        return self.upsert_many([theatre])["success"] == 1
+
+    def upsert_many(self, theatres: list[Theatre]) -> dict[str, int]:
+        """Insert or update theatres in one transaction.
+
+        Stored room types are read with one query per 500 theatres, merged,
+        and every theatre written with a single executemany.
+
+        Args:
+            theatres: Theatre domain objects
+
+        Returns:
+            Counts: {"total": ..., "success": ..., "failed": ...}
+        """
+        unique: dict[str, Theatre] = {}
+        rooms: dict[str, list[str]] = {}
+        for theatre in theatres:
+            theatre_id = str(theatre.theatre_id)
+            unique.setdefault(theatre_id, theatre)
+            rooms[theatre_id] = [*rooms.get(theatre_id, []), *theatre.room_types]
+
+        try:
+            with self.db.transaction() as conn:
+                stored = self._stored_rooms(conn, list(unique))
+                now = datetime.utcnow().isoformat()
+                rows = []
+                for theatre_id, t in unique.items():
+                    merged = list(dict.fromkeys([*stored.get(theatre_id, []), *rooms[theatre_id]]))
+                    rows.append(
+                        (
+                            theatre_id,
+                            t.name,
+                            t.merchant,
+                            t.city,
+                            t.address,
+                            t.lat,
+                            t.lng,
+                            t.place_id,
+                            json.dumps(merged),
+                            now,
+                            now,
+                            now,
+                        )
+                    )
+                conn.executemany(_UPSERT, rows)
+            return {"total": len(unique), "success": len(unique), "failed": 0}
+        except Exception as e:
+            print(f"⚠️ Error upserting {len(unique)} theatres: {e}")
+            return {"total": len(unique), "success": 0, "failed": len(unique)}
+
+    def _query(self, where: str = "", params: tuple = ()) -> list[Theatre]:
+        rows = self.db.connection().execute(f"SELECT * FROM theatres {where}", params)
+        return [_from_row(row) for row in rows]
+
+    def get_by_id(self, theatre_id: str) -> Theatre | None:
+        """Get theatre by ID."""
+        try:
+            theatres = self._query("WHERE theatre_id = ?", (str(theatre_id),))
+            return theatres[0] if theatres else None
+        except Exception:
+            return None
+
+    def get_all(self) -> list[Theatre]:
+        """Get all theatres."""
+        try:
+            return self._query()
+        except Exception as e:
+            print(f"⚠️ Error getting theatres: {e}")
+            return []
+
+    def get_by_city(self, city: str) -> list[Theatre]:
+        """Get theatres in a specific city."""
+        try:
+            return self._query("WHERE city = ?", (city.upper(),))
+        except Exception as e:
+            print(f"⚠️ Error getting theatres for {city}: {e}")
+            return []
+
+    def get_by_merchant(self, merchant: str) -> list[Theatre]:
+        """Get theatres by cinema chain."""
+        try:
+            return self._query("WHERE merchant = ?", (merchant,))
+        except Exception as e:
+            print(f"⚠️ Error getting theatres for {merchant}: {e}")
+            return []
+
+    def get_without_location(self) -> list[Theatre]:
+        """Get theatres that haven't been geocoded."""
+        try:
+            return self._query("WHERE lat IS NULL OR lng IS NULL")
+        except Exception as e:
+            print(f"⚠️ Error getting theatres without location: {e}")
+            return []
+
+    def update_location(
+        self, theatre_id: str, lat: float, lng: float, place_id: str | None = None
+    ) -> bool:
+        """Update theatre location."""
+        try:
+            with self.db.transaction() as conn:
+                cursor = conn.execute(
+                    """
+                    UPDATE theatres
+                    SET lat = ?, lng = ?, place_id = COALESCE(?, place_id), updated_at = ?
+                    WHERE theatre_id = ?
+                    """,
+                    (lat, lng, place_id or None, datetime.utcnow().isoformat(), str(theatre_id)),
+                )
+            return cursor.rowcount == 1
+        except Exception as e:
+            print(f"⚠️ Error updating location for {theatre_id}: {e}")
+            return False
+
+    def count(self) -> int:
+        """Get total theatre count."""
+        try:
+            return self.db.connection().execute("SELECT COUNT(*) FROM theatres").fetchone()[0]
+        except Exception:
+            return 0
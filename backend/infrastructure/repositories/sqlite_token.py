@@ -0,0 +1,96 @@
+"""
+SQLite Token Repository
+
+Implements ITokenRepository using a local SQLite database.
+"""
+
+from backend.application.ports.storage import ITokenRepository
+from backend.domain.errors import SQLiteError
+from backend.domain.models import Token
+from backend.infrastructure.repositories.sqlite_client import SQLiteDatabase, get_sqlite_database
+
+
+class SQLiteTokenRepository(ITokenRepository):
+    """SQLite implementation of token storage.
+
+    Keeps the single current token in the auth_tokens table, under the
+    same ID as the Firestore document.
+
+    Example:
+        repo = SQLiteTokenRepository()
+        repo.store(Token.create_new("eyJ...", phone="628***"))
+
+        if repo.is_valid():
+            print(repo.get_current().get_status_message())
+    """
+
+    DOC_ID = "tix_jwt"
+
+    def __init__(self, db: SQLiteDatabase | str | None = None) -> None:
+        """
+        Args:
+            db: Database or database file (shared default database if None)
+        """
+        self.db = db if isinstance(db, SQLiteDatabase) else get_sqlite_database(db)
+
+    def store(self, token: Token) -> bool:
+        """Store a token, replacing the current one.
+
+        Args:
+            token: Token domain object
+
+        Returns:
+            True if stored successfully
+
+        Raises:
+            SQLiteError: If store fails
+        """
+        try:
+            with self.db.transaction() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO auth_tokens VALUES (?, ?, ?, ?, ?)",
+                    (self.DOC_ID, token.token, token.phone, token.stored_at, token.refresh_token),
+                )
+            return True
+        except Exception as e:
+            raise SQLiteError(f"Failed to store token: {e}") from e
+
+    def get_current(self) -> Token | None:
+        """Get the current stored token.
+
+        Returns:
+            Token or None if no token stored
+        """
+        try:
+            row = (
+                self.db.connection()
+                .execute("SELECT * FROM auth_tokens WHERE id = ?", (self.DOC_ID,))
+                .fetchone()
+            )
+            return Token.from_dict(dict(row)) if row else None
+        except Exception as e:
+            print(f"⚠️ Error getting token: {e}")
+            return None
+
+    def is_valid(self) -> bool:
+        """Check if stored token is still valid.
+
+        Returns:
+            True if token exists and not expired
+        """
+        token = self.get_current()
+        return token is not None and not token.is_expired
+
+    def delete(self) -> bool:
+        """Delete the stored token.
+
+        Returns:
+            True if deleted successfully
+        """
+        try:
+            with self.db.transaction() as conn:
+                conn.execute("DELETE FROM auth_tokens WHERE id = ?", (self.DOC_ID,))
+            return True
+        except Exception as e:
+            print(f"⚠️ Error deleting token: {e}")
+            return False
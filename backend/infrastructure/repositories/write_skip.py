@@ -0,0 +1,214 @@
+"""
+Content-Hash Write Skipping
+
+Uploaders rewrite the same Firestore documents every day even when nothing
+changed. A WriteSkipper hashes each document's canonical JSON (sorted keys,
+volatile timestamps such as uploaded_at and last_seen left out) and skips
+the write when the hash matches the one recorded the last time that
+document was written.
+
+Hashes live in a manifest per uploader, either a Firestore document
+(`_write_manifests/{name}`, one read and one write per run) or a local
+JSON file. CINERADAR_WRITE_MANIFEST selects it:
+
+    firestore (default)   Firestore manifest document
+    <directory>           Local files <directory>/write_manifest_{name}.json
+    off                   No skipping
+
+Unchanged documents are still rewritten after DEFAULT_REFRESH_DAYS, so
+volatile fields never fall more than that far behind. Documents whose
+volatile fields matter to readers (theatres' last_seen) are not skipped.
+
+Usage:
+    skipper = WriteSkipper.from_env("schedules")
+    if skipper is None or skipper.check(path, data):
+        ...write...
+        if skipper:
+            skipper.record(path)
+    skipper.save()
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+MANIFEST_ENV = "CINERADAR_WRITE_MANIFEST"
+MANIFEST_COLLECTION = "_write_manifests"
+
+# Top-level fields that change on every write without the data changing
+VOLATILE_FIELDS = frozenset({"uploaded_at", "updated_at", "last_seen", "generated_at"})
+
+# Rewrite unchanged documents after this many days
+DEFAULT_REFRESH_DAYS = 7
+
+# Forget documents not written for this many days
+PRUNE_DAYS = 30
+
+
+def content_hash(data: dict[str, Any]) -> tuple[str, int]:
+    """(hash, size in bytes) of a document's canonical JSON."""
+    canonical = json.dumps(
+        {k: v for k, v in data.items() if k not in VOLATILE_FIELDS},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    ).encode("utf-8")
+    return hashlib.sha256(canonical).hexdigest()[:32], len(canonical)
+
+
+@dataclass
+class WriteSkipStats:
+    """Writes made and avoided by a WriteSkipper."""
+
+    written: int = 0
+    skipped: int = 0
+    bytes_written: int = 0
+    bytes_skipped: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.written} written, {self.skipped} unchanged skipped "
+            f"({self.bytes_skipped / 1024:.1f} KB saved)"
+        )
+
+
+class FileManifestStore:
+    """Manifest kept in a local JSON file."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def load(self) -> dict[str, list]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, entries: dict[str, list]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(entries, separators=(",", ":")), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+
+class FirestoreManifestStore:
+    """Manifest kept in one Firestore document."""
+
+    def __init__(self, name: str, db: Any = None) -> None:
+        self.name = name
+        self._db = db
+
+    @property
+    def db(self) -> Any:
+        if self._db is None:
+            from backend.infrastructure.repositories.firestore_client import get_firestore_client
+
+            self._db = get_firestore_client()
+        return self._db
+
+    def _doc(self) -> Any:
+        return self.db.collection(MANIFEST_COLLECTION).document(self.name)
+
+    def load(self) -> dict[str, list]:
+        doc = self._doc().get()
+        return (doc.to_dict() or {}).get("entries", {}) if doc.exists else {}
+
+    def save(self, entries: dict[str, list]) -> None:
+        self._doc().set({"entries": entries})
+
+
+class WriteSkipper:
+    """Skip writes of documents whose content hash has not changed.
+
+    Thread-safe: record() may be called from writer threads.
+
+    Example:
+        >>> skipper = WriteSkipper(FileManifestStore("data/write_manifest_schedules.json"))
+        >>> if skipper.check("schedules/2026-10-19/movies/m1", doc):
+        ...     ref.set(doc)
+        ...     skipper.record("schedules/2026-10-19/movies/m1")
+        >>> skipper.save()
+    """
+
+    def __init__(
+        self,
+        store: FileManifestStore | FirestoreManifestStore,
+        name: str = "",
+        refresh_days: int = DEFAULT_REFRESH_DAYS,
+        today: date | None = None,
+    ) -> None:
+        self.store = store
+        self.name = name
+        self.refresh_days = refresh_days
+        self.today = today or date.today()
+        self.stats = WriteSkipStats()
+        self._entries: dict[str, list] | None = None  # path -> [hash, written on]
+        self._pending: dict[str, tuple[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, name: str, db: Any = None) -> "WriteSkipper | None":
+        """The skipper selected by CINERADAR_WRITE_MANIFEST (None if "off")."""
+        setting = os.environ.get(MANIFEST_ENV, "firestore").strip()
+        if setting.lower() == "off":
+            return None
+        if setting.lower() in ("", "firestore"):
+            return cls(FirestoreManifestStore(name, db), name)
+        return cls(FileManifestStore(Path(setting) / f"write_manifest_{name}.json"), name)
+
+    @property
+    def entries(self) -> dict[str, list]:
+        if self._entries is None:
+            try:
+                self._entries = self.store.load()
+            except Exception as e:
+                print(f"⚠️ Could not load write manifest '{self.name}', writing everything: {e}")
+                self._entries = {}
+        return self._entries
+
+    def check(self, path: str, data: dict[str, Any]) -> bool:
+        """True if `data` must be written to `path` (changed, new or due for refresh)."""
+        digest, size = content_hash(data)
+        entry = self.entries.get(path)
+        fresh = (
+            entry is not None
+            and entry[0] == digest
+            and (self.today - date.fromisoformat(entry[1])).days < self.refresh_days
+        )
+
+        with self._lock:
+            if fresh:
+                self.stats.skipped += 1
+                self.stats.bytes_skipped += size
+                return False
+            self._pending[path] = (digest, size)
+            return True
+
+    def record(self, path: str) -> None:
+        """Mark a document passed by check() as written."""
+        with self._lock:
+            digest, size = self._pending.pop(path)
+            self.entries[path] = [digest, self.today.isoformat()]
+            self.stats.written += 1
+            self.stats.bytes_written += size
+
+    def save(self) -> WriteSkipStats:
+        """Persist the manifest (dropping long-unwritten documents) and report."""
+        cutoff = (self.today - timedelta(days=PRUNE_DAYS)).isoformat()
+        with self._lock:
+            entries = {path: e for path, e in self.entries.items() if e[1] >= cutoff}
+        if self.stats.written or len(entries) != len(self.entries):
+            try:
+                self.store.save(entries)
+            except Exception as e:
+                print(f"⚠️ Could not save write manifest '{self.name}': {e}")
+
+        if self.stats.written or self.stats.skipped:
+            print(f"♻️ Write manifest '{self.name}': {self.stats.summary()}")
+        return self.stats
@@ -0,0 +1,74 @@
+"""
+Storage Package
+
+Local file formats for scrape artifacts.
+"""
+
+from backend.infrastructure.storage.codec import (
+    CODEC_ENV,
+    artifact_name,
+    artifact_path,
+    codec_for_path,
+    default_codec,
+    dump_json,
+    find_artifact,
+    glob_artifacts,
+    json_indent,
+    open_text,
+    open_write,
+    read_bytes,
+)
+from backend.infrastructure.storage.digest import (
+    digest_path,
+    file_hash,
+    load_digest,
+    write_digest,
+)
+from backend.infrastructure.storage.file_cache import DEFAULT_CACHE_ENTRIES, FileCache
+from backend.infrastructure.storage.indexed_snapshot import (
+    SNAP_SUFFIX,
+    IndexedSnapshot,
+    IndexedSnapshotWriter,
+)
+from backend.infrastructure.storage.json_stream import (
+    JsonObjectWriter,
+    encode_value,
+    iter_object,
+)
+from backend.infrastructure.storage.parallel_json import (
+    decode_json,
+    iter_json_files,
+    load_json,
+    load_json_files,
+)
+
+__all__ = [
+    "CODEC_ENV",
+    "DEFAULT_CACHE_ENTRIES",
+    "SNAP_SUFFIX",
+    "FileCache",
+    "IndexedSnapshot",
+    "IndexedSnapshotWriter",
+    "JsonObjectWriter",
+    "artifact_name",
+    "artifact_path",
+    "codec_for_path",
+    "decode_json",
+    "default_codec",
+    "digest_path",
+    "dump_json",
+    "encode_value",
+    "file_hash",
+    "find_artifact",
+    "glob_artifacts",
+    "iter_json_files",
+    "iter_object",
+    "json_indent",
+    "load_digest",
+    "load_json",
+    "load_json_files",
+    "open_text",
+    "open_write",
+    "read_bytes",
+    "write_digest",
+]
@@ -0,0 +1,195 @@
+"""
+Artifact Codecs
+
+Writes data/ artifacts (batch_*, movies_*, showtimes_*, seats_*, caches)
+as pretty JSON, compact JSON, or compressed JSON, and reads any of them
+back without the caller knowing which format is on disk.
+
+Codecs:
+    json     Pretty JSON, indent=2 (default - readable, diffable)
+    compact  JSON without whitespace, same .json suffix
+    gzip     Compact JSON, gzip-compressed (.json.gz)
+    zstd     Compact JSON, zstd-compressed (.json.zst, needs `zstandard`)
+
+The codec for new files comes from CINERADAR_ARTIFACT_CODEC (or an explicit
+argument). Readers detect compression from the file's magic bytes, so
+renamed or mixed-format files still load.
+
+Usage:
+    from backend.infrastructure.storage import artifact_path, dump_json, glob_artifacts
+
+    path = dump_json(data, artifact_path("data", f"movies_{date}"))
+    for path in glob_artifacts("data", "movies_*"):
+        ...
+"""
+
+import gzip
+import io
+import json
+import os
+from pathlib import Path
+from typing import IO, Any
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency
+    zstandard = None
+
+CODEC_ENV = "CINERADAR_ARTIFACT_CODEC"
+DEFAULT_CODEC = "json"
+
+SUFFIXES = {
+    "json": ".json",
+    "compact": ".json",
+    "gzip": ".json.gz",
+    "zstd": ".json.zst",
+}
+
+# Longest first so ".json.gz" is stripped before ".json"
+_ARTIFACT_SUFFIXES = (".json.gz", ".json.zst", ".json")
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def default_codec() -> str:
+    """Codec for new artifacts (CINERADAR_ARTIFACT_CODEC, default json)."""
+    codec = os.environ.get(CODEC_ENV, DEFAULT_CODEC).strip().lower() or DEFAULT_CODEC
+    if codec not in SUFFIXES:
+        raise ValueError(f"Unknown {CODEC_ENV}='{codec}', expected one of {list(SUFFIXES)}")
+    return codec
+
+
+def _require_zstd() -> None:
+    if zstandard is None:
+        raise ImportError("zstd artifacts need the zstandard package (pip install zstandard)")
+
+
+def artifact_name(path: str | Path) -> str:
+    """File name without its artifact suffix (movies_2025-12-23.json.gz -> movies_2025-12-23)."""
+    name = Path(path).name
+    for suffix in _ARTIFACT_SUFFIXES:
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+def artifact_path(directory: str | Path, name: str, codec: str | None = None) -> Path:
+    """Path for a new artifact called `name` (no suffix) written with `codec`."""
+    return Path(directory) / f"{name}{SUFFIXES[codec or default_codec()]}"
+
+
+def glob_artifacts(directory: str | Path, pattern: str) -> list[Path]:
+    """Find artifacts matching `pattern` (no suffix) in any format.
+
+    If the same artifact exists in several formats, the most recently
+    written one is returned. Results are sorted by name.
+    """
+    found: dict[str, Path] = {}
+    for suffix in _ARTIFACT_SUFFIXES:
+        for path in Path(directory).glob(f"{pattern}{suffix}"):
+            name = artifact_name(path)
+            current = found.get(name)
+            if current is None or path.stat().st_mtime > current.stat().st_mtime:
+                found[name] = path
+    return sorted(found.values(), key=artifact_name)
+
+
+def find_artifact(directory: str | Path, name: str) -> Path | None:
+    """Locate the artifact called `name` (no suffix) in any format."""
+    matches = glob_artifacts(directory, name)
+    return matches[0] if matches else None
+
+
+def _detect(head: bytes) -> str:
+    if head.startswith(_GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(_ZSTD_MAGIC):
+        return "zstd"
+    return "json"
+
+
+def read_bytes(path: str | Path) -> bytes:
+    """Read an artifact's JSON bytes, decompressing if needed."""
+    raw = Path(path).read_bytes()
+    fmt = _detect(raw[:4])
+    if fmt == "gzip":
+        return gzip.decompress(raw)
+    if fmt == "zstd":
+        _require_zstd()
+        return zstandard.ZstdDecompressor().stream_reader(io.BytesIO(raw)).read()
+    return raw
+
+
+def open_text(path: str | Path) -> IO[str]:
+    """Open an artifact for streaming text reads, decompressing if needed."""
+    with open(path, "rb") as f:
+        fmt = _detect(f.read(4))
+
+    if fmt == "gzip":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if fmt == "zstd":
+        _require_zstd()
+        # The file is handed to the caller: closing the stream closes it (closefd)
+        raw = open(path, "rb")  # noqa: SIM115
+        stream = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(io.BufferedReader(stream), encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def codec_for_path(path: str | Path) -> str:
+    """Codec implied by a file name (pretty JSON for plain .json)."""
+    name = Path(path).name
+    if name.endswith(".gz"):
+        return "gzip"
+    if name.endswith(".zst"):
+        return "zstd"
+    return "compact" if default_codec() == "compact" else "json"
+
+
+def json_indent(codec: str) -> int | None:
+    """JSON indent used inside a codec (only plain json is pretty-printed)."""
+    return 2 if codec == "json" else None
+
+
+def open_write(path: str | Path, codec: str | None = None) -> IO[str]:
+    """Open an artifact for text writing, compressing according to its suffix."""
+    codec = codec or codec_for_path(path)
+    if codec == "gzip":
+        # mtime=0 keeps output byte-identical across runs
+        raw = gzip.GzipFile(path, "wb", compresslevel=6, mtime=0)
+        return io.TextIOWrapper(raw, encoding="utf-8")
+    if codec == "zstd":
+        _require_zstd()
+        # The file is handed to the caller: closing the stream closes it (closefd)
+        raw = open(path, "wb")  # noqa: SIM115
+        stream = zstandard.ZstdCompressor(level=6).stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return open(path, "w", encoding="utf-8")
+
+
+def dump_json(
+    data: Any, path: str | Path, codec: str | None = None, ensure_ascii: bool = False
+) -> Path:
+    """Write `data` to an artifact, formatted/compressed according to its path.
+
+    Args:
+        data: JSON-serialisable data
+        path: Destination (usually from artifact_path())
+        codec: Override the codec implied by the path/environment
+
+    Returns:
+        The path written
+    """
+    path = Path(path)
+    codec = codec or codec_for_path(path)
+    indent = json_indent(codec)
+    with open_write(path, codec) as f:
+        json.dump(
+            data,
+            f,
+            indent=indent,
+            ensure_ascii=ensure_ascii,
+            separators=(",", ":") if indent is None else None,
+        )
+    return path
@@ -0,0 +1,76 @@
+"""
+Validation Digests
+
+A digest records the outcome of validating one artifact together with a
+hash of the file's bytes, in `<artifact>.digest` next to it. Later steps
+can trust the stored result instead of revalidating, as long as the file
+is unchanged and was checked by the same validation rules.
+
+Usage:
+    from backend.infrastructure.storage import load_digest, write_digest
+
+    write_digest(path, report.to_dict(), validator_fingerprint())
+    cached = load_digest(path, validator_fingerprint())  # None if stale
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+DIGEST_SUFFIX = ".digest"
+
+
+def digest_path(artifact: str | Path) -> Path:
+    """Digest file for an artifact (batch_0_2025-12-23.json -> ....json.digest)."""
+    artifact = Path(artifact)
+    return artifact.with_name(artifact.name + DIGEST_SUFFIX)
+
+
+def file_hash(path: str | Path) -> str:
+    """SHA-256 of a file's bytes (as stored, i.e. compressed if it is)."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def write_digest(
+    artifact: str | Path, report: dict[str, Any], validator: str, sha256: str | None = None
+) -> Path:
+    """Record a validation result for an artifact.
+
+    Args:
+        artifact: The validated file
+        report: Validation result (e.g. SnapshotReport.to_dict())
+        validator: Fingerprint of the rules that produced `report`
+        sha256: Hash of the validated bytes, if already known
+
+    Returns:
+        Path of the digest file
+    """
+    path = digest_path(artifact)
+    digest = {
+        "sha256": sha256 or file_hash(artifact),
+        "validator": validator,
+        "validated_at": datetime.now().isoformat(timespec="seconds"),
+        "report": report,
+    }
+    path.write_text(json.dumps(digest, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def load_digest(artifact: str | Path, validator: str) -> dict[str, Any] | None:
+    """The stored validation report, if it still applies to the artifact.
+
+    Returns None when there is no digest, it was written by different
+    validation rules, or the artifact's bytes changed since.
+    """
+    path = digest_path(artifact)
+    try:
+        digest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if digest.get("validator") != validator or digest.get("sha256") != file_hash(artifact):
+        return None
+    return digest.get("report")
@@ -0,0 +1,90 @@
+"""
+File Cache
+
+An in-process LRU cache of values parsed from files. Entries are keyed by
+the file's path, modification time and size, so a rewritten file is read
+again on its next access and never served stale. The cache holds at most
+`max_entries` parsed files; the least recently used are evicted first.
+(A file's size on disk says little about its parsed size, especially
+when it is compressed, so entries are counted instead.)
+
+Usage:
+    cache = FileCache(max_entries=4)
+    result = cache.get(path, parse_snapshot)  # parses once per file version
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Default bound: parsed files kept
+DEFAULT_CACHE_ENTRIES = 4
+
+
+class FileCache:
+    """LRU cache of parsed files keyed by (path, mtime, size).
+
+    Thread-safe. Values are shared between callers, so they should be
+    treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Parsed files to keep cached (0 disables caching)
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[Hashable, ...], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: str | Path, loader: Callable[[Path], T], kind: Hashable = None) -> T:
+        """Value of `loader(path)`, parsed at most once per file version.
+
+        Args:
+            path: File to load
+            loader: Parses the file; exceptions propagate and nothing is cached
+            kind: Distinguishes different parses of the same file
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        path = Path(path)
+        stat = os.stat(path)
+        key = (kind, str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = loader(path)
+        if self.max_entries > 0:
+            self._put(key, value)
+        return value
+
+    def _put(self, key: tuple[Hashable, ...], value: Any) -> None:
+        with self._lock:
+            # Older versions of the same file can never be hit again
+            for old in [k for k in self._entries if k[:2] == key[:2]]:
+                del self._entries[old]
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,233 @@
+"""
+Indexed Snapshot
+
+A random-access binary form of movies_{date}.json. A JSON header holds
+byte offsets for every movie and every (movie, city) schedule list,
+followed by independently decodable compact-JSON records. Files are read
+through mmap, so loading one movie or one city touches only those records.
+
+Layout:
+    b"CRSNAP01"                     magic
+    uint64 little-endian            header length
+    header JSON                     {"version", "date", ..., "movies", "cities"}
+    records                         offsets are relative to the end of the header
+
+    "movies": {movie_id: {"record": [offset, length],
+                          "cities": {city: [offset, length]}}}
+    "cities": {city: [movie_id, ...]}
+
+Usage:
+    from backend.infrastructure.storage import IndexedSnapshot, IndexedSnapshotWriter
+
+    with IndexedSnapshotWriter("data/movies_2025-12-23.snap") as writer:
+        for movie in movies:
+            writer.add_movie(movie)
+        writer.finish({"date": "2025-12-23", ...})
+
+    with IndexedSnapshot("data/movies_2025-12-23.snap") as snap:
+        malang = snap.get_city("MALANG")
+"""
+
+import json
+import mmap
+import shutil
+import struct
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from backend.infrastructure.storage.parallel_json import decode_json
+
+SNAP_SUFFIX = ".snap"
+SNAP_VERSION = 1
+
+_MAGIC = b"CRSNAP01"
+_LENGTH = struct.Struct("<Q")
+_DATA_START = len(_MAGIC) + _LENGTH.size
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class IndexedSnapshotWriter:
+    """Write an indexed snapshot one movie at a time.
+
+    Records are spooled to a temporary file next to the output and the
+    finished file replaces `path` atomically in finish().
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._records = tempfile.TemporaryFile(dir=self.path.parent)  # noqa: SIM115
+        self._movies: dict[str, dict[str, Any]] = {}
+        self._cities: dict[str, list[str]] = {}
+
+    def _write_record(self, value: Any) -> list[int]:
+        encoded = _encode(value)
+        offset = self._records.tell()
+        self._records.write(encoded)
+        return [offset, len(encoded)]
+
+    def add_movie(self, movie: dict[str, Any]) -> None:
+        """Append one nested movie dict (as stored in movies_*.json)."""
+        movie_id = str(movie["id"])
+        schedules = movie.get("schedules")
+
+        # Schedules are stored per city; keep the key (empty) to preserve field order
+        base = {k: ({} if k == "schedules" else v) for k, v in movie.items()}
+        entry: dict[str, Any] = {"record": self._write_record(base), "cities": {}}
+
+        for city, city_schedules in (schedules or {}).items():
+            entry["cities"][city] = self._write_record(city_schedules)
+        for city in dict.fromkeys([*movie.get("cities", []), *entry["cities"]]):
+            self._cities.setdefault(city, []).append(movie_id)
+
+        self._movies[movie_id] = entry
+
+    def finish(self, header: dict[str, Any], order: list[str] | None = None) -> Path:
+        """Write the header and records to `path`.
+
+        Args:
+            header: Snapshot fields (date, scraped_at, summary, city_stats, ...)
+            order: Movie ids in display order (default: insertion order)
+
+        Returns:
+            The path written
+        """
+        if order is not None:
+            rank = {movie_id: i for i, movie_id in enumerate(order)}
+            self._movies = dict(
+                sorted(self._movies.items(), key=lambda item: rank.get(item[0], len(rank)))
+            )
+            for movie_ids in self._cities.values():
+                movie_ids.sort(key=lambda movie_id: rank.get(movie_id, len(rank)))
+
+        index = {
+            "version": SNAP_VERSION,
+            **{k: v for k, v in header.items() if k not in ("movies", "cities")},
+            "movies": self._movies,
+            "cities": self._cities,
+        }
+        encoded = _encode(index)
+
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(_LENGTH.pack(len(encoded)))
+            f.write(encoded)
+            self._records.seek(0)
+            shutil.copyfileobj(self._records, f)
+        tmp_path.replace(self.path)
+        return self.path
+
+    def close(self) -> None:
+        self._records.close()
+
+    def __enter__(self) -> "IndexedSnapshotWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class IndexedSnapshot:
+    """Read movies from an indexed snapshot without decoding the whole file.
+
+    Example:
+        >>> with IndexedSnapshot("data/movies_2025-12-23.snap") as snap:
+        ...     movie = snap.get_movie("1000001")
+        ...     malang = snap.get_city("MALANG")
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{self.path} is not an indexed snapshot")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (header_length,) = _LENGTH.unpack_from(self._mm, len(_MAGIC))
+        index = decode_json(self._mm[_DATA_START : _DATA_START + header_length])
+        if index.get("version") != SNAP_VERSION:
+            raise ValueError(f"Unsupported indexed snapshot version: {index.get('version')}")
+
+        self._data_start = _DATA_START + header_length
+        self._movies: dict[str, dict[str, Any]] = index.pop("movies")
+        self._cities: dict[str, list[str]] = index.pop("cities")
+        index.pop("version")
+        self.header: dict[str, Any] = index
+
+    @property
+    def date(self) -> str:
+        return self.header.get("date", "")
+
+    @property
+    def movie_ids(self) -> list[str]:
+        """Movie ids in display order."""
+        return list(self._movies)
+
+    @property
+    def cities(self) -> list[str]:
+        return list(self._cities)
+
+    def _read(self, location: list[int]) -> Any:
+        offset, length = location
+        start = self._data_start + offset
+        return decode_json(self._mm[start : start + length])
+
+    def _load_movie(self, movie_id: str, cities: list[str] | None = None) -> dict[str, Any] | None:
+        entry = self._movies.get(movie_id)
+        if entry is None:
+            return None
+
+        movie = self._read(entry["record"])
+        if "schedules" in movie:
+            locations = entry["cities"]
+            wanted = locations if cities is None else [c for c in cities if c in locations]
+            movie["schedules"] = {city: self._read(locations[city]) for city in wanted}
+        return movie
+
+    def get_movie(self, movie_id: str) -> dict[str, Any] | None:
+        """One movie with all of its schedules (None if not in the snapshot)."""
+        return self._load_movie(str(movie_id))
+
+    def get_city(self, city: str) -> list[dict[str, Any]]:
+        """Movies showing in `city`, with only that city's schedules loaded."""
+        return [self._load_movie(movie_id, [city]) for movie_id in self._cities.get(city, [])]
+
+    def iter_movies(
+        self, cities: Iterable[str] | None = None, schedules: bool = True
+    ) -> Iterator[dict[str, Any]]:
+        """Movies in display order, reading only the records asked for.
+
+        Args:
+            cities: Only movies showing in these cities, with only their
+                schedules (all cities if None)
+            schedules: False to skip schedule records entirely
+        """
+        movie_ids: Iterable[str] = self._movies
+        if cities is not None:
+            cities = list(cities)
+            showing = {m for city in cities for m in self._cities.get(city, [])}
+            movie_ids = [m for m in self._movies if m in showing]
+        for movie_id in movie_ids:
+            yield self._load_movie(movie_id, cities if schedules else [])
+
+    def to_snapshot(self) -> dict[str, Any]:
+        """Decode everything back into the movies_*.json shape."""
+        data = {k: v for k, v in self.header.items() if k != "city_stats"}
+        data["movies"] = list(self.iter_movies())
+        if "city_stats" in self.header:
+            data["city_stats"] = self.header["city_stats"]
+        return data
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __enter__(self) -> "IndexedSnapshot":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,212 @@
+"""
+Streaming JSON Reader/Writer
+
+Reads and writes the large `{..., "movies": [...], ...}` scrape files one
+element at a time, so memory tracks the size of a single movie rather
+than the whole file.
+
+Usage:
+    from backend.infrastructure.storage import JsonObjectWriter, iter_object
+
+    for key, value in iter_object("data/batch_0_2025-12-23.json", stream_keys={"movies"}):
+        ...  # ("date", "2025-12-23"), ("movies", <movie 1>), ("movies", <movie 2>), ...
+
+    with open(path, "w", encoding="utf-8") as f, JsonObjectWriter(f) as writer:
+        writer.field("date", "2025-12-23")
+        writer.array("movies", movies_iter)
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any
+
+from backend.infrastructure.storage.codec import open_text
+
+CHUNK_SIZE = 1 << 16
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+class _TextBuffer:
+    """Sliding window over a text file, refilled on demand."""
+
+    def __init__(self, f: IO[str], chunk_size: int = CHUNK_SIZE) -> None:
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, min_chunk: int | None = None) -> bool:
+        """Read more text, dropping what was already consumed. False at EOF."""
+        if self.eof:
+            return False
+        chunk = self._f.read(min_chunk or self._chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character (empty string at EOF)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self.fill():
+                return self.buf[self.pos : self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expected {char!r}, found {found!r}", self.buf, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more text as needed."""
+        self.peek()
+        read_size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+                # A number running into the end of the buffer may be cut off
+                if self.eof or (end < len(self.buf) and self.buf[end] not in _NUMBER_CHARS):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # Value spans past the buffer: read more (doubling to stay linear)
+            self.fill(read_size)
+            read_size *= 2
+
+
+def iter_object(
+    path: str | Path, stream_keys: Iterable[str] = (), chunk_size: int = CHUNK_SIZE
+) -> Iterator[tuple[str, Any]]:
+    """Iterate the top-level fields of a JSON object file.
+
+    Args:
+        path: JSON artifact (any codec) whose root is an object
+        stream_keys: Keys whose array values are yielded one element at a
+            time as (key, element) instead of as a single list
+        chunk_size: Characters read per refill
+
+    Yields:
+        (key, value) pairs in file order
+    """
+    stream = set(stream_keys)
+
+    with open_text(path) as f:
+        reader = _TextBuffer(f, chunk_size)
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+
+        while True:
+            key = reader.value()
+            reader.expect(":")
+
+            if key in stream and reader.peek() == "[":
+                reader.expect("[")
+                if reader.peek() != "]":
+                    while True:
+                        yield key, reader.value()
+                        if reader.peek() != ",":
+                            break
+                        reader.expect(",")
+                reader.expect("]")
+            else:
+                yield key, reader.value()
+
+            if reader.peek() != ",":
+                break
+            reader.expect(",")
+
+        reader.expect("}")
+
+
+def encode_value(
+    value: Any, level: int = 0, indent: int | None = 2, ensure_ascii: bool = False
+) -> str:
+    """Encode a value as json.dump would write it `level` levels deep."""
+    text = json.dumps(
+        value,
+        indent=indent,
+        ensure_ascii=ensure_ascii,
+        separators=(",", ":") if indent is None else None,
+    )
+    if indent is None:
+        return text
+    # JSON strings never contain raw newlines, so this only shifts structure
+    return text.replace("\n", "\n" + " " * (indent * level))
+
+
+class JsonObjectWriter:
+    """Write a JSON object field by field, streaming array elements.
+
+    Output is identical to json.dump(obj, f, indent=indent) for the same data.
+    """
+
+    def __init__(self, f: IO[str], indent: int | None = 2, ensure_ascii: bool = False) -> None:
+        self._f = f
+        self._indent = indent
+        self._ensure_ascii = ensure_ascii
+        self._fields = 0
+        self._closed = False
+        self._sep = "," if indent is None else ",\n"
+        self._pad = "" if indent is None else " " * indent
+        f.write("{" if indent is None else "{\n")
+
+    def _key(self, key: str) -> None:
+        if self._fields:
+            self._f.write(self._sep)
+        self._fields += 1
+        colon = ":" if self._indent is None else ": "
+        self._f.write(f"{self._pad}{json.dumps(key, ensure_ascii=self._ensure_ascii)}{colon}")
+
+    def field(self, key: str, value: Any) -> None:
+        """Write one key/value pair."""
+        self._key(key)
+        self._f.write(encode_value(value, 1, self._indent, self._ensure_ascii))
+
+    def array(self, key: str, items: Iterable[Any]) -> int:
+        """Write an array field from an iterable without materialising it.
+
+        Returns:
+            Number of elements written
+        """
+        return self.array_encoded(
+            key, (encode_value(item, 2, self._indent, self._ensure_ascii) for item in items)
+        )
+
+    def array_encoded(self, key: str, texts: Iterable[str]) -> int:
+        """Write an array field from elements pre-encoded with encode_value(item, level=2)."""
+        self._key(key)
+        self._f.write("[")
+        count = 0
+        for text in texts:
+            if count:
+                self._f.write(",")
+            if self._indent is not None:
+                self._f.write("\n" + self._pad * 2)
+            self._f.write(text)
+            count += 1
+        if count and self._indent is not None:
+            self._f.write("\n" + self._pad)
+        self._f.write("]")
+        return count
+
+    def close(self) -> None:
+        if not self._closed:
+            self._f.write("}" if self._indent is None else "\n}")
+            self._closed = True
+
+    def __enter__(self) -> "JsonObjectWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -8,11 +8,13 @@ from backend.schemas.movie import (
     MovieSchema,
     RoomSchema,
     ShowtimeSchema,
+    SnapshotHeaderSchema,
     TheatreScheduleSchema,
 )
 from backend.schemas.scraper_run import ScraperRunSchema
 from backend.schemas.theatre import TheatreSchema
 from backend.schemas.token import TokenSchema
+from backend.schemas.validator import SnapshotReport, validate_snapshot
 
 __all__ = [
     # Movie schemas
@@ -21,10 +23,14 @@ __all__ = [
     "TheatreScheduleSchema",
     "MovieSchema",
     "DailySnapshotSchema",
+    "SnapshotHeaderSchema",
     # Theatre
     "TheatreSchema",
     # Token
     "TokenSchema",
     # Scraper run
     "ScraperRunSchema",
+    # Validator
+    "SnapshotReport",
+    "validate_snapshot",
 ]
@@ -100,11 +100,11 @@ class SummarySchema(BaseModel):
     presale_count: int = Field(ge=0, default=0)
 
 
-class DailySnapshotSchema(BaseModel):
-    """Full daily scrape output - the main validation target.
+class SnapshotHeaderSchema(BaseModel):
+    """Top-level snapshot fields other than movies.
 
-    This schema validates the entire merged output before Firestore upload.
-    Batch files may not have summary - it's added during merge.
+    Lets streaming readers validate the envelope while checking each
+    movie on its own with MovieSchema.
     """
 
     scraped_at: str = Field(..., description="ISO timestamp of scrape completion")
@@ -112,10 +112,19 @@ class DailySnapshotSchema(BaseModel):
     summary: SummarySchema | None = Field(
         default_factory=SummarySchema, description="Summary stats (optional in batches)"
     )
-    movies: list[MovieSchema] = Field(..., min_length=1, description="At least 1 movie expected")
     city_stats: dict[str, int] = Field(default_factory=dict)
     batch: int | None = Field(None, description="Batch number if this is a batch file")
 
+
+class DailySnapshotSchema(SnapshotHeaderSchema):
+    """Full daily scrape output - the main validation target.
+
+    This schema validates the entire merged output before Firestore upload.
+    Batch files may not have summary - it's added during merge.
+    """
+
+    movies: list[MovieSchema] = Field(..., min_length=1, description="At least 1 movie expected")
+
     def integrity_check(self, min_movies: int = 10, min_cities: int = 50) -> None:
         """Run integrity assertions.
 
@@ -0,0 +1,229 @@
+"""
+Snapshot Validator
+Validates daily snapshots straight from JSON bytes and gathers integrity
+stats in the same pass.
+
+Full mode hands the raw bytes to pydantic-core (`model_validate_json`), so
+there is no separate json.load. Sampled mode checks the envelope plus a
+deterministic sample of movies, for quick re-checks of data that was
+already validated movie by movie at merge time.
+
+Usage:
+    from backend.schemas.validator import validate_snapshot
+
+    report = validate_snapshot(raw_bytes)              # every movie
+    report = validate_snapshot(raw_bytes, sample=25)   # 25 movies
+    if not report.valid:
+        print(report.errors)
+"""
+
+import hashlib
+import json
+import random
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field, fields
+from functools import cache
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
+
+from backend.domain.models.snapshot import denormalize_snapshot
+from backend.schemas.movie import DailySnapshotSchema, MovieSchema, SnapshotHeaderSchema
+
+# Errors reported before the rest are summarised
+MAX_ERRORS = 10
+
+# Bump when validation rules change outside the schemas' JSON schema
+# (e.g. field_validator logic), so cached validation digests are discarded
+VALIDATOR_VERSION = 1
+
+# Normalized snapshots start with "format"; detect them without parsing
+_NORMALIZED_PREFIX = re.compile(rb'^\s*\{\s*"format"\s*:\s*"normalized"')
+
+
+@dataclass
+class SnapshotReport:
+    """Validation outcome and integrity stats for one snapshot."""
+
+    valid: bool
+    date: str = ""
+    movies: int = 0
+    cities: int = 0
+    presale_count: int = 0
+    movies_with_schedules: int = 0
+    theatres: int = 0
+    showtimes: int = 0
+    merchants: list[str] = field(default_factory=list)
+    sampled: int | None = None  # Movies schema-checked in sampled mode
+    errors: list[str] = field(default_factory=list)
+
+    _cities: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _theatres: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _merchants: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def add_movie(self, movie: Any) -> None:
+        """Count one movie (validated model or raw dict) into the stats."""
+        self.movies += 1
+        self.presale_count += bool(_get(movie, "is_presale"))
+        self._merchants.update(_get(movie, "merchants") or [])
+        self._cities.update(_get(movie, "cities") or [])
+
+        schedules = _get(movie, "schedules") or {}
+        self.movies_with_schedules += bool(schedules)
+        for city_schedules in schedules.values():
+            for schedule in city_schedules:
+                self._theatres.add(_get(schedule, "theatre_id"))
+                for room in _get(schedule, "rooms") or []:
+                    self.showtimes += len(_get(room, "all_showtimes") or [])
+
+    def finish(self, city_stats: dict) -> "SnapshotReport":
+        """Finalise set-based stats once every movie was added."""
+        # city_stats is what the scraper covered; movie cities are the fallback
+        self.cities = len(city_stats) if city_stats else len(self._cities)
+        self.theatres = len(self._theatres)
+        self.merchants = sorted(self._merchants)
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """Public fields, for storing in a validation digest."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SnapshotReport":
+        """Create from to_dict() output."""
+        names = {f.name for f in fields(cls) if f.init}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+    def integrity_errors(self, min_movies: int = 10, min_cities: int = 50) -> list[str]:
+        """Threshold checks (same rules as DailySnapshotSchema.integrity_check)."""
+        errors = []
+        if self.movies < min_movies:
+            errors.append(f"Too few movies: {self.movies} < {min_movies}")
+        if self.cities < min_cities:
+            errors.append(f"Too few cities: {self.cities} < {min_cities}")
+        return errors
+
+
+@cache
+def validator_fingerprint() -> str:
+    """Identifies the current validation rules (schema + VALIDATOR_VERSION)."""
+    schema = json.dumps(DailySnapshotSchema.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(f"{VALIDATOR_VERSION}:{schema}".encode()).hexdigest()[:16]
+
+
+@cache
+def movie_list_adapter() -> TypeAdapter[list[MovieSchema]]:
+    """Compiled validator for a list of movies (built once per process)."""
+    return TypeAdapter(list[MovieSchema])
+
+
+def format_errors(error: ValidationError, prefix: tuple = ()) -> list[str]:
+    """Printable `loc → loc: msg` lines for a pydantic error."""
+    return [
+        " → ".join(str(x) for x in (*prefix, *e["loc"])) + f": {e['msg']}" for e in error.errors()
+    ]
+
+
+def validate_movie(movie: dict[str, Any], position: int) -> list[str]:
+    """Validate one movie dict, returning printable error lines."""
+    try:
+        MovieSchema.model_validate(movie)
+        return []
+    except ValidationError as e:
+        return format_errors(e, ("movies", position))
+
+
+def _get(obj: Any, name: str) -> Any:
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name)
+
+
+def _fill_stats(report: SnapshotReport, movies: Iterable[Any], city_stats: dict) -> None:
+    """Integrity stats over validated models or raw dicts."""
+    for movie in movies:
+        report.add_movie(movie)
+    report.finish(city_stats)
+
+
+def _validate_full(source: bytes | dict[str, Any]) -> SnapshotReport:
+    try:
+        if isinstance(source, bytes):
+            snapshot = DailySnapshotSchema.model_validate_json(source)
+        else:
+            snapshot = DailySnapshotSchema.model_validate(source)
+    except ValidationError as e:
+        return SnapshotReport(valid=False, errors=format_errors(e))
+
+    report = SnapshotReport(valid=True, date=snapshot.date)
+    _fill_stats(report, snapshot.movies, snapshot.city_stats)
+    return report
+
+
+def _validate_sampled(data: dict[str, Any], sample: int, seed: str | None) -> SnapshotReport:
+    errors: list[str] = []
+    movies = data.get("movies")
+    if not isinstance(movies, list) or not movies:
+        errors.append("movies: At least 1 movie expected")
+        movies = []
+
+    try:
+        SnapshotHeaderSchema.model_validate({k: v for k, v in data.items() if k != "movies"})
+    except ValidationError as e:
+        errors.extend(format_errors(e))
+
+    # Same sample for the same day, so reruns are reproducible
+    positions = sorted(
+        random.Random(seed or data.get("date") or "").sample(
+            range(len(movies)), min(sample, len(movies))
+        )
+    )
+    try:
+        movie_list_adapter().validate_python([movies[i] for i in positions])
+    except ValidationError as e:
+        for err in e.errors():
+            position, *loc = err["loc"]
+            errors.append(
+                " → ".join(str(x) for x in ("movies", positions[position], *loc))
+                + f": {err['msg']}"
+            )
+
+    report = SnapshotReport(
+        valid=not errors, date=data.get("date", ""), sampled=len(positions), errors=errors
+    )
+    if not errors:
+        _fill_stats(report, movies, data.get("city_stats") or {})
+    return report
+
+
+def validate_snapshot(
+    raw: bytes, sample: int | None = None, seed: str | None = None
+) -> SnapshotReport:
+    """Validate a daily snapshot from its JSON bytes.
+
+    Args:
+        raw: Snapshot JSON (nested or normalized layout, uncompressed)
+        sample: Schema-check only this many movies (all if None);
+            stats still cover every movie
+        seed: Sample seed (default: the snapshot date)
+
+    Returns:
+        SnapshotReport (errors capped at MAX_ERRORS, with a summary line)
+    """
+    if sample is None and not _NORMALIZED_PREFIX.match(raw[:64]):
+        report = _validate_full(raw)
+    else:
+        try:
+            data = from_json(raw)
+        except ValueError as e:
+            return SnapshotReport(valid=False, errors=[f"Invalid JSON: {e}"])
+        if not isinstance(data, dict):
+            return SnapshotReport(valid=False, errors=["Snapshot must be a JSON object"])
+
+        data = denormalize_snapshot(data)
+        report = _validate_full(data) if sample is None else _validate_sampled(data, sample, seed)
+
+    if len(report.errors) > MAX_ERRORS:
+        extra = len(report.errors) - MAX_ERRORS
+        report.errors = [*report.errors[:MAX_ERRORS], f"... and {extra} more errors"]
+    return report
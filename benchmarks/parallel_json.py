@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Parallel JSON Loader Benchmark
+
+Times sequential json.load against backend.infrastructure.storage's
+parallel loader on generated day-sized batch files.
+
+Usage:
+    python -m benchmarks.parallel_json --bench
+    python -m benchmarks.parallel_json --bench --files 18 --movies 60
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from backend.infrastructure.storage import load_json, load_json_files
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _fake_movie(i: int, cities: int = 20) -> dict:
+    """A movie shaped like real scrape output."""
+    base_id = 2000000000000000000 + i * 100000
+    return {
+        "id": str(1000000 + i),
+        "title": f"Movie {i}",
+        "genres": ["Drama", "Action"],
+        "poster": f"https://example.com/posters/{i}.jpg",
+        "merchants": ["XXI", "CGV", "Cinépolis"],
+        "is_presale": i % 10 == 0,
+        "cities": [f"CITY {c}" for c in range(cities)],
+        "schedules": {
+            f"CITY {c}": [
+                {
+                    "theatre_id": str(900000000000 + c * 100 + t),
+                    "theatre_name": f"THEATRE {c}-{t} XXI",
+                    "merchant": "XXI",
+                    "address": f"Jl. Contoh No. {t}, Kota {c}",
+                    "rooms": [
+                        {
+                            "category": category,
+                            "price": "Rp45.000",
+                            "all_showtimes": [
+                                {
+                                    "time": f"{h:02d}:{(t * 5) % 60:02d}",
+                                    "showtime_id": str(base_id + c * 1000 + t * 10 + h),
+                                    "status": 1,
+                                    "is_available": True,
+                                }
+                                for h in range(11, 23, 2)
+                            ],
+                        }
+                        for category in ("2D", "IMAX")
+                    ],
+                }
+                for t in range(4)
+            ]
+            for c in range(cities)
+        },
+    }
+
+
+def _write_bench_files(directory: Path, files: int, movies_per_file: int) -> list[Path]:
+    paths = []
+    for b in range(files):
+        path = directory / f"batch_{b}_bench.json"
+        data = {
+            "scraped_at": "2025-01-01 06:00:00",
+            "date": "2025-01-01",
+            "batch": b,
+            "movies": [_fake_movie(b * movies_per_file + i) for i in range(movies_per_file)],
+            "city_stats": {f"CITY {c}": movies_per_file for c in range(20)},
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        paths.append(path)
+    return paths
+
+
+def run_benchmark(files: int = 9, movies_per_file: int = 40, repeat: int = 3) -> dict[str, float]:
+    """Time sequential json.load against the parallel loader (best of `repeat`)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_bench_files(Path(tmp), files, movies_per_file)
+        total_mb = sum(p.stat().st_size for p in paths) / 1024 / 1024
+        print(f"📦 {files} files, {total_mb:.1f} MB total, {os.cpu_count()} CPUs")
+
+        # Every candidate keeps all decoded files alive, like the real callers
+        def sequential() -> list[Any]:
+            results = []
+            for path in paths:
+                with open(path, encoding="utf-8") as f:
+                    results.append(json.load(f))
+            return results
+
+        candidates: dict[str, Callable[[], Any]] = {
+            "sequential json.load": sequential,
+            "parallel json": lambda: load_json_files(paths, decoder="json"),
+        }
+        if orjson is not None:
+            candidates["sequential orjson"] = lambda: [load_json(p, "orjson") for p in paths]
+            candidates["parallel orjson"] = lambda: load_json_files(paths, decoder="orjson")
+
+        timings = {}
+        for name, fn in candidates.items():
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                best = min(best, time.perf_counter() - start)
+            timings[name] = best
+
+        baseline = timings["sequential json.load"]
+        for name, seconds in timings.items():
+            print(f"   {name:<22} {seconds * 1000:8.1f} ms  ({baseline / seconds:.2f}x)")
+        if orjson is None:
+            print("   ⚠️ orjson not installed, fast decoder skipped")
+        return timings
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Parallel JSON loader benchmark")
+    parser.add_argument("--bench", action="store_true", help="Run the benchmark")
+    parser.add_argument("--files", type=int, default=9, help="Number of files (default: 9 batches)")
+    parser.add_argument("--movies", type=int, default=40, help="Movies per file")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per candidate (best is kept)")
+    args = parser.parse_args()
+
+    if args.bench:
+        run_benchmark(args.files, args.movies, args.repeat)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
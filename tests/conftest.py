@@ -0,0 +1,63 @@
+"""Shared test data: small snapshots in the movies_{date}.json shape."""
+
+DATE = "2026-10-19"
+
+
+def schedule(theatre_id, times, merchant="XXI"):
+    """A theatre's schedule: a 2D room showing at `times` and an IMAX room with none."""
+    return {
+        "theatre_id": theatre_id,
+        "theatre_name": f"THEATRE {theatre_id}",
+        "merchant": merchant,
+        "address": f"Jl. {theatre_id}",
+        "rooms": [
+            {
+                "category": "2D",
+                "price": "Rp35.000",
+                "all_showtimes": [
+                    {
+                        "time": t,
+                        "showtime_id": f"{theatre_id}-{t}",
+                        "status": 1,
+                        "is_available": True,
+                    }
+                    for t in times
+                ],
+            },
+            {"category": "IMAX", "price": "Rp60.000", "all_showtimes": []},
+        ],
+    }
+
+
+def movie(movie_id, schedules=None, **fields):
+    """A movie showing in the cities of `schedules` ({city: [schedule, ...]})."""
+    schedules = schedules or {}
+    return {
+        "id": movie_id,
+        "title": f"MOVIE {movie_id}",
+        "cities": list(schedules),
+        "schedules": schedules,
+        **fields,
+    }
+
+
+# m1 in two cities (none of its BANDUNG theatres listed), a presale m2,
+# and m3 without schedules
+MOVIES = [
+    movie(
+        "m1",
+        {
+            "JAKARTA": [schedule("t1", ["12:00", "15:00"]), schedule("t2", ["19:30"], "CGV")],
+            "BANDUNG": [],
+        },
+        genres=["Drama"],
+        merchants=["XXI", "CGV"],
+    ),
+    movie("m2", {"BANDUNG": [schedule("t3", ["21:00"])]}, merchants=["XXI"], is_presale=True),
+    movie("m3"),
+]
+
+
+def snapshot_data(movies=MOVIES, date=DATE, **fields):
+    """A movies_{date}.json snapshot dict."""
+    return {"scraped_at": f"{date}T06:00:00", "date": date, "movies": movies, **fields}
@@ -0,0 +1,186 @@
+import json
+import os
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from backend.infrastructure.analytics import OccupancyCube, build_shards, load_cube
+
+
+def seat(date, movie_id, city, sold, total, showtime="13:00", **extra):
+    return {
+        "date": date,
+        "movie_id": movie_id,
+        "city": city,
+        "merchant": "XXI" if city == "JAKARTA" else "CGV",
+        "theatre_id": f"{city}-1",
+        "room_category": "2D",
+        "showtime": showtime,
+        "sold_seats": sold,
+        "total_seats": total,
+        "available_seats": total - sold,
+        **extra,
+    }
+
+
+RECORDS = [
+    seat("2026-10-18", "m1", "JAKARTA", 40, 100, snapshot_type="final"),
+    seat("2026-10-18", "m2", "BANDUNG", 10, 50, "19:30", snapshot_type="morning"),
+    seat("2026-10-19", "m1", "JAKARTA", 30, 100, snapshot_type="final"),
+    # Older layout: sold seats as unavailable_seats, no showtime
+    {
+        "date": "2026-10-19",
+        "movie_id": "m3",
+        "city": "BANDUNG",
+        "unavailable_seats": 5,
+        "total_seats": 20,
+    },
+]
+
+GENRES = {"m1": ["Drama", "Action"], "m2": ["Action"]}
+
+
+@pytest.fixture
+def cube():
+    return OccupancyCube.from_records(RECORDS, GENRES)
+
+
+def sold_by(result, dim):
+    return {row[dim]: row["sold"] for row in result.rows(sort=None)}
+
+
+def test_group_by_sums_and_occupancy(cube):
+    rows = cube.group_by(["city"]).rows(sort=None)
+    assert rows == [
+        {
+            "city": "JAKARTA",
+            "count": 2,
+            "sold": 70,
+            "seats": 200,
+            "available": 130,
+            "occupancy_pct": 35.0,
+        },
+        {
+            "city": "BANDUNG",
+            "count": 2,
+            "sold": 15,
+            "seats": 70,
+            "available": 40,
+            "occupancy_pct": 21.4,
+        },
+    ]
+
+    # Groups come out in dimension order: weekdays from Monday, unknown hour first
+    by_slot = cube.group_by(["weekday", "hour"]).rows(sort=None)
+    assert [(r["weekday"], r["hour"], r["sold"]) for r in by_slot] == [
+        ("Mon", "", 5),
+        ("Mon", "13", 30),
+        ("Sun", "13", 40),
+        ("Sun", "19", 10),
+    ]
+
+    total = cube.group_by([]).rows()
+    assert [(r["count"], r["sold"], r["seats"]) for r in total] == [(4, 85, 270)]
+
+
+def test_genres_expand_rows_and_filter_by_any_genre(cube):
+    # m1 counts for both of its genres; m3 has none
+    assert sold_by(cube.group_by(["genre"]), "genre") == {"Drama": 70, "Action": 80, "": 5}
+    assert [r["genre"] for r in cube.group_by(["genre"]).rows(sort="sold")] == [
+        "Action",
+        "Drama",
+        "",
+    ]
+
+    assert len(cube.where(genre=["Drama"])) == 2
+    action_bandung = cube.where(genre=["Action"], city=["BANDUNG"])
+    assert sold_by(action_bandung.group_by(["movie"]), "movie") == {"m2": 10}
+
+
+def test_where_and_between(cube):
+    assert len(cube.where(snapshot_type=["final"])) == 2
+    assert len(cube.where(city=["MALANG"])) == 0
+    with pytest.raises(ValueError):
+        cube.where(planet=["MARS"])
+
+    assert sold_by(cube.between("2026-10-19").group_by(["movie"]), "movie") == {"m1": 30, "m3": 5}
+    assert sold_by(cube.between(end="2026-10-18").group_by(["movie"]), "movie") == {
+        "m1": 40,
+        "m2": 10,
+    }
+    assert len(cube.between("2026-10-20")) == 0
+
+
+def test_concat_remaps_codes_onto_shared_categories(cube):
+    first = OccupancyCube.from_records(RECORDS[:2], GENRES)
+    # m1 then m3: codes 0 and 1 here, 0 and 2 once combined
+    second = OccupancyCube.from_records(RECORDS[2:], {"m1": GENRES["m1"]})
+    combined = OccupancyCube.concat([first, OccupancyCube.from_records([]), second])
+
+    assert combined.categories["movie"] == ["m1", "m2", "m3"]
+    assert combined.codes["movie"].tolist() == [0, 1, 0, 2]
+    for dims in (["date", "movie"], ["city", "genre"], ["snapshot_type"]):
+        assert combined.group_by(dims).rows() == cube.group_by(dims).rows()
+
+
+def test_save_load_roundtrip(cube, tmp_path):
+    path = cube.save(tmp_path / "cube" / "seats_morning_2026-10-18.npz")
+    assert not path.with_name(path.name + ".tmp").exists()
+    assert OccupancyCube.dates(path) == ["2026-10-18", "2026-10-19"]
+
+    loaded = OccupancyCube.load(path)
+    assert loaded.categories == cube.categories
+    for dims in (["movie", "hour"], ["genre"], ["weekday"]):
+        assert loaded.group_by(dims).rows() == cube.group_by(dims).rows()
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def age(path, seconds):
+    stat = path.stat()
+    os.utime(path, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+
+def test_build_shards_rebuilds_only_stale_sources(tmp_path):
+    write(
+        tmp_path / "movies_2026-10-18.json",
+        {"movies": [{"id": "m1", "genres": ["Drama"]}, {"id": "m2", "genres": ["Action"]}]},
+    )
+    morning = write(
+        tmp_path / "seats_morning_2026-10-18.json",
+        {
+            "mode": "morning",
+            "results": [{k: v for k, v in RECORDS[1].items() if k != "snapshot_type"}],
+        },
+    )
+    final = write(tmp_path / "final_snaps" / "final_2026-10-18_s1.json", RECORDS[0])
+
+    assert build_shards(tmp_path) == {"final_snaps_2026-10-18": 1, "seats_morning_2026-10-18": 1}
+    assert build_shards(tmp_path) == {}
+
+    # A source newer than its shard: only that shard is rebuilt
+    for shard in (tmp_path / "cube").glob("*.npz"):
+        age(shard, 60)
+    age(final, 120)
+    write(
+        morning,
+        {"mode": "morning", "results": [RECORDS[1], seat("2026-10-18", "m1", "JAKARTA", 7, 100)]},
+    )
+    assert build_shards(tmp_path) == {"seats_morning_2026-10-18": 2}
+    assert build_shards(tmp_path, rebuild=True).keys() == {
+        "final_snaps_2026-10-18",
+        "seats_morning_2026-10-18",
+    }
+
+    cube = load_cube(tmp_path)
+    assert sold_by(cube.group_by(["genre"]), "genre") == {"Drama": 47, "Action": 10}
+    assert sold_by(cube.group_by(["snapshot_type"]), "snapshot_type") == {
+        "final": 40,
+        "morning": 17,
+    }
+    assert len(load_cube(tmp_path, start="2026-10-19")) == 0
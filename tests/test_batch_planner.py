@@ -0,0 +1,91 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from backend.cli import cli
+from backend.infrastructure.batch_planner import BatchPlanner, SeatHistory
+
+SHOWTIMES = [
+    {
+        "showtime_id": f"s{n}",
+        "theatre_id": f"t{n % 4}",
+        "merchant": ("XXI", "CGV", "CINÉPOLIS")[n % 3],
+        "room_category": ("2D", "IMAX", "GOLD CLASS", "4DX", "REGULAR")[n % 5],
+        "showtime": f"{10 + n % 12:02d}:{(n * 7) % 60:02d}",
+    }
+    for n in range(40)
+]
+
+
+def ids(batches):
+    return [sorted(st["showtime_id"] for st in batch) for batch in batches]
+
+
+def write_seats(path, results):
+    path.write_text(json.dumps({"results": results}), encoding="utf-8")
+
+
+def test_plan_covers_every_showtime_once_and_balances_cost():
+    planner = BatchPlanner()
+    batches = planner.plan(SHOWTIMES, 4)
+
+    planned = [st["showtime_id"] for batch in batches for st in batch]
+    assert sorted(planned) == sorted(st["showtime_id"] for st in SHOWTIMES)
+    # Input order is kept within a batch
+    for batch in batches:
+        assert batch == sorted(batch, key=SHOWTIMES.index)
+
+    costs = planner.batch_costs(batches)
+    assert max(costs) - min(costs) <= max(planner.estimate_cost(st) for st in SHOWTIMES)
+
+
+def test_plan_depends_only_on_inputs():
+    shuffled = SHOWTIMES[::-1]
+    first = BatchPlanner().plan(SHOWTIMES, 3)
+    second = BatchPlanner().plan(shuffled, 3)
+    assert ids(first) == ids(second)
+
+
+def test_history_skips_today_and_is_read_in_path_order(tmp_path):
+    write_seats(
+        tmp_path / "seats_morning_batch0_2026-10-18.json",
+        [{"theatre_id": "t0", "fetch_ms": 100, "room_category": "2D", "total_seats": 90}],
+    )
+    write_seats(
+        tmp_path / "seats_morning_batch1_2026-10-18.json",
+        [{"theatre_id": "t0", "fetch_ms": 300, "room_category": "2D", "total_seats": 120}],
+    )
+    # Being written by other batches of today's run
+    write_seats(
+        tmp_path / "seats_morning_batch0_2026-10-19.json",
+        [{"theatre_id": "t0", "fetch_ms": 9000, "room_category": "2D", "total_seats": 999}],
+    )
+
+    history = SeatHistory.load(str(tmp_path), before="2026-10-19")
+    assert history.latency_ms == {"t0": 200}
+    assert history.room_seats == {("t0", "2D"): 120}
+
+    planner = BatchPlanner.from_history(str(tmp_path), before="2026-10-19")
+    assert planner.plan(SHOWTIMES, 3) == BatchPlanner(history).plan(SHOWTIMES, 3)
+
+
+def test_unreadable_history_falls_back_to_priors(tmp_path):
+    write_seats(tmp_path / "seats_morning_2026-10-17.json", [{"theatre_id": "t0", "fetch_ms": 100}])
+    (tmp_path / "seats_morning_2026-10-18.json").write_text("{not json", encoding="utf-8")
+
+    assert SeatHistory.load(str(tmp_path), before="2026-10-19") == SeatHistory()
+
+
+def test_jit_window_starts_at_the_shared_reference_time():
+    start = datetime(2026, 10, 19, 14, 19, 50)
+    showtimes = [{"showtime": t} for t in ("14:19", "14:20", "14:39", "14:40", "bad")]
+    assert cli.filter_jit_showtimes(showtimes, 20, start) == [
+        {"showtime": "14:20"},
+        {"showtime": "14:39"},
+    ]
+
+
+def test_batched_jit_requires_a_reference_time(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, "load_showtime_index", lambda output_dir: pytest.fail("planned"))
+    assert cli.run_seat_scrape(mode="jit", batch=0, output_dir=str(tmp_path)) is None
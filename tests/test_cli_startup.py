@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Modules only specific subcommands may import
+HEAVY_MODULES = ("playwright", "aiohttp", "google.cloud", "pydantic", "numpy")
+
+# Cumulative import time budget for the CLI module (microseconds)
+IMPORT_BUDGET_US = 750_000
+
+
+def _importtime(module):
+    """Import a module in a fresh interpreter, return (stderr, loaded module names)."""
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stderr, set(result.stdout.split())
+
+
+def test_cli_does_not_import_heavy_dependencies():
+    """Importing the CLI must not pull in scraper/cloud dependencies."""
+    _, loaded = _importtime("backend.cli.cli")
+    heavy = sorted(m for m in loaded if m.startswith(HEAVY_MODULES))
+    assert not heavy, f"backend.cli.cli imported heavy modules: {heavy}"
+
+
+def test_cli_import_time_budget():
+    """`python -X importtime` cumulative time for backend.cli.cli stays in budget."""
+    stderr, _ = _importtime("backend.cli.cli")
+    cumulative = next(
+        int(line.split("|")[1])
+        for line in stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[2].strip() == "backend.cli.cli"
+    )
+    assert cumulative < IMPORT_BUDGET_US, f"backend.cli.cli took {cumulative / 1000:.0f}ms to import"
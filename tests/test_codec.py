@@ -0,0 +1,68 @@
+import pytest
+
+from backend.infrastructure.storage import (
+    artifact_name,
+    artifact_path,
+    codec,
+    dump_json,
+    find_artifact,
+    glob_artifacts,
+    load_json,
+    open_text,
+    read_bytes,
+)
+
+DATA = {"date": "2026-10-19", "movies": [{"id": "m1", "title": "ÉTÉ"}]}
+
+CODECS = [
+    "json",
+    "compact",
+    "gzip",
+    pytest.param(
+        "zstd", marks=pytest.mark.skipif(codec.zstandard is None, reason="zstandard not installed")
+    ),
+]
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_roundtrip(tmp_path, name):
+    path = dump_json(DATA, artifact_path(tmp_path, "movies_2026-10-19", name))
+    assert path.name == "movies_2026-10-19" + codec.SUFFIXES[name]
+    assert artifact_name(path) == "movies_2026-10-19"
+
+    assert load_json(path) == DATA
+    with open_text(path) as f:
+        assert f.read().encode() == read_bytes(path)
+
+
+def test_compressed_output_is_deterministic(tmp_path):
+    path = tmp_path / "movies.json.gz"
+    first = dump_json(DATA, path).read_bytes()
+    assert dump_json(DATA, path).read_bytes() == first
+
+
+def test_format_is_detected_from_content(tmp_path):
+    # A gzip file without its suffix still loads
+    path = dump_json(DATA, tmp_path / "movies.json", codec="gzip")
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+    assert load_json(path) == DATA
+
+
+def test_pretty_and_compact_json(tmp_path, monkeypatch):
+    pretty = dump_json(DATA, tmp_path / "pretty.json").read_text(encoding="utf-8")
+    assert pretty.startswith('{\n  "date"')
+
+    monkeypatch.setenv(codec.CODEC_ENV, "compact")
+    compact = dump_json(DATA, artifact_path(tmp_path, "compact")).read_text(encoding="utf-8")
+    assert compact == '{"date":"2026-10-19","movies":[{"id":"m1","title":"ÉTÉ"}]}'
+
+
+def test_glob_and_find_prefer_one_file_per_artifact(tmp_path):
+    for name, fmt in (("movies_2026-10-18", "json"), ("movies_2026-10-19", "gzip")):
+        dump_json(DATA, artifact_path(tmp_path, name, fmt))
+    (tmp_path / "movies_2026-10-19.json.digest").write_text("{}", encoding="utf-8")
+
+    names = [artifact_name(p) for p in glob_artifacts(tmp_path, "movies_*")]
+    assert names == ["movies_2026-10-18", "movies_2026-10-19"]
+    assert find_artifact(tmp_path, "movies_2026-10-19").name == "movies_2026-10-19.json.gz"
+    assert find_artifact(tmp_path, "movies_2026-10-20") is None
@@ -0,0 +1,100 @@
+import json
+import os
+
+from backend.domain.models import TheatreSchedule
+from backend.infrastructure.repositories import FileMovieRepository
+from backend.infrastructure.storage import FileCache
+
+SNAPSHOT = {
+    "scraped_at": "2026-10-19T06:00:00",
+    "date": "2026-10-19",
+    "city_stats": {"JAKARTA": 1},
+    "movies": [
+        {
+            "id": "m1",
+            "title": "FIRST",
+            "genres": ["Drama"],
+            "cities": ["JAKARTA"],
+            "schedules": {
+                "JAKARTA": [
+                    {"theatre_id": "t1", "theatre_name": "T1", "merchant": "XXI", "rooms": []}
+                ]
+            },
+        }
+    ],
+}
+
+
+def write(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def test_cache_is_bounded_by_entries(tmp_path):
+    cache = FileCache(max_entries=2)
+    paths = [write(tmp_path / f"{n}.json", {"n": n}) for n in range(3)]
+    loads = []
+
+    def loader(path):
+        loads.append(path.name)
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    for path in [*paths[:2], paths[0], paths[2], paths[0], paths[1]]:
+        cache.get(path, loader)
+
+    # 1.json was least recently used when 2.json came in
+    assert loads == ["0.json", "1.json", "2.json", "1.json"]
+    assert (cache.hits, cache.misses, len(cache)) == (2, 4, 2)
+
+
+def test_rewritten_file_is_read_again(tmp_path):
+    cache = FileCache()
+    path = write(tmp_path / "a.json", {"v": 1})
+    assert cache.get(path, lambda p: json.loads(p.read_text(encoding="utf-8"))) == {"v": 1}
+
+    write(path, {"v": 22})
+    os.utime(path, ns=(1, 1))
+    assert cache.get(path, lambda p: json.loads(p.read_text(encoding="utf-8"))) == {"v": 22}
+    assert len(cache) == 1
+
+
+def test_disabled_cache_keeps_nothing(tmp_path):
+    cache = FileCache(0)
+    path = write(tmp_path / "a.json", {})
+    cache.get(path, lambda p: {})
+    cache.get(path, lambda p: {})
+    assert (cache.hits, len(cache)) == (0, 0)
+
+
+def test_repository_reads_do_not_share_movies(tmp_path):
+    write(tmp_path / "movies_2026-10-19.json", SNAPSHOT)
+    repo = FileMovieRepository(str(tmp_path), cache=FileCache())
+
+    first = repo.get_snapshot_by_date("2026-10-19")
+    movie = first.movies[0]
+    movie.title = "CHANGED"
+    movie.genres.append("Action")
+    movie.get_schedules_for_city("JAKARTA")[0].theatre_name = "CHANGED"
+    movie.schedules["BANDUNG"] = [TheatreSchedule("t2", "T2", "CGV")]
+
+    second = repo.get_snapshot_by_date("2026-10-19")
+    assert repo.cache.hits == 1
+    assert second.movies[0].to_dict() == {
+        **SNAPSHOT["movies"][0],
+        "poster": None,
+        "age_category": None,
+        "country": None,
+        "merchants": [],
+        "is_presale": False,
+        "schedules": {
+            "JAKARTA": [
+                {
+                    "theatre_id": "t1",
+                    "theatre_name": "T1",
+                    "merchant": "XXI",
+                    "address": None,
+                    "rooms": [],
+                }
+            ]
+        },
+    }
@@ -0,0 +1,125 @@
+import copy
+from types import SimpleNamespace
+
+import pytest
+
+from backend.infrastructure.repositories import firestore_snapshot
+from backend.infrastructure.repositories.firestore_snapshot import (
+    assemble_snapshot,
+    build_chunked_snapshot,
+    needed_chunks,
+    read_chunked_snapshot,
+    write_chunked_snapshot,
+)
+
+CITIES = ["JAKARTA", "BANDUNG", "MALANG"]
+
+SNAPSHOT = {
+    "scraped_at": "2026-10-19T06:00:00",
+    "date": "2026-10-19",
+    "summary": {"total_movies": 3},
+    "movies": [
+        {
+            "id": f"m{n}",
+            "title": f"MOVIE {n}",
+            "cities": CITIES[n:],
+            "schedules": {
+                city: [
+                    {"theatre_id": f"{city}-{t}", "rooms": [{"category": "2D"}]} for t in range(3)
+                ]
+                for city in CITIES[n:]
+            },
+        }
+        for n in range(3)
+    ],
+    "city_stats": dict.fromkeys(CITIES, 1),
+}
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(firestore_snapshot, "MAX_CHUNK_BYTES", 300)
+
+
+def test_roundtrip():
+    manifest, chunks = build_chunked_snapshot(copy.deepcopy(SNAPSHOT))
+    assert len(manifest["chunks"]) > 1
+    assert assemble_snapshot(manifest, chunks) == SNAPSHOT
+
+
+def test_one_city_reads_only_its_chunks():
+    manifest, chunks = build_chunked_snapshot(copy.deepcopy(SNAPSHOT))
+    ids = needed_chunks(manifest, ["MALANG"])
+    assert len(ids) < len(chunks)
+
+    data = assemble_snapshot(manifest, {i: chunks[i] for i in ids}, ["MALANG"])
+    assert [list(m.get("schedules", {})) for m in data["movies"]] == [["MALANG"]] * 3
+
+
+def test_chunk_ids_depend_only_on_movies():
+    _, chunks = build_chunked_snapshot(copy.deepcopy(SNAPSHOT))
+
+    rescraped = {**copy.deepcopy(SNAPSHOT), "scraped_at": "2026-10-19T07:00:00"}
+    assert build_chunked_snapshot(rescraped)[1] == chunks
+
+    changed = copy.deepcopy(SNAPSHOT)
+    changed["movies"][0]["title"] = "RENAMED"
+    assert build_chunked_snapshot(changed)[1].keys().isdisjoint(chunks)
+
+
+class FakeDocument:
+    """In-memory DocumentReference with subcollections."""
+
+    def __init__(self, store, path):
+        self.store = store
+        self.path = path
+        self.id = path.rsplit("/", 1)[-1]
+
+    def get(self):
+        data = self.store.get(self.path)
+        return SimpleNamespace(exists=data is not None, to_dict=lambda: copy.deepcopy(data))
+
+    def set(self, data):
+        self.store[self.path] = copy.deepcopy(data)
+
+    def delete(self):
+        del self.store[self.path]
+
+    def collection(self, name):
+        return FakeCollection(self.store, f"{self.path}/{name}")
+
+
+class FakeCollection:
+    def __init__(self, store, path):
+        self.store = store
+        self.path = path
+
+    def document(self, doc_id):
+        return FakeDocument(self.store, f"{self.path}/{doc_id}")
+
+    def list_documents(self):
+        prefix = self.path + "/"
+        return [
+            self.document(path[len(prefix) :])
+            for path in list(self.store)
+            if path.startswith(prefix) and "/" not in path[len(prefix) :]
+        ]
+
+
+def test_rewrite_restores_chunks_deleted_by_another_generation():
+    store = {}
+    doc_ref = FakeDocument(store, "snapshots/latest")
+
+    first = write_chunked_snapshot(doc_ref, copy.deepcopy(SNAPSHOT))
+    assert first["written"] == first["chunks"] + 1
+    assert write_chunked_snapshot(doc_ref, copy.deepcopy(SNAPSHOT))["written"] == 0
+
+    # Another writer replaces the snapshot, deleting the first generation's chunks
+    changed = copy.deepcopy(SNAPSHOT)
+    changed["movies"][0]["title"] = "RENAMED"
+    assert write_chunked_snapshot(doc_ref, changed)["deleted"] == first["chunks"]
+
+    rescraped = {**copy.deepcopy(SNAPSHOT), "scraped_at": "2026-10-19T07:00:00"}
+    counts = write_chunked_snapshot(doc_ref, rescraped)
+    assert counts["written"] == first["chunks"] + 1
+    assert read_chunked_snapshot(doc_ref) == rescraped
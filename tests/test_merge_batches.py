@@ -0,0 +1,100 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from backend.cli import merge_batches as merge
+from backend.domain.models import NormalizedSnapshot
+from backend.infrastructure.storage import IndexedSnapshot, load_json
+from tests.conftest import DATE, movie, schedule
+
+
+class FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 10, 19, 6, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def fixed_today(monkeypatch):
+    monkeypatch.setattr(merge, "datetime", FixedDatetime)
+
+
+def write_batch(directory, n, movies, city_stats, sorted_by_id=True, date=DATE):
+    data = {"scraped_at": f"{date}T05:00:00", "date": date, "batch": n}
+    if sorted_by_id:
+        data["movie_order"] = "id"
+        movies = sorted(movies, key=lambda m: m["id"])
+    data["movies"] = movies
+    data["city_stats"] = city_stats
+    (directory / f"batch_{n}_{date}.json").write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.fixture
+def batches(tmp_path):
+    write_batch(
+        tmp_path,
+        0,
+        [
+            movie("m2", {"JAKARTA": [schedule("t1", ["12:00"])]}),
+            movie("m1", {"JAKARTA": [schedule("t1", ["13:00"])]}),
+        ],
+        {"JAKARTA": 2},
+    )
+    # Older batch layout: movies not sorted by id
+    write_batch(
+        tmp_path,
+        1,
+        [
+            movie("m3", {"BANDUNG": [schedule("t2", ["14:00"])]}),
+            movie(
+                "m1",
+                {"BANDUNG": [schedule("t2", ["19:00"])], "JAKARTA": [schedule("t9", ["20:00"])]},
+            ),
+        ],
+        {"BANDUNG": 2, "JAKARTA": 5},
+        sorted_by_id=False,
+    )
+    return tmp_path
+
+
+def test_merge_combines_movies_across_batches(batches):
+    assert merge.merge_batches(str(batches))
+
+    data = load_json(batches / f"movies_{DATE}.json")
+    assert data["date"] == DATE
+    assert data["summary"] == {"total_cities": 2, "total_movies": 3, "presale_count": 0}
+    # Later batches win for city stats
+    assert data["city_stats"] == {"JAKARTA": 5, "BANDUNG": 2}
+
+    # Most cities first, ties in id order
+    assert [m["id"] for m in data["movies"]] == ["m1", "m2", "m3"]
+    m1 = data["movies"][0]
+    assert m1["cities"] == ["JAKARTA", "BANDUNG"]
+    # The first batch's schedules for a city win
+    assert [s["theatre_id"] for s in m1["schedules"]["JAKARTA"]] == ["t1"]
+    assert [s["theatre_id"] for s in m1["schedules"]["BANDUNG"]] == ["t2"]
+
+
+def test_merge_writes_matching_normalized_and_indexed_snapshots(batches):
+    assert merge.merge_batches(str(batches))
+    nested = load_json(batches / f"movies_{DATE}.json")
+
+    normalized = load_json(batches / f"snapshot_{DATE}.json")
+    assert [t["theatre_id"] for t in normalized["theatres"]] == ["t2", "t1"]
+    assert NormalizedSnapshot.from_dict(normalized).to_snapshot()["movies"] == nested["movies"]
+
+    with IndexedSnapshot(batches / f"movies_{DATE}.snap") as snap:
+        assert snap.get_movie("m1") == nested["movies"][0]
+        assert [m["id"] for m in snap.get_city("BANDUNG")] == ["m1", "m3"]
+
+    index = load_json(batches / f"showtimes_{DATE}.json")
+    assert index["date"] == DATE
+
+
+def test_batches_from_different_days_are_rejected(batches):
+    write_batch(batches, 2, [movie("m4", {"MALANG": []})], {"MALANG": 1}, date="2026-10-18")
+    (batches / "batch_2_2026-10-18.json").rename(batches / f"batch_2_{DATE}.json")
+
+    assert not merge.merge_batches(str(batches))
+    assert not (batches / f"movies_{DATE}.json").exists()
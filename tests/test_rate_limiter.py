@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from backend.infrastructure.rate_limiter import (
+    AsyncRateLimiter,
+    SlidingWindowLimiter,
+    TokenBucketLimiter,
+)
+
+# Timer slack allowed on top of the exact wait (seconds)
+SLACK = 0.05
+
+
+def test_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        AsyncRateLimiter()
+
+
+def test_token_bucket_grants_in_fifo_order_at_rate():
+    """Queued callers are served in arrival order, one per 1/rate seconds."""
+
+    async def run():
+        limiter = TokenBucketLimiter(rate=50, capacity=1)
+        order = []
+
+        async def worker(n):
+            waited = await limiter.acquire()
+            order.append((n, waited))
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(worker(n) for n in range(5)))
+        return order, loop.time() - start, limiter.stats
+
+    order, elapsed, stats = asyncio.run(run())
+    assert [n for n, _ in order] == [0, 1, 2, 3, 4]
+    assert order[0][1] == 0.0
+    # Each later caller waits one more refill interval (20ms) than the previous
+    for i, (_, waited) in enumerate(order[1:], start=1):
+        assert i * 0.02 - 0.005 <= waited <= i * 0.02 + SLACK
+    assert elapsed >= 0.075
+    assert (stats.acquired, stats.delayed) == (5, 4)
+    assert stats.max_wait == max(w for _, w in order)
+
+
+def test_sliding_window_blocks_until_oldest_grant_expires():
+    async def run():
+        limiter = SlidingWindowLimiter(max_rate=3, time_window=0.1)
+        return [await limiter.acquire() for _ in range(6)], limiter.stats
+
+    waits, stats = asyncio.run(run())
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert 0.1 - 0.005 <= waits[3] <= 0.1 + SLACK
+    # The next two slots free up together with the first window
+    assert waits[4] <= SLACK and waits[5] <= SLACK
+    assert stats.delayed >= 1 and stats.acquired == 6
+
+
+def test_cancelled_queued_waiter_does_not_block_the_queue():
+    async def run():
+        limiter = TokenBucketLimiter(rate=50, capacity=1)
+        await limiter.acquire()  # empty the bucket
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)  # both park
+        first.cancel()
+        waited = await second
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return waited, limiter.waiting
+
+    waited, waiting = asyncio.run(run())
+    assert waited <= 0.02 + SLACK
+    assert waiting == 0
+
+
+@pytest.mark.parametrize(
+    "make_limiter",
+    [
+        lambda: TokenBucketLimiter(rate=20, capacity=1),
+        lambda: SlidingWindowLimiter(max_rate=1, time_window=0.05),
+    ],
+)
+def test_waiter_cancelled_after_grant_returns_its_slot(make_limiter):
+    """A slot granted to a caller cancelled before it resumed is not lost."""
+
+    async def run():
+        limiter = make_limiter()
+        await limiter.acquire()  # use up the capacity
+        task = None
+        release = limiter._release
+
+        # Cancel the head waiter right after its slot is granted, before it runs
+        def release_then_cancel(loop):
+            release(loop)
+            task.cancel()
+
+        limiter._release = release_then_cancel
+        task = asyncio.create_task(limiter.acquire())
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        limiter._release = release
+        return await limiter.acquire()
+
+    assert asyncio.run(run()) == 0.0
@@ -0,0 +1,118 @@
+import json
+
+from backend.cli.compact_seats import compact_local
+from backend.domain.models import ShowtimeSummary
+from backend.infrastructure.storage import find_artifact, load_json
+
+OLD = "2026-09-01"
+NEW = "2026-10-18"
+
+
+def jit_line(showtime_id, timestamp, sold, total=100):
+    return {
+        "timestamp": timestamp,
+        "showtime_id": showtime_id,
+        "movie": "FIRST",
+        "theatre": "THEATRE t1",
+        "showtime": "13:00",
+        "total_seats": total,
+        "sold_seats": sold,
+    }
+
+
+OBSERVATIONS = [
+    jit_line("s1", f"{OLD}T10:30:00", 20),
+    jit_line("s1", f"{OLD}T10:00:00", 5),
+    jit_line("s1", f"{OLD}T10:45:00", 15),
+    {
+        "scraped_at": f"{OLD}T11:00:00",
+        "snapshot_type": "final",
+        "showtime_id": "s1",
+        "date": OLD,
+        "movie_id": "m1",
+        "city": "JAKARTA",
+        "total_seats": 90,
+        "sold_seats": 18,
+    },
+]
+
+
+def test_summary_peak_final_and_curve():
+    summary = ShowtimeSummary.from_observations(OBSERVATIONS, points=5)
+    assert summary.observations == 4
+    assert (summary.first_seen, summary.last_seen) == (f"{OLD}T10:00:00", f"{OLD}T11:00:00")
+    assert (summary.peak_sold, summary.peak_at) == (20, f"{OLD}T10:30:00")
+    # From the final snap, not the largest or latest JIT line
+    assert (summary.final_sold, summary.final_occupancy_pct) == (18, 20.0)
+    assert summary.total_seats == 100
+    # Sampled every 15 minutes from 10:00 to 11:00
+    assert summary.curve == [5, 5, 20, 15, 18]
+    assert (summary.movie_id, summary.movie_title, summary.city) == ("m1", "FIRST", "JAKARTA")
+
+    assert ShowtimeSummary.from_dict(summary.to_dict()) == summary
+
+
+def test_curve_is_flat_without_usable_times():
+    observations = [jit_line("s1", "not a time", 5), jit_line("s1", f"{OLD}T10:00:00", 9)]
+    assert ShowtimeSummary.from_observations(observations, points=3).curve == [5, 5, 5]
+
+
+def write_jit(data_dir, name, lines):
+    path = data_dir / "jit_granular" / f"jit_{name}.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines), encoding="utf-8")
+    return path
+
+
+def write_final(data_dir, data):
+    path = data_dir / "final_snaps" / f"final_{data['date']}_{data['showtime_id']}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def archive(data_dir, date):
+    return {
+        s["showtime_id"]: s
+        for s in load_json(find_artifact(data_dir / "seat_archive", f"seat_archive_{date}"))
+    }
+
+
+def test_compact_local_summarises_and_removes_old_files(tmp_path):
+    old_files = [
+        write_jit(tmp_path, f"{OLD}_FIRST_1300", OBSERVATIONS[:3]),
+        write_jit(tmp_path, f"{OLD}_SECOND_1900", [jit_line("s2", f"{OLD}T18:00:00", 7)]),
+        write_final(tmp_path, OBSERVATIONS[3]),
+    ]
+    recent = write_jit(tmp_path, f"{NEW}_FIRST_1300", [jit_line("s3", f"{NEW}T12:00:00", 1)])
+
+    assert compact_local(str(tmp_path), cutoff="2026-10-01", dry_run=True) == 3
+    assert all(path.exists() for path in old_files)
+
+    assert compact_local(str(tmp_path), cutoff="2026-10-01") == 3
+    assert not any(path.exists() for path in old_files)
+    assert recent.exists()
+
+    summaries = archive(tmp_path, OLD)
+    assert summaries["s1"] == ShowtimeSummary.from_observations(OBSERVATIONS).to_dict()
+    # JIT lines carry no date: the file's date is used
+    assert (summaries["s2"]["date"], summaries["s2"]["peak_sold"]) == (OLD, 7)
+    assert find_artifact(tmp_path / "seat_archive", f"seat_archive_{NEW}") is None
+
+
+def test_rerun_keeps_summaries_of_partly_deleted_showtimes(tmp_path):
+    write_jit(tmp_path, f"{OLD}_FIRST_1300", OBSERVATIONS[:3])
+    write_final(tmp_path, OBSERVATIONS[3])
+    compact_local(str(tmp_path), cutoff="2026-10-01")
+    before = archive(tmp_path, OLD)
+
+    # An interrupted run left one of s1's files behind, plus a new showtime
+    leftover = write_final(tmp_path, OBSERVATIONS[3])
+    write_jit(tmp_path, f"{OLD}_SECOND_1900", [jit_line("s2", f"{OLD}T18:00:00", 7)])
+
+    assert compact_local(str(tmp_path), cutoff="2026-10-01") == 2
+    assert not leftover.exists()
+    after = archive(tmp_path, OLD)
+    assert after["s1"] == before["s1"]
+    assert after["s1"]["observations"] == 4
+    assert sorted(after) == ["s1", "s2"]
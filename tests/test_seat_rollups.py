@@ -0,0 +1,191 @@
+from types import SimpleNamespace
+
+import pytest
+
+from backend.infrastructure.repositories import firestore_writer
+from backend.infrastructure.repositories.firestore_writer import (
+    BackgroundBatchWriter,
+    PendingWrite,
+)
+from backend.infrastructure.repositories.seat_rollups import build_rollups
+
+SEATS = [
+    {
+        "date": "2026-10-19",
+        "movie_id": "m1",
+        "city": "JAKARTA",
+        "merchant": "XXI",
+        "theatre_id": "t1",
+        "showtime": "13:00",
+        "sold_seats": 40,
+        "total_seats": 100,
+        "available_seats": 60,
+    },
+    {
+        "date": "2026-10-19",
+        "movie_id": "m1",
+        "city": "BANDUNG",
+        "merchant": "CGV",
+        "theatre_id": "t2",
+        "showtime": "19:30",
+        "unavailable_seats": 10,
+        "total_seats": 50,
+        "available_seats": 40,
+    },
+    {"scraped_at": "2026-10-20T08:00:00", "movie_id": "m2", "total_seats": 80},
+    {"movie_id": "no-date"},
+]
+
+
+def test_build_rollups_groups_by_partition_day():
+    rollups = build_rollups(SEATS)
+    assert sorted(rollups) == ["2026-10-19", "2026-10-20"]
+
+    day = rollups["2026-10-19"].to_dict()
+    assert (day["showtimes"], day["sold"], day["seats"], day["available"]) == (2, 50, 150, 100)
+    assert day["movies"] == {"m1": {"showtimes": 2, "sold": 50, "seats": 150}}
+    assert day["cities"]["BANDUNG"] == {"showtimes": 1, "sold": 10, "seats": 50}
+    assert day["hours"] == {
+        "13": {"showtimes": 1, "sold": 40, "seats": 100},
+        "19": {"showtimes": 1, "sold": 10, "seats": 50},
+    }
+
+    assert rollups["2026-10-20"].to_dict()["seats"] == 80
+
+
+class Conflict(Exception):
+    pass
+
+
+class FakeDb:
+    """In-memory Firestore: create() of an existing document fails the batch."""
+
+    def __init__(self):
+        self.docs = {}
+        self.commits = 0
+
+    def collection(self, name):
+        return SimpleNamespace(document=lambda doc_id: SimpleNamespace(path=f"{name}/{doc_id}"))
+
+    def batch(self):
+        return FakeBatch(self)
+
+    def get_all(self, refs):
+        for ref in refs:
+            yield SimpleNamespace(reference=ref, exists=ref.path in self.docs)
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+        self.ops = []
+
+    def create(self, ref, data):
+        self.ops.append(("create", ref.path, data))
+
+    def set(self, ref, data, merge=False):
+        self.ops.append(("merge" if merge else "set", ref.path, data))
+
+    def commit(self):
+        docs = self.db.docs
+        if any(op == "create" and path in docs for op, path, _ in self.ops):
+            raise Conflict("document already exists")
+        for op, path, data in self.ops:
+            if op == "merge":
+                # Stands in for Increment: add the deltas
+                stored = docs.setdefault(path, {})
+                for key, value in data.items():
+                    stored[key] = stored.get(key, 0) + value
+            else:
+                docs[path] = data
+        self.db.commits += 1
+
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setattr(firestore_writer, "_is_conflict", lambda e: isinstance(e, Conflict))
+    return FakeDb()
+
+
+def put_snaps(db, snap_ids, **kwargs):
+    with BackgroundBatchWriter(db=db, flush_interval=0.01, **kwargs) as writer:
+        for snap_id in snap_ids:
+            writer.put(
+                "seat_snapshots",
+                snap_id,
+                {"sold": 5},
+                create=True,
+                followups=[PendingWrite("seat_rollups", "2026-10-19", {"sold": 5}, merge=True)],
+            )
+    return writer.stats
+
+
+def test_rerun_does_not_apply_followups_twice(db):
+    stats = put_snaps(db, ["a", "b"])
+    assert (stats.written, stats.skipped, stats.failed) == (2, 0, 0)
+    assert db.docs["seat_rollups/2026-10-19"] == {"sold": 10}
+
+    # "a" and "b" are already stored: only "c" is written and counted
+    stats = put_snaps(db, ["a", "b", "c"])
+    assert (stats.written, stats.skipped, stats.failed) == (1, 2, 0)
+    assert db.docs["seat_rollups/2026-10-19"] == {"sold": 15}
+
+
+def test_batch_of_stored_documents_commits_nothing(db):
+    put_snaps(db, ["a"])
+    commits = db.commits
+
+    stats = put_snaps(db, ["a"])
+    assert (stats.written, stats.skipped, stats.batches) == (0, 1, 0)
+    assert db.commits == commits
+    assert db.docs["seat_rollups/2026-10-19"] == {"sold": 5}
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(firestore_writer.time, "sleep", lambda seconds: None)
+
+
+def test_conflict_on_last_attempt_still_commits_new_writes(db, no_backoff):
+    put_snaps(db, ["a"])
+
+    stats = put_snaps(db, ["a", "b"], max_retries=0)
+    assert (stats.written, stats.skipped, stats.failed) == (1, 1, 0)
+    assert db.docs["seat_rollups/2026-10-19"] == {"sold": 10}
+
+
+def test_failed_existence_check_is_a_failed_attempt(db, no_backoff, monkeypatch):
+    put_snaps(db, ["a"])
+    failed = []
+
+    def unavailable(refs):
+        raise RuntimeError("unavailable")
+
+    monkeypatch.setattr(db, "get_all", unavailable)
+    stats = put_snaps(db, ["a", "b"], max_retries=1, on_failure=failed.extend)
+    assert (stats.written, stats.failed) == (0, 2)
+    assert stats.errors == ["unavailable"]
+    assert [w.doc_id for w in failed] == ["a", "b"]
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_writes_are_handed_off_when_the_thread_dies(db):
+    failed = []
+    writer = BackgroundBatchWriter(db=db, batch_size=2, on_failure=failed.extend)
+
+    def crash(writes):
+        raise RuntimeError("boom")
+
+    writer._commit = crash
+    writer.put("seat_snapshots", "a", {})
+    writer.put("seat_snapshots", "b", {})
+    writer._thread.join(1)
+    assert not writer._thread.is_alive()
+    assert [w.doc_id for w in failed] == ["a", "b"]
+
+    # A later write starts a new thread instead of queueing to the dead one
+    del writer._commit
+    writer.put("seat_snapshots", "c", {})
+    stats = writer.close()
+    assert (stats.queued, stats.written, stats.failed) == (3, 1, 2)
+    assert "seat_snapshots/c" in db.docs
@@ -0,0 +1,107 @@
+import threading
+
+import pytest
+
+from backend.domain.models import Movie, ScrapeResult
+from backend.infrastructure.repositories import FileMovieRepository, SQLiteMovieRepository
+from backend.infrastructure.repositories.sqlite_client import SQLiteDatabase
+from backend.infrastructure.storage import SNAP_SUFFIX, IndexedSnapshotWriter, dump_json
+from tests.conftest import DATE, snapshot_data
+
+PROJECTIONS = [
+    (None, None),
+    (["title", "cities"], None),
+    (["title", "schedules"], None),
+    (None, ["bandung"]),
+    (["schedules"], ["JAKARTA", "BANDUNG"]),
+    (["title", "is_presale"], ["BANDUNG"]),
+    (None, ["MALANG"]),
+]
+
+DATA = snapshot_data(city_stats={"JAKARTA": 2, "BANDUNG": 2})
+
+
+def file_repo(tmp_path, indexed):
+    dump_json(DATA, tmp_path / f"movies_{DATE}.json")
+    if indexed:
+        with IndexedSnapshotWriter(tmp_path / f"movies_{DATE}{SNAP_SUFFIX}") as writer:
+            for movie in DATA["movies"]:
+                writer.add_movie(movie)
+            writer.finish({k: v for k, v in DATA.items() if k != "movies"})
+    return FileMovieRepository(str(tmp_path))
+
+
+def sqlite_repo(tmp_path):
+    repo = SQLiteMovieRepository(SQLiteDatabase(tmp_path / "cineradar.db"))
+    movies = [Movie.from_dict(m) for m in DATA["movies"]]
+    assert repo.save_snapshot(ScrapeResult(movies, DATA["scraped_at"], DATE, cities_scraped=2))
+    return repo
+
+
+@pytest.fixture(params=["file", "file-indexed", "sqlite"])
+def repo(request, tmp_path):
+    if request.param == "sqlite":
+        return sqlite_repo(tmp_path)
+    return file_repo(tmp_path, indexed=request.param == "file-indexed")
+
+
+@pytest.mark.parametrize(("fields", "cities"), PROJECTIONS)
+def test_projection_matches_select(repo, fields, cities):
+    expected = repo.get_snapshot_by_date(DATE).select(fields, cities)
+    projected = repo.get_snapshot_projection(DATE, fields, cities)
+    assert [m.to_dict() for m in projected.movies] == [m.to_dict() for m in expected.movies]
+    assert (projected.date, projected.scraped_at) == (expected.date, expected.scraped_at)
+
+
+def test_missing_date_and_unknown_field(repo):
+    assert repo.get_snapshot_projection("2026-10-20", ["title"]) is None
+    with pytest.raises(ValueError):
+        list(repo.iter_snapshots(fields=["rating"]))
+
+
+class DatedRepository(FileMovieRepository):
+    """Snapshots for a run of dates; records which days were loaded."""
+
+    def __init__(self, dates, gate=None):
+        super().__init__("unused")
+        self.dates = dates
+        self.loaded = []
+        self.gate = gate
+        self.lock = threading.Lock()
+
+    def list_snapshots(self):
+        return list(reversed(self.dates))
+
+    def get_snapshot_projection(self, date, fields=None, cities=None):
+        with self.lock:
+            self.loaded.append(date)
+        if self.gate is not None and date != self.dates[0]:
+            self.gate.wait(5)
+        if date == self.dates[2]:
+            return None  # Unreadable day
+        return ScrapeResult([], f"{date}T06:00:00", date)
+
+
+DATES = [f"2026-10-{day:02d}" for day in range(1, 11)]
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_iter_snapshots_streams_the_range_in_order(prefetch):
+    repo = DatedRepository(DATES)
+    days = [s.date for s in repo.iter_snapshots("2026-10-02", "2026-10-06", prefetch=prefetch)]
+    assert days == ["2026-10-02", "2026-10-04", "2026-10-05", "2026-10-06"]
+    assert sorted(repo.loaded) == DATES[1:6]
+
+
+def test_closing_early_loads_nothing_past_the_prefetched_days():
+    gate = threading.Event()
+    repo = DatedRepository(DATES, gate)
+    snapshots = repo.iter_snapshots(prefetch=2)
+    assert next(snapshots).date == DATES[0]
+
+    # The next two days are loading (held at the gate) when the caller stops
+    threading.Timer(0.2, gate.set).start()
+    snapshots.close()
+    assert set(repo.loaded) <= set(DATES[:3])
+    with pytest.raises(StopIteration):
+        next(snapshots)
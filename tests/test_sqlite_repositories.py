@@ -0,0 +1,111 @@
+import sqlite3
+
+import pytest
+
+from backend.domain.models import Movie, ScrapeResult, Theatre
+from backend.infrastructure.repositories import SQLiteMovieRepository, SQLiteTheatreRepository
+from backend.infrastructure.repositories.sqlite_client import SQLiteDatabase
+from tests.conftest import MOVIES
+
+
+def snapshot(date="2026-10-19", movies=MOVIES):
+    return ScrapeResult(
+        movies=[Movie.from_dict(m) for m in movies],
+        scraped_at=f"{date}T06:00:00",
+        date=date,
+        cities_scraped=2,
+    )
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SQLiteDatabase(tmp_path / "cineradar.db")
+
+
+@pytest.fixture
+def repo(db):
+    repo = SQLiteMovieRepository(db)
+    assert repo.save_snapshot(snapshot("2026-10-18", MOVIES[1:]))
+    assert repo.save_snapshot(snapshot())
+    return repo
+
+
+def dicts(movies):
+    return [m.to_dict() for m in movies]
+
+
+def test_snapshot_roundtrip(repo):
+    stored = repo.get_snapshot_by_date("2026-10-19")
+    assert stored.scraped_at == "2026-10-19T06:00:00"
+    assert stored.cities_scraped == 2
+    # Including m1's empty BANDUNG list and m3 without schedules
+    assert dicts(stored.movies) == dicts(snapshot().movies)
+
+    assert repo.list_snapshots() == ["2026-10-19", "2026-10-18"]
+    assert repo.get_snapshot_by_date("2026-10-20") is None
+
+
+def test_saving_a_date_again_replaces_it(repo):
+    assert repo.save_snapshot(snapshot(movies=MOVIES[:1]))
+    assert [m.id for m in repo.get_snapshot_by_date("2026-10-19").movies] == ["m1"]
+    assert [m.id for m in repo.get_snapshot_by_date("2026-10-18").movies] == ["m2", "m3"]
+
+
+def test_get_movie(repo):
+    assert repo.get_movie("m1").to_dict() == snapshot().movies[0].to_dict()
+    assert repo.get_movie("m1", "2026-10-18") is None
+    assert repo.get_movie("m2", "2026-10-18").is_presale
+
+
+def test_get_movies_in_city(repo):
+    movies = repo.get_movies_in_city("bandung")
+    assert [m.id for m in movies] == ["m1", "m2"]
+    assert movies[0].schedules == {"BANDUNG": []}
+    assert [s.theatre_id for s in movies[1].schedules["BANDUNG"]] == ["t3"]
+
+    assert [m.id for m in repo.get_movies_in_city("JAKARTA")] == ["m1"]
+    assert repo.get_movies_in_city("MALANG") == []
+
+
+def test_find_showtime(repo):
+    found = repo.find_showtime("t1-15:00")
+    assert (found["movie_id"], found["city"], found["showtime"]) == ("m1", "JAKARTA", "15:00")
+    assert found["room_category"] == "2D"
+
+
+def test_database_without_schedule_cities_is_migrated(tmp_path):
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE movies (date TEXT, movie_id TEXT, cities TEXT)")
+    conn.close()
+
+    SQLiteDatabase(path).connection()
+    columns = [row[1] for row in sqlite3.connect(path).execute("PRAGMA table_info(movies)")]
+    assert columns[-1] == "schedule_cities"
+
+
+def test_theatre_upsert_merge_rules(db):
+    repo = SQLiteTheatreRepository(db)
+    assert repo.upsert(Theatre("t1", "OLD NAME", "XXI", "JAKARTA", room_types=["2D"]))
+    assert repo.update_location("t1", -6.2, 106.8, "place-1")
+
+    result = repo.upsert_many(
+        [
+            Theatre("t1", "NEW NAME", "XXI", "JAKARTA", lat=1.0, lng=2.0, room_types=["IMAX"]),
+            Theatre("t1", "LATER ROW", "XXI", "JAKARTA", room_types=["2D", "4DX"]),
+            Theatre("t2", "OTHER", "CGV", "BANDUNG", lat=3.0, lng=4.0, room_types=["2D"]),
+        ]
+    )
+    assert result == {"total": 2, "success": 2, "failed": 0}
+
+    t1 = repo.get_by_id("t1")
+    # First row of a batch wins, room types accumulate, a stored location is kept
+    assert t1.name == "NEW NAME"
+    assert t1.room_types == ["2D", "IMAX", "4DX"]
+    assert (t1.lat, t1.lng, t1.place_id) == (-6.2, 106.8, "place-1")
+
+    t2 = repo.get_by_id("t2")
+    assert (t2.lat, t2.lng) == (3.0, 4.0)
+    assert repo.count() == 2
+    assert [t.theatre_id for t in repo.get_by_city("bandung")] == ["t2"]
+    assert repo.get_without_location() == []
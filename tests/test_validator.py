@@ -0,0 +1,79 @@
+import copy
+import gzip
+import json
+
+from backend.application.use_cases.validate_data import ValidateDataUseCase
+from backend.domain.models import NormalizedSnapshot
+from backend.infrastructure.storage import load_digest, write_digest
+from backend.schemas.validator import validate_snapshot, validator_fingerprint
+from tests.conftest import snapshot_data
+
+SNAPSHOT = snapshot_data(city_stats={"JAKARTA": 2, "BANDUNG": 2})
+
+
+def encode(data):
+    return json.dumps(data).encode()
+
+
+def test_valid_snapshot_report_stats():
+    report = validate_snapshot(encode(SNAPSHOT))
+    assert report.valid, report.errors
+    assert report.date == "2026-10-19"
+    assert (report.movies, report.cities, report.presale_count) == (3, 2, 1)
+    assert (report.movies_with_schedules, report.theatres, report.showtimes) == (2, 3, 4)
+    assert report.merchants == ["CGV", "XXI"]
+    assert report.sampled is None
+
+
+def test_sampled_and_normalized_reports_match_full():
+    full = validate_snapshot(encode(SNAPSHOT))
+
+    sampled = validate_snapshot(encode(SNAPSHOT), sample=1)
+    assert sampled.valid and sampled.sampled == 1
+    assert {**sampled.to_dict(), "sampled": None} == full.to_dict()
+
+    normalized = encode(NormalizedSnapshot.from_snapshot(SNAPSHOT).to_dict())
+    assert validate_snapshot(normalized).to_dict() == full.to_dict()
+
+
+def test_invalid_movie_is_reported_with_its_location():
+    data = copy.deepcopy(SNAPSHOT)
+    data["movies"][0]["schedules"]["JAKARTA"][0]["rooms"][0]["all_showtimes"][1]["time"] = "3pm"
+
+    report = validate_snapshot(encode(data))
+    assert not report.valid
+    assert len(report.errors) == 1
+    assert report.errors[0].startswith("movies → 0 → schedules → JAKARTA → 0 → rooms → 0")
+
+    sampled = validate_snapshot(encode(data), sample=2)
+    assert not sampled.valid
+    assert sampled.errors == report.errors
+
+
+def test_invalid_json():
+    report = validate_snapshot(b'{"movies": [', sample=1)
+    assert not report.valid
+    assert report.errors[0].startswith("Invalid JSON")
+
+
+def test_digest_is_trusted_only_for_the_same_bytes_and_rules(tmp_path):
+    path = tmp_path / "movies_2026-10-19.json"
+    path.write_bytes(encode(SNAPSHOT))
+    report = validate_snapshot(path.read_bytes()).to_dict()
+
+    assert load_digest(path, validator_fingerprint()) is None
+    write_digest(path, report, validator_fingerprint())
+    assert load_digest(path, validator_fingerprint()) == report
+    assert load_digest(path, "other-rules") is None
+
+    path.write_bytes(encode({**SNAPSHOT, "scraped_at": "2026-10-19T07:00:00"}))
+    assert load_digest(path, validator_fingerprint()) is None
+
+
+def test_use_case_reads_compressed_files(tmp_path):
+    path = tmp_path / "movies_2026-10-19.json.gz"
+    path.write_bytes(gzip.compress(encode(SNAPSHOT)))
+
+    result = ValidateDataUseCase(min_movies=2, min_cities=2).validate_file(str(path))
+    assert result.valid, result.errors
+    assert (result.movies, result.cities) == (3, 2)
@@ -54,6 +54,27 @@ async function getMovieData(): Promise<MovieData | null> {
     const firestoreDoc = await response.json();
     const fields = firestoreDoc.fields || {};
 
+    // Chunked snapshots keep movies in chunk documents when they don't fit the manifest
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    let movieValues: any[] = fields.movies?.arrayValue?.values || [];
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    const movieChunks: any[] = fields.movie_chunks?.arrayValue?.values || [];
+    if (movieChunks.length > 0) {
+      const chunks = await Promise.all(
+        movieChunks.map(async c => {
+          const chunkResponse = await fetch(`${url}/chunks/${c.stringValue}`, {
+            next: { revalidate: 300 }
+          });
+          if (!chunkResponse.ok) {
+            throw new Error(`Snapshot chunk ${c.stringValue} fetch failed: ${chunkResponse.status}`);
+          }
+          const chunkDoc = await chunkResponse.json();
+          return chunkDoc.fields?.movies?.arrayValue?.values || [];
+        })
+      );
+      movieValues = chunks.flat();
+    }
+
     // Transform Firestore format to our format
     return {
       scraped_at: fields.scraped_at?.stringValue || '',
@@ -62,7 +83,7 @@ async function getMovieData(): Promise<MovieData | null> {
         total_cities: parseInt(fields.summary?.mapValue?.fields?.total_cities?.integerValue || '0', 10),
         total_movies: parseInt(fields.summary?.mapValue?.fields?.total_movies?.integerValue || '0', 10),
       },
-      movies: parseMoviesArray(fields.movies?.arrayValue?.values || []),
+      movies: parseMoviesArray(movieValues),
       city_stats: parseCityStats(fields.city_stats?.mapValue?.fields || {}),
     };
   } catch (error) {